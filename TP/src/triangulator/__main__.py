@@ -0,0 +1,7 @@
+"""Point d'entrée ``python -m src.triangulator`` (voir le module cli)."""
+
+import sys
+
+from src.triangulator.cli import main
+
+sys.exit(main())
@@ -5,24 +5,182 @@ permettant de calculer la triangulation de Delaunay pour un
 ensemble de points identifié par son ID.
 """
 
+import json
+import mmap
 import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TypeVar
 
-import requests
-from flask import Flask, Response, jsonify
+from flask import Flask, Response, jsonify, request
+from werkzeug.exceptions import MethodNotAllowed, NotFound
 
-from src.triangulator.core import triangulate
+from src.triangulator.cache import content_key
+from src.triangulator.cancellation import CancellationToken
+from src.triangulator.encodings import FORMAT_TRIANGLES, negotiate
+from src.triangulator.errors import ApiError
+from src.triangulator.metrics import (
+    CONTENT_TYPE,
+    PAYLOAD_POINT_SET,
+    PAYLOAD_TRIANGLES,
+    STAGE_DESERIALIZE,
+    STAGE_FETCH,
+    STAGE_SERIALIZE,
+    Metrics,
+)
+from src.triangulator.psm_client import (
+    PointSetManagerClient,
+    PointSetManagerError,
+    PointSetManagerUnavailable,
+    PointSetTooLarge,
+)
 from src.triangulator.serialization import (
-    deserialize_point_set,
+    BATCH_RECORD_ERROR,
+    BATCH_RECORD_TRIANGLES,
+    DEFAULT_CHUNK_SIZE,
+    PointSetDecoder,
+    encode_batch_header,
+    encode_batch_record,
     serialize_triangles,
 )
+from src.triangulator.service import (
+    BASE_HEADER,
+    DEADLINE_HEADER,
+    DEFAULT_CONFIG,
+    batch_ids,
+    build_breaker,
+    build_cache,
+    build_executor,
+    build_meshes,
+    build_metrics,
+    build_scheduler,
+    cache_entry,
+    check_upload_header,
+    check_upload_length,
+    computation_busy,
+    deadline_token,
+    delta_series,
+    invalid_point_set,
+    iter_mapped,
+    method_not_allowed,
+    metrics_gauges,
+    psm_api_error,
+    representation_headers,
+    response_tag,
+    route_not_found,
+    run_triangulation,
+    store_while_streaming,
+    triangulation_chunks,
+)
+from src.triangulator.singleflight import SingleFlight, SingleFlightTimeout
+from src.triangulator.triangles import TriangleArray
+
+T = TypeVar('T')
+
+
+def _error_response(error: ApiError) -> tuple[Response, int]:
+    """Construit la réponse JSON d'une erreur de l'API.
+
+    Args:
+        error: L'erreur à renvoyer.
+
+    Returns:
+        tuple: La réponse JSON et son statut HTTP.
+    """
+    response = jsonify(error.to_dict())
+    response.headers.update(error.headers)
+    return response, error.status
+
+
+def _cached_response(
+    blob: bytes | mmap.mmap,
+    key: str,
+    media_type: str = FORMAT_TRIANGLES,
+    encoding: str | None = None
+) -> Response:
+    """Construit la réponse pour un résultat trouvé dans le cache.
+
+    Args:
+        blob: La triangulation sérialisée.
+        key: L'empreinte du PointSet, utilisée comme ETag.
+        media_type: Le format du blob.
+        encoding: La compression du blob, ou None.
+
+    Returns:
+        Response: La réponse binaire (200).
+    """
+    body = blob if isinstance(blob, bytes) else iter_mapped(blob)
+    headers = representation_headers(media_type, encoding)
+    headers.update({'Content-Length': str(len(blob)), 'X-Cache': 'HIT'})
+    response = Response(body, status=200, headers=headers)
+    response.set_etag(key, weak=encoding is not None)
+    return response
 
 
-def create_app(psm_url: str | None = None) -> Flask:
+def _not_modified(key: str, encoding: str | None = None) -> Response:
+    """Construit une réponse 304 pour un client qui a déjà le résultat.
+
+    Args:
+        key: L'empreinte du PointSet, utilisée comme ETag.
+        encoding: La compression négociée, qui rend l'ETag faible.
+
+    Returns:
+        Response: La réponse vide (304).
+    """
+    response = Response(status=304, headers={'Vary': 'Accept, Accept-Encoding'})
+    response.set_etag(key, weak=encoding is not None)
+    return response
+
+
+def _iter_batch(
+    futures: list[Future],
+    metrics: Metrics | None = None
+) -> Iterator[bytes]:
+    """Émet les enregistrements d'un lot dans l'ordre des identifiants.
+
+    Si le client interrompt la réponse, les éléments pas encore commencés
+    sont annulés.
+
+    Args:
+        futures: Les calculs en cours, un par identifiant; chacun renvoie
+                 une triangulation sérialisée ou lève une ApiError.
+        metrics: Les mesures qui comptent les erreurs des éléments.
+
+    Yields:
+        bytes: L'en-tête du lot puis chaque enregistrement.
+    """
+    try:
+        yield encode_batch_header(len(futures))
+        for future in futures:
+            try:
+                record = encode_batch_record(
+                    BATCH_RECORD_TRIANGLES, future.result()
+                )
+            except ApiError as e:
+                if metrics is not None:
+                    metrics.count_error(e.code)
+                error = dict(e.to_dict(), status=e.status)
+                record = encode_batch_record(
+                    BATCH_RECORD_ERROR, json.dumps(error).encode()
+                )
+            yield record
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def create_app(
+    psm_url: str | None = None,
+    config: dict | None = None
+) -> Flask:
     """Crée et configure l'application Flask.
 
     Args:
         psm_url: URL de base du PointSetManager. Si None, utilise
                  la variable d'environnement PSM_URL ou localhost:5001.
+        config: Paramètres qui remplacent ceux de DEFAULT_CONFIG.
 
     Returns:
         Flask: L'application Flask configurée.
@@ -32,63 +190,461 @@ def create_app(psm_url: str | None = None) -> Flask:
     if psm_url is None:
         psm_url = os.environ.get('PSM_URL', 'http://localhost:5001')
 
+    app.config.from_mapping(DEFAULT_CONFIG)
     app.config['PSM_URL'] = psm_url
+    if config is not None:
+        app.config.update(config)
+
+    cache = build_cache(app.config)
+    app.extensions['triangulator_cache'] = cache
+
+    psm_client = PointSetManagerClient(
+        app.config['PSM_URL'],
+        pool_size=app.config['PSM_POOL_SIZE'],
+        connect_timeout=app.config['PSM_CONNECT_TIMEOUT'],
+        read_timeout=app.config['PSM_READ_TIMEOUT'],
+        retries=app.config['PSM_RETRIES'],
+        backoff=app.config['PSM_RETRY_BACKOFF'],
+        breaker=build_breaker(app.config),
+    )
+    app.extensions['triangulator_psm'] = psm_client
+
+    flights = SingleFlight(max_wait=app.config['SINGLEFLIGHT_MAX_WAIT'])
+    app.extensions['triangulator_flights'] = flights
+
+    executor = build_executor(app.config)
+    app.extensions['triangulator_executor'] = executor
+
+    meshes = build_meshes(app.config)
+    app.extensions['triangulator_meshes'] = meshes
+
+    metrics = build_metrics(app.config)
+    app.extensions['triangulator_metrics'] = metrics
+
+    scheduler = build_scheduler(app.config)
+    app.extensions['triangulator_scheduler'] = scheduler
+
+    batch_pool = ThreadPoolExecutor(
+        max_workers=app.config['BATCH_CONCURRENCY'],
+        thread_name_prefix='triangulator-batch',
+    )
+    app.extensions['triangulator_batch_pool'] = batch_pool
+
+    def fetch(
+        point_set_id: str
+    ) -> tuple[str, bytearray, list[tuple[float, float]]]:
+        """Récupère un PointSet auprès du PointSetManager.
+
+        La réponse est lue en flux: un PointSet qui annonce plus de
+        MAX_POINTS points est refusé avant la réception des points, et les
+        points sont décodés au fil des morceaux reçus. La durée de ce
+        décodage est comptée dans l'étape de désérialisation.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+
+        Returns:
+            tuple: L'empreinte du contenu, le PointSet binaire et ses
+                   points.
+
+        Raises:
+            ApiError: Si le PointSet ne peut pas être récupéré, s'il est
+                      trop grand ou incomplet.
+        """
+        start = time.perf_counter()
+        try:
+            decoder = psm_client.fetch_point_set(
+                point_set_id, app.config['MAX_POINTS']
+            )
+        except (
+            PointSetManagerError, PointSetManagerUnavailable, PointSetTooLarge
+        ) as e:
+            raise psm_api_error(e, point_set_id) from None
+        except ValueError as e:
+            raise invalid_point_set(e) from None
+        metrics.observe_stage(STAGE_FETCH, time.perf_counter() - start)
+        metrics.observe_stage(STAGE_DESERIALIZE, decoder.decode_seconds)
+        payload = decoder.payload()
+        metrics.observe_payload(PAYLOAD_POINT_SET, len(payload))
+
+        key = content_key(payload)
+        if cache is not None:
+            cache.bind(point_set_id, key)
+        return key, payload, decoder.point_set()
+
+    def compute(
+        key: str,
+        payload: bytes,
+        series: tuple[str, str | None] | None,
+        point_set: list[tuple[float, float]] | None,
+        cancel: CancellationToken
+    ) -> tuple[list[tuple[float, float]], TriangleArray, str]:
+        """Triangule un PointSet binaire, en regroupant les calculs identiques.
+
+        Le calcul partagé tourne sous le jeton de la requête qui l'a lancé.
+        S'il est interrompu par l'échéance de celle-ci, les requêtes
+        regroupées dont l'échéance n'est pas passée le relancent.
+
+        Args:
+            key: L'empreinte du PointSet.
+            payload: Le PointSet au format binaire.
+            series: L'empreinte du PointSet et celle de sa version de
+                    base, s'il appartient à une série (voir delta_series).
+            point_set: Les points déjà décodés, le cas échéant.
+            cancel: Le jeton d'annulation de la requête.
+
+        Returns:
+            tuple: Les points, les triangles et le chemin suivi.
+
+        Raises:
+            ApiError: Si les données sont invalides, si la triangulation
+                      échoue, dépasse son délai ou son échéance, ou si
+                      l'exécuteur ou l'ordonnanceur est saturé.
+        """
+        while True:
+            try:
+                return coalesce(('triangulate', key), lambda: run_triangulation(
+                    executor, payload, app.config['TRIANGULATION_TIMEOUT'],
+                    meshes, series, metrics, point_set, scheduler, cancel
+                ))
+            except ApiError as e:
+                if e.code != 'DEADLINE_EXCEEDED' or cancel.cancelled:
+                    raise
+
+    def error_response(error: ApiError) -> tuple[Response, int]:
+        """Construit la réponse JSON d'une erreur et la compte.
+
+        Args:
+            error: L'erreur à renvoyer.
+
+        Returns:
+            tuple: La réponse JSON et son statut HTTP.
+        """
+        metrics.count_error(error.code)
+        return _error_response(error)
+
+    def request_token() -> CancellationToken:
+        """Crée le jeton d'annulation de la requête en cours.
+
+        Returns:
+            CancellationToken: Le jeton, qui expire à l'échéance fixée par
+                               l'en-tête X-Request-Timeout, ou par
+                               REQUEST_TIMEOUT à défaut.
+
+        Raises:
+            ApiError: Si l'en-tête est invalide.
+        """
+        return deadline_token(
+            request.headers.get(DEADLINE_HEADER), app.config['REQUEST_TIMEOUT']
+        )
+
+    def coalesce(key: tuple, fn: Callable[[], T]) -> T:
+        """Exécute un calcul en le regroupant avec ses doublons concurrents.
+
+        Args:
+            key: Clé identifiant le calcul.
+            fn: Le calcul à exécuter.
+
+        Returns:
+            Le résultat du calcul.
+
+        Raises:
+            ApiError: L'erreur du calcul, ou SERVICE_BUSY si l'attente du
+                      calcul en cours dépasse le délai maximal.
+        """
+        try:
+            return flights.do(key, fn)
+        except SingleFlightTimeout:
+            raise computation_busy() from None
+
+    def triangulation_blob(
+        point_set_id: str,
+        cancel: CancellationToken
+    ) -> bytes:
+        """Retourne la triangulation sérialisée d'un PointSet.
+
+        Suit le même chemin que l'endpoint unitaire (cache, regroupement
+        des calculs identiques) mais renvoie le résultat complet.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            cancel: Le jeton d'annulation de la requête par lot.
+
+        Returns:
+            bytes: La triangulation au format binaire.
+
+        Raises:
+            ApiError: Si le PointSet ne peut pas être récupéré ou triangulé.
+        """
+        if cache is not None and app.config['CACHE_ID_MAP']:
+            key = cache.key_for(point_set_id)
+            if key is not None:
+                blob = cache.get(key)
+                if blob is not None:
+                    return bytes(blob)
+
+        key, payload, points = coalesce(('fetch', point_set_id),
+                                        lambda: fetch(point_set_id))
+        if cache is not None:
+            blob = cache.get(key)
+            if blob is not None:
+                return bytes(blob)
+
+        point_set, triangles, _ = compute(key, payload, None, points, cancel)
+        start = time.perf_counter()
+        blob = serialize_triangles(point_set, triangles)
+        metrics.observe_stage(STAGE_SERIALIZE, time.perf_counter() - start)
+        metrics.observe_payload(PAYLOAD_TRIANGLES, len(blob))
+        if cache is not None:
+            cache.put(key, blob)
+        return blob
+
+    def triangulation_response(
+        key: str,
+        payload: bytes,
+        cancel: CancellationToken,
+        series: tuple[str, str | None] | None = None,
+        points: list[tuple[float, float]] | None = None
+    ) -> Response | tuple:
+        """Construit la réponse de triangulation d'un PointSet binaire.
+
+        La réponse binaire est envoyée par morceaux: sa taille est connue
+        d'avance grâce aux nombres de points et de triangles, ce qui permet
+        de fixer Content-Length sans construire le résultat en mémoire.
+        Avec le paramètre ``indexMap=true``, la table des doublons suit
+        les triangles (réponse étendue). Les en-têtes Accept et
+        Accept-Encoding choisissent le format et la compression (voir
+        encodings). L'en-tête X-Triangulation-Path d'un résultat calculé
+        indique s'il l'a été par différence avec le maillage de la version
+        de base du PointSet ('delta') ou entièrement ('full').
+
+        Args:
+            key: L'empreinte du PointSet.
+            payload: Le PointSet au format binaire.
+            cancel: Le jeton d'annulation de la requête.
+            series: L'empreinte du PointSet et celle de sa version de
+                    base, s'il appartient à une série.
+            points: Les points déjà décodés, le cas échéant.
+
+        Returns:
+            Response: La triangulation au format binaire (200), un 304 si
+                      le client a déjà le résultat, ou une erreur JSON.
+        """
+        index_map = request.args.get('indexMap') == 'true'
+        media_type, encoding = negotiate(
+            request.headers.get('Accept'), request.headers.get('Accept-Encoding')
+        )
+        tag = response_tag(key, index_map, media_type)
+        if request.if_none_match.contains_weak(tag):
+            return _not_modified(tag, encoding)
+
+        entry = cache_entry(tag, encoding)
+        if cache is not None:
+            blob = cache.get(entry)
+            if blob is not None:
+                return _cached_response(blob, tag, media_type, encoding)
+
+        try:
+            point_set, triangles, path = compute(
+                key, payload, series, points, cancel
+            )
+        except ApiError as e:
+            return error_response(e)
+
+        size, chunks = triangulation_chunks(
+            point_set, triangles, index_map, media_type, encoding, metrics
+        )
+        if cache is not None and size <= cache.max_bytes:
+            chunks = store_while_streaming(chunks, cache, entry)
+
+        headers = representation_headers(media_type, encoding)
+        headers.update({
+            'Content-Length': str(size),
+            'X-Cache': 'MISS',
+            'X-Triangulation-Path': path,
+        })
+        response = Response(chunks, status=200, headers=headers)
+        response.set_etag(tag, weak=encoding is not None)
+        return response
+
+    def read_upload() -> PointSetDecoder:
+        """Lit un PointSet binaire envoyé dans le corps de la requête.
+
+        Le nombre de points annoncé est confronté à MAX_POINTS et à
+        Content-Length avant que le décodeur ne dimensionne son tampon et
+        ne lise le reste du corps, dont les points sont ensuite décodés au
+        fil de l'eau.
+
+        Returns:
+            PointSetDecoder: Le décodeur complet du PointSet.
+
+        Raises:
+            ApiError: Si la taille est absente, trop grande ou incohérente
+                      avec le nombre de points, ou si le corps est incomplet.
+        """
+        length = check_upload_length(
+            request.content_length, app.config['UPLOAD_MAX_BYTES']
+        )
+
+        stream = request.stream
+        decoder = PointSetDecoder(decode_points=True, check_header=partial(
+            check_upload_header, length=length,
+            max_points=app.config['MAX_POINTS']
+        ))
+        while decoder.expected_size is None:
+            chunk = stream.read(4)
+            if not chunk:
+                raise ApiError(
+                    'INVALID_DATA',
+                    'Données insuffisantes pour le compteur de points', 400
+                )
+            decoder.feed(chunk)
+
+        while not decoder.done:
+            chunk = stream.read(DEFAULT_CHUNK_SIZE)
+            if not chunk:
+                raise ApiError(
+                    'INVALID_DATA', 'Corps de la requête incomplet', 400
+                )
+            decoder.feed(chunk)
+        return decoder
+
+    @app.route('/triangulation', methods=['POST'])
+    def upload_endpoint() -> Response | tuple:
+        """Calcule la triangulation d'un PointSet envoyé par le client.
+
+        Le corps est un PointSet binaire: le PointSetManager n'est pas
+        sollicité. Le résultat partage le cache et l'ETag de l'endpoint
+        par identifiant. Avec l'en-tête X-Triangulation-Base, le PointSet
+        est triangulé par différence avec la version qu'il désigne.
+
+        Returns:
+            Response: La triangulation au format binaire (200), un 304 si
+                      le client a déjà le résultat, ou une erreur JSON.
+        """
+        try:
+            cancel = request_token()
+            decoder = read_upload()
+        except ApiError as e:
+            return error_response(e)
+        payload = decoder.payload()
+        metrics.observe_stage(STAGE_DESERIALIZE, decoder.decode_seconds)
+        metrics.observe_payload(PAYLOAD_POINT_SET, len(payload))
+        key = content_key(payload)
+        return triangulation_response(
+            key, payload, cancel,
+            delta_series(key, request.headers.get(BASE_HEADER)),
+            decoder.point_set()
+        )
+
+    @app.route('/triangulation/batch', methods=['POST'])
+    def batch_endpoint() -> Response | tuple:
+        """Calcule les triangulations de plusieurs PointSets.
+
+        Le corps JSON contient la liste des identifiants:
+        ``{"pointSetIds": ["...", "..."]}``. Les PointSets sont récupérés
+        et triangulés en parallèle par un pool borné, et la réponse émet un
+        enregistrement par identifiant, dans l'ordre de la requête: une
+        structure Triangles, ou une erreur JSON qui n'interrompt pas le
+        reste du lot (voir encode_batch_header).
+
+        Returns:
+            Response: Les enregistrements au format binaire (200), ou une
+                      erreur JSON si la requête elle-même est invalide.
+        """
+        try:
+            ids = batch_ids(
+                request.get_json(silent=True), app.config['BATCH_MAX_ITEMS']
+            )
+            cancel = request_token()
+        except ApiError as e:
+            return error_response(e)
+        futures = [
+            batch_pool.submit(triangulation_blob, i, cancel) for i in ids
+        ]
+        return Response(
+            _iter_batch(futures, metrics),
+            status=200,
+            mimetype='application/octet-stream',
+        )
 
     @app.route('/triangulation/<point_set_id>', methods=['GET'])
     def triangulate_endpoint(point_set_id: str) -> Response | tuple:
         """Calcule la triangulation pour un PointSet donné.
 
+        Les résultats sont mis en cache selon l'empreinte du PointSet, qui
+        sert aussi d'ETag: un client qui renvoie cette valeur dans
+        If-None-Match reçoit un 304 sans aucun calcul.
+
         Args:
             point_set_id: L'identifiant UUID du PointSet à trianguler.
 
         Returns:
-            Response: La triangulation au format binaire (200),
-                      ou une erreur JSON avec le code approprié.
+            Response: La triangulation au format binaire (200), un 304 si
+                      le client a déjà le résultat, ou une erreur JSON avec
+                      le code approprié.
         """
-        psm_base_url = app.config['PSM_URL']
+        if cache is not None and app.config['CACHE_ID_MAP']:
+            key = cache.key_for(point_set_id)
+            if key is not None:
+                media_type, encoding = negotiate(
+                    request.headers.get('Accept'),
+                    request.headers.get('Accept-Encoding')
+                )
+                tag = response_tag(
+                    key, request.args.get('indexMap') == 'true', media_type
+                )
+                if request.if_none_match.contains_weak(tag):
+                    return _not_modified(tag, encoding)
+                blob = cache.get(cache_entry(tag, encoding))
+                if blob is not None:
+                    return _cached_response(blob, tag, media_type, encoding)
 
         try:
-            psm_response = requests.get(
-                f"{psm_base_url}/pointset/{point_set_id}",
-                timeout=30
-            )
-        except requests.exceptions.RequestException:
-            return jsonify({
-                'code': 'PSM_UNAVAILABLE',
-                'message': 'Le PointSetManager est indisponible.'
-            }), 503
-
-        if psm_response.status_code == 404:
-            return jsonify({
-                'code': 'NOT_FOUND',
-                'message': f'PointSet {point_set_id} non trouvé.'
-            }), 404
-
-        if psm_response.status_code != 200:
-            return jsonify({
-                'code': 'PSM_ERROR',
-                'message': 'Erreur du PointSetManager.'
-            }), 502
+            cancel = request_token()
+            key, payload, points = coalesce(('fetch', point_set_id),
+                                            lambda: fetch(point_set_id))
+        except ApiError as e:
+            return error_response(e)
 
-        try:
-            point_set = deserialize_point_set(psm_response.content)
-        except ValueError as e:
-            return jsonify({
-                'code': 'INVALID_DATA',
-                'message': f'Données PointSet invalides: {e}'
-            }), 500
+        return triangulation_response(key, payload, cancel, points=points)
 
-        try:
-            triangles = triangulate(point_set)
-        except Exception as e:
-            return jsonify({
-                'code': 'TRIANGULATION_FAILED',
-                'message': f'Échec de la triangulation: {e}'
-            }), 500
+    @app.route('/metrics', methods=['GET'])
+    def metrics_endpoint() -> Response:
+        """Publie les mesures du service au format texte de Prometheus.
+
+        Returns:
+            Response: Les histogrammes de durée par étape, d'attente par
+                      voie et de taille, les erreurs par code, les
+                      compteurs internes de triangulate s'ils sont
+                      activés, et l'occupation du cache, du stock de
+                      maillages et des voies de l'ordonnanceur.
+        """
+        return Response(
+            metrics.render(metrics_gauges(cache, meshes, scheduler, flights)),
+            status=200, content_type=CONTENT_TYPE,
+        )
 
-        result = serialize_triangles(point_set, triangles)
+    @app.errorhandler(404)
+    def not_found(_: NotFound) -> tuple[Response, int]:
+        """Répond en JSON à une URL qui ne correspond à aucune route.
 
-        return Response(result, status=200, mimetype='application/octet-stream')
+        Returns:
+            tuple: L'erreur JSON NOT_FOUND (404).
+        """
+        return error_response(route_not_found())
+
+    @app.errorhandler(405)
+    def method_not_allowed_handler(e: MethodNotAllowed) -> tuple[Response, int]:
+        """Répond en JSON à une méthode HTTP non acceptée par la route.
+
+        Args:
+            e: L'erreur de routage, avec les méthodes acceptées.
+
+        Returns:
+            tuple: L'erreur JSON METHOD_NOT_ALLOWED (405), avec Allow.
+        """
+        return error_response(method_not_allowed(sorted(e.valid_methods or [])))
 
     return app
 
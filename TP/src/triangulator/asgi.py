@@ -0,0 +1,898 @@
+"""Application ASGI (asyncio) du micro-service Triangulator.
+
+Alternative à l'application Flask pour les fortes concurrences: une
+requête qui attend le PointSetManager n'occupe aucun thread, les appels
+partagent le pool de connexions d'un client httpx asynchrone, et seuls les
+calculs sont confiés à des threads (puis à l'exécuteur configuré). Les
+routes, la configuration (DEFAULT_CONFIG), le cache et les erreurs JSON
+sont ceux de l'application Flask.
+
+Exemple de lancement avec uvicorn::
+
+    uvicorn --factory src.triangulator.asgi:create_asgi_app --port 5002
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from functools import partial
+from typing import Any
+from urllib.parse import parse_qs
+
+from werkzeug.http import parse_etags, quote_etag
+
+from src.triangulator.async_psm_client import AsyncPointSetManagerClient
+from src.triangulator.cache import content_key
+from src.triangulator.cancellation import CancellationToken, Cancelled
+from src.triangulator.encodings import FORMAT_TRIANGLES, negotiate
+from src.triangulator.errors import ApiError
+from src.triangulator.metrics import (
+    CONTENT_TYPE,
+    PAYLOAD_POINT_SET,
+    PAYLOAD_TRIANGLES,
+    STAGE_DESERIALIZE,
+    STAGE_FETCH,
+    STAGE_SERIALIZE,
+)
+from src.triangulator.psm_client import (
+    PointSetManagerError,
+    PointSetManagerUnavailable,
+    PointSetTooLarge,
+)
+from src.triangulator.scheduler import SchedulerSaturated
+from src.triangulator.serialization import (
+    BATCH_RECORD_ERROR,
+    BATCH_RECORD_TRIANGLES,
+    PointSetDecoder,
+    encode_batch_header,
+    encode_batch_record,
+    serialize_triangles,
+)
+from src.triangulator.service import (
+    BASE_HEADER,
+    DEADLINE_HEADER,
+    DEFAULT_CONFIG,
+    batch_ids,
+    build_breaker,
+    build_cache,
+    build_executor,
+    build_meshes,
+    build_metrics,
+    build_scheduler,
+    cache_entry,
+    check_upload_header,
+    check_upload_length,
+    computation_busy,
+    deadline_exceeded,
+    deadline_token,
+    delta_series,
+    invalid_point_set,
+    iter_mapped,
+    method_not_allowed,
+    metrics_gauges,
+    psm_api_error,
+    representation_headers,
+    response_tag,
+    route_not_found,
+    run_triangulation,
+    scheduler_busy,
+    store_while_streaming,
+    triangulation_chunks,
+)
+from src.triangulator.singleflight import AsyncSingleFlight, SingleFlightTimeout
+from src.triangulator.triangles import TriangleArray
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class _Response:
+    """Réponse HTTP à émettre: statut, en-têtes et corps."""
+
+    __slots__ = ('status', 'headers', 'body')
+
+    def __init__(
+        self,
+        status: int,
+        headers: dict[str, str] | None = None,
+        body: bytes | Iterable[bytes] | AsyncIterator[bytes] = b''
+    ) -> None:
+        """Initialise la réponse.
+
+        Args:
+            status: Statut HTTP.
+            headers: En-têtes HTTP.
+            body: Corps complet, ou morceaux (synchrones ou asynchrones).
+        """
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+
+    async def send(self, send: Send, head: bool = False) -> None:
+        """Émet la réponse.
+
+        Les morceaux d'un corps synchrone (sérialisation, lecture d'un blob
+        projeté) sont produits hors de la boucle d'événements.
+
+        Args:
+            send: Le canal d'émission ASGI.
+            head: Si True (requête HEAD), seuls le statut et les en-têtes
+                  sont émis, comme avec Flask.
+        """
+        await send({
+            'type': 'http.response.start',
+            'status': self.status,
+            'headers': [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in self.headers.items()
+            ],
+        })
+        body = self.body
+        if head:
+            if hasattr(body, 'aclose'):
+                await body.aclose()
+            elif hasattr(body, 'close'):
+                body.close()
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+        if isinstance(body, (bytes, bytearray)):
+            await send({'type': 'http.response.body', 'body': bytes(body)})
+            return
+        if hasattr(body, '__aiter__'):
+            async for chunk in body:
+                await send({'type': 'http.response.body', 'body': chunk,
+                            'more_body': True})
+        else:
+            loop = asyncio.get_running_loop()
+            chunks = iter(body)
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(None, next, chunks, None)
+                    if chunk is None:
+                        break
+                    await send({'type': 'http.response.body',
+                                'body': bytes(chunk), 'more_body': True})
+            finally:
+                if hasattr(chunks, 'close'):
+                    chunks.close()
+        await send({'type': 'http.response.body', 'body': b''})
+
+
+def _error_response(error: ApiError) -> _Response:
+    """Construit la réponse JSON d'une erreur, comme le fait Flask.
+
+    Args:
+        error: L'erreur à renvoyer.
+
+    Returns:
+        _Response: La réponse JSON.
+    """
+    body = json.dumps(error.to_dict(), sort_keys=True, separators=(',', ':'))
+    body = (body + '\n').encode()
+    headers = {'Content-Type': 'application/json',
+               'Content-Length': str(len(body))}
+    headers.update(error.headers)
+    return _Response(error.status, headers, body)
+
+
+def _binary_response(
+    body: bytes | Iterable[bytes],
+    size: int,
+    key: str,
+    cache_status: str,
+    path: str | None = None,
+    media_type: str = FORMAT_TRIANGLES,
+    encoding: str | None = None
+) -> _Response:
+    """Construit la réponse binaire d'une triangulation.
+
+    Args:
+        body: La triangulation sérialisée, complète ou en morceaux.
+        size: Sa taille en bytes.
+        key: L'empreinte du PointSet, utilisée comme ETag.
+        cache_status: Valeur de l'en-tête X-Cache ('HIT' ou 'MISS').
+        path: Valeur de l'en-tête X-Triangulation-Path d'un résultat
+              calculé ('delta' ou 'full').
+        media_type: Le format de la réponse.
+        encoding: Sa compression, ou None.
+
+    Returns:
+        _Response: La réponse binaire (200).
+    """
+    headers = representation_headers(media_type, encoding)
+    headers.update({
+        'Content-Length': str(size),
+        'ETag': quote_etag(key, weak=encoding is not None),
+        'X-Cache': cache_status,
+    })
+    if path is not None:
+        headers['X-Triangulation-Path'] = path
+    return _Response(200, headers, body)
+
+
+def _not_modified(key: str, encoding: str | None = None) -> _Response:
+    """Construit une réponse 304.
+
+    Args:
+        key: L'empreinte du PointSet, utilisée comme ETag.
+        encoding: La compression négociée, qui rend l'ETag faible.
+
+    Returns:
+        _Response: La réponse vide (304).
+    """
+    return _Response(304, {
+        'ETag': quote_etag(key, weak=encoding is not None),
+        'Vary': 'Accept, Accept-Encoding',
+    })
+
+
+def _headers(scope: Scope) -> dict[str, str]:
+    """Retourne les en-têtes d'une requête, noms en minuscules.
+
+    Args:
+        scope: Le scope ASGI de la requête.
+
+    Returns:
+        dict: Les en-têtes.
+    """
+    return {
+        name.decode('latin-1').lower(): value.decode('latin-1')
+        for name, value in scope['headers']
+    }
+
+
+async def _watch_disconnect(receive: Receive, cancel: CancellationToken) -> None:
+    """Annule un jeton quand le client se déconnecte.
+
+    À lancer une fois le corps de la requête lu: les messages suivants du
+    canal de réception ne signalent plus que la déconnexion.
+
+    Args:
+        receive: Le canal de réception ASGI.
+        cancel: Le jeton de la requête.
+    """
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+    cancel.cancel()
+
+
+class TriangulatorASGI:
+    """Application ASGI du Triangulator."""
+
+    def __init__(
+        self,
+        psm_url: str | None = None,
+        config: dict | None = None
+    ) -> None:
+        """Crée les composants de l'application.
+
+        Args:
+            psm_url: URL de base du PointSetManager. Si None, utilise
+                     la variable d'environnement PSM_URL ou localhost:5001.
+            config: Paramètres qui remplacent ceux de DEFAULT_CONFIG.
+        """
+        if psm_url is None:
+            psm_url = os.environ.get('PSM_URL', 'http://localhost:5001')
+
+        self.config = dict(DEFAULT_CONFIG, PSM_URL=psm_url)
+        if config is not None:
+            self.config.update(config)
+
+        self.cache = build_cache(self.config)
+        self.psm_client = AsyncPointSetManagerClient(
+            self.config['PSM_URL'],
+            pool_size=self.config['PSM_POOL_SIZE'],
+            connect_timeout=self.config['PSM_CONNECT_TIMEOUT'],
+            read_timeout=self.config['PSM_READ_TIMEOUT'],
+            retries=self.config['PSM_RETRIES'],
+            backoff=self.config['PSM_RETRY_BACKOFF'],
+            breaker=build_breaker(self.config),
+        )
+        self.flights = AsyncSingleFlight(self.config['SINGLEFLIGHT_MAX_WAIT'])
+        self.executor = build_executor(self.config)
+        self.meshes = build_meshes(self.config)
+        self.metrics = build_metrics(self.config)
+        self.scheduler = build_scheduler(self.config)
+        self._batch_slots = asyncio.Semaphore(self.config['BATCH_CONCURRENCY'])
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Point d'entrée ASGI.
+
+        Args:
+            scope: Le scope ASGI.
+            receive: Le canal de réception ASGI.
+            send: Le canal d'émission ASGI.
+        """
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        response = await self._dispatch(scope, receive)
+        await response.send(send, head=scope['method'] == 'HEAD')
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """Gère le démarrage et l'arrêt du serveur.
+
+        Args:
+            receive: Le canal de réception ASGI.
+            send: Le canal d'émission ASGI.
+        """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.aclose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def aclose(self) -> None:
+        """Libère le pool de connexions et l'exécuteur."""
+        await self.psm_client.close()
+        self.executor.close()
+
+    async def _dispatch(self, scope: Scope, receive: Receive) -> _Response:
+        """Aiguille une requête vers son endpoint.
+
+        Args:
+            scope: Le scope ASGI de la requête.
+            receive: Le canal de réception ASGI.
+
+        Returns:
+            _Response: La réponse à émettre.
+        """
+        method = scope['method']
+        path = scope['path']
+        headers = _headers(scope)
+        query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+        index_map = query.get('indexMap', [None])[-1] == 'true'
+
+        prefix = '/triangulation/'
+        point_set_id = path[len(prefix):]
+        allowed = set()
+        if path in ('/triangulation', '/triangulation/batch'):
+            allowed |= {'OPTIONS', 'POST'}
+        # '/triangulation/batch' désigne aussi, en lecture, le PointSet 'batch'.
+        if path == '/metrics' or (
+            path.startswith(prefix) and point_set_id and '/' not in point_set_id
+        ):
+            allowed |= {'GET', 'HEAD', 'OPTIONS'}
+        if not allowed:
+            return self._error(route_not_found())
+        # Comme Flask, OPTIONS est servi d'office avec les méthodes admises.
+        if method == 'OPTIONS':
+            return _Response(200, {'Allow': ', '.join(sorted(allowed))})
+        if method not in allowed:
+            return self._error(method_not_allowed(sorted(allowed)))
+
+        if path == '/triangulation':
+            return await self._upload(headers, index_map, receive)
+        if path == '/triangulation/batch' and method == 'POST':
+            return await self._batch(headers, receive)
+        if path == '/metrics':
+            return self._metrics()
+        return await self._get(point_set_id, headers, index_map, receive)
+
+    def _error(self, error: ApiError) -> _Response:
+        """Construit la réponse JSON d'une erreur et la compte.
+
+        Args:
+            error: L'erreur à renvoyer.
+
+        Returns:
+            _Response: La réponse JSON.
+        """
+        self.metrics.count_error(error.code)
+        return _error_response(error)
+
+    def _token(self, headers: dict[str, str]) -> CancellationToken:
+        """Crée le jeton d'annulation d'une requête.
+
+        Args:
+            headers: Les en-têtes de la requête.
+
+        Returns:
+            CancellationToken: Le jeton, qui expire à l'échéance fixée par
+                               l'en-tête X-Request-Timeout, ou par
+                               REQUEST_TIMEOUT à défaut.
+
+        Raises:
+            ApiError: Si l'en-tête est invalide.
+        """
+        return deadline_token(
+            headers.get(DEADLINE_HEADER.lower()), self.config['REQUEST_TIMEOUT']
+        )
+
+    def _metrics(self) -> _Response:
+        """Publie les mesures du service au format texte de Prometheus.
+
+        Returns:
+            _Response: Les mesures (200).
+        """
+        gauges = metrics_gauges(self.cache, self.meshes, self.scheduler, self.flights)
+        body = self.metrics.render(gauges).encode()
+        return _Response(200, {'Content-Type': CONTENT_TYPE,
+                               'Content-Length': str(len(body))}, body)
+
+    async def _coalesce(
+        self,
+        key: tuple,
+        fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Exécute un calcul en le regroupant avec ses doublons concurrents.
+
+        Args:
+            key: Clé identifiant le calcul.
+            fn: Fonction qui renvoie la coroutine du calcul.
+
+        Returns:
+            Le résultat du calcul.
+
+        Raises:
+            ApiError: L'erreur du calcul, ou SERVICE_BUSY si l'attente du
+                      calcul en cours dépasse le délai maximal.
+        """
+        try:
+            return await self.flights.do(key, fn)
+        except SingleFlightTimeout:
+            raise computation_busy() from None
+
+    async def _fetch(
+        self,
+        point_set_id: str
+    ) -> tuple[str, bytearray, list[tuple[float, float]]]:
+        """Récupère un PointSet auprès du PointSetManager.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+
+        Returns:
+            tuple: L'empreinte du contenu, le PointSet binaire et ses
+                   points, décodés pendant la réception.
+
+        Raises:
+            ApiError: Si le PointSet ne peut pas être récupéré, s'il est
+                      trop grand ou incomplet.
+        """
+        start = time.perf_counter()
+        try:
+            decoder = await self.psm_client.fetch_point_set(
+                point_set_id, self.config['MAX_POINTS']
+            )
+        except (
+            PointSetManagerError, PointSetManagerUnavailable, PointSetTooLarge
+        ) as e:
+            raise psm_api_error(e, point_set_id) from None
+        except ValueError as e:
+            raise invalid_point_set(e) from None
+        self.metrics.observe_stage(STAGE_FETCH, time.perf_counter() - start)
+        self.metrics.observe_stage(STAGE_DESERIALIZE, decoder.decode_seconds)
+        payload = decoder.payload()
+        self.metrics.observe_payload(PAYLOAD_POINT_SET, len(payload))
+
+        key = content_key(payload)
+        if self.cache is not None:
+            self.cache.bind(point_set_id, key)
+        return key, payload, decoder.point_set()
+
+    async def _compute(
+        self,
+        payload: bytes,
+        series: tuple[str, str | None] | None,
+        point_set: list[tuple[float, float]],
+        cancel: CancellationToken
+    ) -> tuple[list[tuple[float, float]], TriangleArray, str]:
+        """Triangule un PointSet binaire hors de la boucle d'événements.
+
+        Le tour du calcul dans sa voie de l'ordonnanceur est attendu dans
+        la boucle: un calcul en attente n'occupe aucun thread.
+
+        Args:
+            payload: Le PointSet au format binaire.
+            series: L'empreinte du PointSet et celle de sa version de
+                    base, s'il appartient à une série (voir delta_series).
+            point_set: Les points, décodés pendant la réception.
+            cancel: Le jeton d'annulation de la requête.
+
+        Returns:
+            tuple: Les points, les triangles et le chemin suivi.
+
+        Raises:
+            ApiError: Si la triangulation échoue ou dépasse son échéance, ou
+                      si l'exécuteur ou l'ordonnanceur est saturé.
+        """
+        try:
+            admission = await self.scheduler.acquire_async(
+                len(point_set), cancel
+            )
+        except SchedulerSaturated as e:
+            raise scheduler_busy(e) from None
+        except Cancelled:
+            raise deadline_exceeded() from None
+        self.metrics.observe_queue_wait(admission.lane.name, admission.wait)
+        # La place n'est rendue qu'à la fin du calcul, même si la requête
+        # est abandonnée entre-temps: le thread s'arrête au prochain
+        # contrôle du jeton.
+        job = asyncio.get_running_loop().run_in_executor(
+            None, run_triangulation, self.executor, payload,
+            self.config['TRIANGULATION_TIMEOUT'], self.meshes, series,
+            self.metrics, point_set, None, cancel
+        )
+        job.add_done_callback(lambda _: self.scheduler.release(admission))
+        return await asyncio.shield(job)
+
+    async def _compute_shared(
+        self,
+        key: str,
+        payload: bytes,
+        series: tuple[str, str | None] | None,
+        point_set: list[tuple[float, float]],
+        cancel: CancellationToken
+    ) -> tuple[list[tuple[float, float]], TriangleArray, str]:
+        """Triangule un PointSet binaire en regroupant les calculs identiques.
+
+        Le calcul partagé tourne sous le jeton de la requête qui l'a lancé.
+        S'il est interrompu par l'échéance de celle-ci, les requêtes
+        regroupées dont l'échéance n'est pas passée le relancent.
+
+        Args:
+            key: L'empreinte du PointSet.
+            payload: Le PointSet au format binaire.
+            series: L'empreinte du PointSet et celle de sa version de
+                    base, s'il appartient à une série (voir delta_series).
+            point_set: Les points, décodés pendant la réception.
+            cancel: Le jeton d'annulation de la requête.
+
+        Returns:
+            tuple: Les points, les triangles et le chemin suivi.
+
+        Raises:
+            ApiError: Voir _compute.
+        """
+        while True:
+            try:
+                return await self._coalesce(
+                    ('triangulate', key),
+                    lambda: self._compute(payload, series, point_set, cancel)
+                )
+            except ApiError as e:
+                if e.code != 'DEADLINE_EXCEEDED' or cancel.cancelled:
+                    raise
+
+    def _cached(
+        self,
+        key: str,
+        media_type: str = FORMAT_TRIANGLES,
+        encoding: str | None = None
+    ) -> _Response | None:
+        """Retourne la réponse d'un résultat en cache, s'il existe.
+
+        Args:
+            key: L'ETag de la réponse.
+            media_type: Son format.
+            encoding: Sa compression, ou None.
+
+        Returns:
+            _Response | None: La réponse (200), ou None si absent.
+        """
+        if self.cache is None:
+            return None
+        blob = self.cache.get(cache_entry(key, encoding))
+        if blob is None:
+            return None
+        body = blob if isinstance(blob, bytes) else iter_mapped(blob)
+        return _binary_response(
+            body, len(blob), key, 'HIT', None, media_type, encoding
+        )
+
+    async def _triangulation(
+        self,
+        key: str,
+        payload: bytes,
+        headers: dict[str, str],
+        index_map: bool,
+        cancel: CancellationToken,
+        receive: Receive,
+        series: tuple[str, str | None] | None = None,
+        points: list[tuple[float, float]] | None = None
+    ) -> _Response:
+        """Construit la réponse de triangulation d'un PointSet binaire.
+
+        Le calcul est annulé si le client se déconnecte avant sa fin.
+
+        Args:
+            key: L'empreinte du PointSet.
+            payload: Le PointSet au format binaire.
+            headers: Les en-têtes de la requête.
+            index_map: Si True, la table des doublons suit les triangles.
+            cancel: Le jeton d'annulation de la requête.
+            receive: Le canal de réception ASGI, corps déjà lu.
+            series: L'empreinte du PointSet et celle de sa version de
+                    base, s'il appartient à une série.
+            points: Les points déjà décodés, le cas échéant.
+
+        Returns:
+            _Response: La triangulation (200), un 304 ou une erreur JSON.
+        """
+        media_type, encoding = negotiate(
+            headers.get('accept'), headers.get('accept-encoding')
+        )
+        tag = response_tag(key, index_map, media_type)
+        if parse_etags(headers.get('if-none-match')).contains_weak(tag):
+            return _not_modified(tag, encoding)
+
+        cached = self._cached(tag, media_type, encoding)
+        if cached is not None:
+            return cached
+
+        watcher = asyncio.ensure_future(_watch_disconnect(receive, cancel))
+        try:
+            point_set, triangles, path = await self._compute_shared(
+                key, payload, series, points, cancel
+            )
+        except ApiError as e:
+            return self._error(e)
+        finally:
+            watcher.cancel()
+
+        # Dédoublonnage et compression éventuelle sont faits hors de la boucle.
+        size, chunks = await asyncio.get_running_loop().run_in_executor(
+            None, triangulation_chunks,
+            point_set, triangles, index_map, media_type, encoding, self.metrics
+        )
+        if self.cache is not None and size <= self.cache.max_bytes:
+            chunks = store_while_streaming(
+                chunks, self.cache, cache_entry(tag, encoding)
+            )
+        return _binary_response(
+            chunks, size, tag, 'MISS', path, media_type, encoding
+        )
+
+    async def _get(
+        self,
+        point_set_id: str,
+        headers: dict[str, str],
+        index_map: bool,
+        receive: Receive
+    ) -> _Response:
+        """Calcule la triangulation pour un PointSet donné.
+
+        Args:
+            point_set_id: L'identifiant du PointSet à trianguler.
+            headers: Les en-têtes de la requête.
+            index_map: Si True, la table des doublons suit les triangles.
+            receive: Le canal de réception ASGI.
+
+        Returns:
+            _Response: La triangulation (200), un 304 ou une erreur JSON.
+        """
+        if self.cache is not None and self.config['CACHE_ID_MAP']:
+            key = self.cache.key_for(point_set_id)
+            if key is not None:
+                media_type, encoding = negotiate(
+                    headers.get('accept'), headers.get('accept-encoding')
+                )
+                tag = response_tag(key, index_map, media_type)
+                if parse_etags(headers.get('if-none-match')).contains_weak(tag):
+                    return _not_modified(tag, encoding)
+                cached = self._cached(tag, media_type, encoding)
+                if cached is not None:
+                    return cached
+
+        try:
+            cancel = self._token(headers)
+            key, payload, points = await self._coalesce(
+                ('fetch', point_set_id), lambda: self._fetch(point_set_id)
+            )
+        except ApiError as e:
+            return self._error(e)
+
+        return await self._triangulation(
+            key, payload, headers, index_map, cancel, receive, points=points
+        )
+
+    async def _upload(
+        self,
+        headers: dict[str, str],
+        index_map: bool,
+        receive: Receive
+    ) -> _Response:
+        """Calcule la triangulation d'un PointSet envoyé par le client.
+
+        Avec l'en-tête X-Triangulation-Base, le PointSet est triangulé par
+        différence avec la version qu'il désigne.
+
+        Args:
+            headers: Les en-têtes de la requête.
+            index_map: Si True, la table des doublons suit les triangles.
+            receive: Le canal de réception ASGI.
+
+        Returns:
+            _Response: La triangulation (200), un 304 ou une erreur JSON.
+        """
+        try:
+            cancel = self._token(headers)
+            decoder = await self._read_upload(headers, receive)
+        except ApiError as e:
+            return self._error(e)
+        payload = decoder.payload()
+        self.metrics.observe_stage(STAGE_DESERIALIZE, decoder.decode_seconds)
+        self.metrics.observe_payload(PAYLOAD_POINT_SET, len(payload))
+        key = content_key(payload)
+        return await self._triangulation(
+            key, payload, headers, index_map, cancel, receive,
+            delta_series(key, headers.get(BASE_HEADER.lower())),
+            decoder.point_set()
+        )
+
+    async def _read_upload(
+        self,
+        headers: dict[str, str],
+        receive: Receive
+    ) -> PointSetDecoder:
+        """Lit un PointSet binaire envoyé dans le corps de la requête.
+
+        Args:
+            headers: Les en-têtes de la requête.
+            receive: Le canal de réception ASGI.
+
+        Returns:
+            PointSetDecoder: Le décodeur complet du PointSet.
+
+        Raises:
+            ApiError: Si la taille est absente, trop grande ou incohérente
+                      avec le nombre de points, ou si le corps est incomplet.
+        """
+        try:
+            length = int(headers['content-length'])
+        except (KeyError, ValueError):
+            length = None
+        length = check_upload_length(length, self.config['UPLOAD_MAX_BYTES'])
+
+        decoder = PointSetDecoder(decode_points=True, check_header=partial(
+            check_upload_header, length=length,
+            max_points=self.config['MAX_POINTS']
+        ))
+        more_body = True
+        while more_body and not decoder.done:
+            message = await receive()
+            more_body = message.get('more_body', False)
+            try:
+                decoder.feed(message.get('body', b''))
+            except ValueError as e:
+                raise ApiError('INVALID_DATA', str(e), 400) from None
+
+        if decoder.expected_size is None:
+            raise ApiError(
+                'INVALID_DATA',
+                'Données insuffisantes pour le compteur de points', 400
+            )
+        if not decoder.done:
+            raise ApiError('INVALID_DATA', 'Corps de la requête incomplet', 400)
+        return decoder
+
+    async def _blob(self, point_set_id: str, cancel: CancellationToken) -> bytes:
+        """Retourne la triangulation sérialisée d'un PointSet.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            cancel: Le jeton d'annulation de la requête par lot.
+
+        Returns:
+            bytes: La triangulation au format binaire.
+
+        Raises:
+            ApiError: Si le PointSet ne peut pas être récupéré ou triangulé.
+        """
+        async with self._batch_slots:
+            cache = self.cache
+            if cache is not None and self.config['CACHE_ID_MAP']:
+                key = cache.key_for(point_set_id)
+                if key is not None:
+                    blob = cache.get(key)
+                    if blob is not None:
+                        return bytes(blob)
+
+            key, payload, points = await self._coalesce(
+                ('fetch', point_set_id), lambda: self._fetch(point_set_id)
+            )
+            if cache is not None:
+                blob = cache.get(key)
+                if blob is not None:
+                    return bytes(blob)
+
+            point_set, triangles, _ = await self._compute_shared(
+                key, payload, None, points, cancel
+            )
+            start = time.perf_counter()
+            blob = await asyncio.get_running_loop().run_in_executor(
+                None, serialize_triangles, point_set, triangles
+            )
+            self.metrics.observe_stage(
+                STAGE_SERIALIZE, time.perf_counter() - start
+            )
+            self.metrics.observe_payload(PAYLOAD_TRIANGLES, len(blob))
+            if cache is not None:
+                cache.put(key, blob)
+            return blob
+
+    async def _batch(
+        self,
+        headers: dict[str, str],
+        receive: Receive
+    ) -> _Response:
+        """Calcule les triangulations de plusieurs PointSets.
+
+        Les calculs restants sont annulés si le client se déconnecte.
+
+        Args:
+            headers: Les en-têtes de la requête.
+            receive: Le canal de réception ASGI.
+
+        Returns:
+            _Response: Les enregistrements au format binaire (200), ou une
+                       erreur JSON si la requête elle-même est invalide.
+        """
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+
+        try:
+            data = json.loads(body)
+        except ValueError:
+            data = None
+        try:
+            ids = batch_ids(data, self.config['BATCH_MAX_ITEMS'])
+            cancel = self._token(headers)
+        except ApiError as e:
+            return self._error(e)
+        watcher = asyncio.ensure_future(_watch_disconnect(receive, cancel))
+        tasks = [asyncio.ensure_future(self._blob(i, cancel)) for i in ids]
+
+        async def records() -> AsyncIterator[bytes]:
+            try:
+                yield encode_batch_header(len(tasks))
+                for task in tasks:
+                    try:
+                        record = encode_batch_record(
+                            BATCH_RECORD_TRIANGLES, await task
+                        )
+                    except ApiError as e:
+                        self.metrics.count_error(e.code)
+                        error = dict(e.to_dict(), status=e.status)
+                        record = encode_batch_record(
+                            BATCH_RECORD_ERROR, json.dumps(error).encode()
+                        )
+                    yield record
+            finally:
+                watcher.cancel()
+                for task in tasks:
+                    task.cancel()
+
+        return _Response(200, {'Content-Type': 'application/octet-stream'},
+                         records())
+
+
+def create_asgi_app(
+    psm_url: str | None = None,
+    config: dict | None = None
+) -> TriangulatorASGI:
+    """Crée et configure l'application ASGI.
+
+    Args:
+        psm_url: URL de base du PointSetManager. Si None, utilise
+                 la variable d'environnement PSM_URL ou localhost:5001.
+        config: Paramètres qui remplacent ceux de DEFAULT_CONFIG.
+
+    Returns:
+        TriangulatorASGI: L'application ASGI configurée.
+    """
+    return TriangulatorASGI(psm_url, config)
@@ -0,0 +1,223 @@
+"""Client HTTP asynchrone du PointSetManager.
+
+Variante de PointSetManagerClient pour le mode de service asyncio: les
+requêtes n'occupent aucun thread pendant l'attente du PointSetManager. Le
+pool de connexions, les reprises avec jitter et le disjoncteur se
+comportent comme dans le client synchrone, dont les exceptions sont
+réutilisées. Le corps est lu en flux, avec la même vérification précoce
+du nombre de points.
+"""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+import httpx
+
+from src.triangulator.psm_client import (
+    RETRYABLE_STATUSES,
+    CircuitBreaker,
+    PointSetManagerError,
+    PointSetManagerUnavailable,
+    PointSetNotFound,
+    PointSetTooLarge,
+    _check_point_count,
+)
+from src.triangulator.serialization import DEFAULT_CHUNK_SIZE, PointSetDecoder
+
+
+class AsyncPointSetManagerClient:
+    """Client asynchrone du PointSetManager avec pool de connexions."""
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 10,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 30.0,
+        retries: int = 2,
+        backoff: float = 0.1,
+        breaker: CircuitBreaker | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ) -> None:
+        """Initialise le client.
+
+        Args:
+            base_url: URL de base du PointSetManager.
+            pool_size: Nombre maximal de connexions simultanées.
+            connect_timeout: Délai maximal d'établissement de connexion.
+            read_timeout: Délai maximal d'attente de la réponse.
+            retries: Nombre de nouvelles tentatives après un échec
+                     transitoire.
+            backoff: Délai de base entre deux tentatives, doublé à chaque
+                     tentative et tiré aléatoirement dans [0, délai].
+            breaker: Disjoncteur à utiliser. Si None, un disjoncteur qui
+                     s'ouvre après 5 échecs pendant 30 secondes.
+            sleep: Coroutine d'attente entre deux tentatives.
+        """
+        self.base_url = base_url.rstrip('/')
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker(5, 30.0)
+        self._sleep = sleep
+        self.session = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+        )
+
+    async def get_point_set(
+        self,
+        point_set_id: str,
+        max_points: int | None = None
+    ) -> bytearray:
+        """Récupère la représentation binaire d'un PointSet.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            max_points: Nombre maximal de points accepté, ou None.
+
+        Returns:
+            bytearray: Le PointSet au format binaire.
+
+        Raises:
+            PointSetNotFound: Si le PointSet n'existe pas.
+            PointSetManagerError: Si le PointSetManager renvoie une erreur.
+            PointSetManagerUnavailable: Si le PointSetManager est injoignable
+                                        ou si le disjoncteur est ouvert.
+            PointSetTooLarge: Si le PointSet dépasse max_points.
+            ValueError: Si le PointSet reçu est incomplet.
+        """
+        decoder = await self._fetch(point_set_id, max_points, False)
+        return decoder.payload()
+
+    async def fetch_point_set(
+        self,
+        point_set_id: str,
+        max_points: int | None = None
+    ) -> PointSetDecoder:
+        """Récupère un PointSet et ses points, décodés pendant la réception.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            max_points: Nombre maximal de points accepté, ou None.
+
+        Returns:
+            PointSetDecoder: Le décodeur complet, dont payload() et
+                             point_set() donnent le PointSet binaire et
+                             ses points.
+
+        Raises:
+            PointSetNotFound: Si le PointSet n'existe pas.
+            PointSetManagerError: Si le PointSetManager renvoie une erreur.
+            PointSetManagerUnavailable: Si le PointSetManager est injoignable
+                                        ou si le disjoncteur est ouvert.
+            PointSetTooLarge: Si le PointSet dépasse max_points.
+            ValueError: Si le PointSet reçu est incomplet.
+        """
+        decoder = await self._fetch(point_set_id, max_points, True)
+        decoder.point_set()
+        return decoder
+
+    async def _read(
+        self,
+        response: httpx.Response,
+        max_points: int | None,
+        decode_points: bool
+    ) -> PointSetDecoder:
+        """Lit en flux le corps d'une réponse 200.
+
+        Args:
+            response: La réponse, ouverte en flux.
+            max_points: Nombre maximal de points accepté, ou None.
+            decode_points: Si True, décode les points au fil des morceaux.
+
+        Returns:
+            PointSetDecoder: Le décodeur rempli.
+
+        Raises:
+            PointSetTooLarge: Si le PointSet dépasse max_points.
+            httpx.HTTPError: Si la lecture échoue.
+        """
+        decoder = PointSetDecoder(
+            decode_points, ignore_trailing=True,
+            check_header=partial(_check_point_count, max_points=max_points)
+        )
+        async for chunk in response.aiter_bytes(DEFAULT_CHUNK_SIZE):
+            decoder.feed(chunk)
+            if decoder.done:
+                break
+        return decoder
+
+    async def _fetch(
+        self,
+        point_set_id: str,
+        max_points: int | None,
+        decode_points: bool
+    ) -> PointSetDecoder:
+        """Récupère un PointSet en flux, avec reprises et disjoncteur.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            max_points: Nombre maximal de points accepté, ou None.
+            decode_points: Si True, décode les points au fil des morceaux.
+
+        Returns:
+            PointSetDecoder: Le décodeur, rempli jusqu'à la fin de la
+                             réponse (le PointSet peut être incomplet).
+
+        Raises:
+            PointSetNotFound: Si le PointSet n'existe pas.
+            PointSetManagerError: Si le PointSetManager renvoie une erreur.
+            PointSetManagerUnavailable: Si le PointSetManager est injoignable
+                                        ou si le disjoncteur est ouvert.
+            PointSetTooLarge: Si le PointSet dépasse max_points.
+        """
+        self.breaker.before_call()
+        url = f'{self.base_url}/pointset/{point_set_id}'
+
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.session.stream('GET', url) as response:
+                    if response.status_code == 200:
+                        decoder = await self._read(
+                            response, max_points, decode_points
+                        )
+            except httpx.HTTPError as e:
+                error = PointSetManagerUnavailable(str(e))
+            except PointSetTooLarge:
+                self.breaker.record_success()
+                raise
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                self.breaker.release_trial()
+                raise
+            else:
+                if response.status_code == 200:
+                    self.breaker.record_success()
+                    return decoder
+                if response.status_code not in RETRYABLE_STATUSES:
+                    if response.status_code < 500:
+                        self.breaker.record_success()
+                    else:
+                        self.breaker.record_failure()
+                    if response.status_code == 404:
+                        raise PointSetNotFound()
+                    raise PointSetManagerError(response.status_code)
+                error = PointSetManagerError(response.status_code)
+
+            if attempt < self.retries:
+                await self._sleep(
+                    random.uniform(0, self.backoff * (2 ** attempt))
+                )
+
+        self.breaker.record_failure()
+        raise error
+
+    async def close(self) -> None:
+        """Ferme les connexions du pool."""
+        await self.session.aclose()
@@ -0,0 +1,207 @@
+"""Cache des triangulations sérialisées.
+
+Les résultats sont indexés par une empreinte du contenu binaire du
+PointSet: deux identifiants qui désignent les mêmes points partagent donc
+la même entrée. Une table optionnelle associe en plus chaque identifiant
+à sa dernière empreinte connue, ce qui permet de répondre sans même
+interroger le PointSetManager.
+
+Le cache est borné en bytes (éviction LRU), chaque entrée expire après un
+TTL, et les blobs peuvent être gardés en mémoire ou sur disque, auquel cas
+ils sont relus par projection mémoire (mmap).
+"""
+
+import hashlib
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+def content_key(data: bytes) -> str:
+    """Calcule l'empreinte d'un PointSet binaire.
+
+    Args:
+        data: La représentation binaire d'un PointSet.
+
+    Returns:
+        str: L'empreinte hexadécimale du contenu.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Cache LRU borné en bytes, avec TTL et stockage mémoire ou disque."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        directory: str | None = None,
+        max_ids: int = 100_000,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialise un cache vide.
+
+        Args:
+            max_bytes: Taille totale maximale des blobs conservés.
+            ttl: Durée de vie d'une entrée, en secondes.
+            directory: Répertoire de stockage des blobs. Si None, les blobs
+                       sont gardés en mémoire.
+            max_ids: Nombre maximal d'identifiants mémorisés.
+            clock: Horloge utilisée pour les expirations.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.directory = directory
+        self.max_ids = max_ids
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[bytes | None, int, float]] = (
+            OrderedDict()
+        )
+        self._ids: dict[str, tuple[str, float]] = {}
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Retourne le chemin du fichier d'une entrée sur disque."""
+        return os.path.join(self.directory, f'{key}.bin')
+
+    def _drop(self, key: str) -> None:
+        """Retire une entrée (verrou déjà pris)."""
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+        if self.directory is not None:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> bytes | mmap.mmap | None:
+        """Retourne le blob associé à une empreinte.
+
+        Args:
+            key: L'empreinte du PointSet.
+
+        Returns:
+            bytes | mmap: Le blob (projeté en mémoire pour le stockage
+                          disque), ou None si absent ou expiré.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= self._clock():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            blob = entry[0]
+            if blob is not None:
+                return blob
+
+            try:
+                with open(self._path(key), 'rb') as f:
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._drop(key)
+                self.hits -= 1
+                self.misses += 1
+                return None
+
+    def put(self, key: str, blob: bytes) -> bool:
+        """Enregistre un blob, en évinçant les entrées les moins récentes.
+
+        Args:
+            key: L'empreinte du PointSet.
+            blob: La triangulation sérialisée.
+
+        Returns:
+            bool: False si le blob est trop gros pour être conservé.
+        """
+        size = len(blob)
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            while self._size + size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+            stored = bytes(blob)
+            if self.directory is not None:
+                with open(self._path(key), 'wb') as f:
+                    f.write(stored)
+                stored = None
+            self._entries[key] = (stored, size, self._clock() + self.ttl)
+            self._size += size
+            return True
+
+    def __contains__(self, key: str) -> bool:
+        """Indique si une entrée non expirée existe, sans toucher aux compteurs."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[2] > self._clock()
+
+    def bind(self, point_set_id: str, key: str) -> None:
+        """Associe un identifiant de PointSet à l'empreinte de son contenu.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            key: L'empreinte de son contenu.
+        """
+        with self._lock:
+            self._ids.pop(point_set_id, None)
+            while len(self._ids) >= self.max_ids:
+                del self._ids[next(iter(self._ids))]
+            self._ids[point_set_id] = (key, self._clock() + self.ttl)
+
+    def key_for(self, point_set_id: str) -> str | None:
+        """Retourne la dernière empreinte connue d'un identifiant.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+
+        Returns:
+            str | None: L'empreinte, ou None si inconnue ou expirée.
+        """
+        with self._lock:
+            binding = self._ids.get(point_set_id)
+            if binding is None:
+                return None
+            if binding[1] <= self._clock():
+                del self._ids[point_set_id]
+                return None
+            return binding[0]
+
+    @property
+    def size(self) -> int:
+        """Taille totale des blobs conservés, en bytes."""
+        return self._size
+
+    def stats(self) -> dict[str, int]:
+        """Retourne les compteurs du cache.
+
+        Returns:
+            dict: Nombre de hits, misses, évictions, entrées et bytes.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._size,
+            }
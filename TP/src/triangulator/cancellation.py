@@ -0,0 +1,109 @@
+"""Annulation coopérative des triangulations.
+
+Un CancellationToken porte une échéance et un drapeau d'annulation,
+positionné par un autre thread (client déconnecté, requête abandonnée).
+Les calculs longs le consultent à intervalles réguliers (voir
+core.triangulate) et s'interrompent en levant Cancelled: le travail
+abandonné libère son thread, son processus ou sa place dans
+l'ordonnanceur en quelques millisecondes au lieu de courir jusqu'au bout.
+
+La consultation ne coûte qu'un test de drapeau et, avec une échéance, une
+lecture de l'horloge monotone. Une attente (file de l'ordonnanceur) peut
+aussi s'abonner à l'annulation explicite pour être réveillée aussitôt.
+"""
+
+import time
+from collections.abc import Callable
+
+
+class Cancelled(Exception):
+    """Le calcul a été annulé ou a dépassé son échéance."""
+
+
+class CancellationToken:
+    """Échéance et drapeau d'annulation partagés entre threads."""
+
+    __slots__ = ('deadline', '_cancelled', '_callbacks')
+
+    def __init__(self, deadline: float | None = None) -> None:
+        """Initialise un jeton non annulé.
+
+        Args:
+            deadline: Échéance selon time.monotonic(), ou None.
+        """
+        self.deadline = deadline
+        self._cancelled = False
+        self._callbacks: list[Callable[[], None]] = []
+
+    @classmethod
+    def after(cls, seconds: float | None) -> 'CancellationToken':
+        """Crée un jeton qui expire après un délai.
+
+        Args:
+            seconds: Le délai en secondes, ou None pour aucune échéance.
+
+        Returns:
+            CancellationToken: Le jeton.
+        """
+        if seconds is None:
+            return cls()
+        return cls(time.monotonic() + seconds)
+
+    def cancel(self) -> None:
+        """Annule les calculs qui consultent ce jeton et réveille les attentes."""
+        self._cancelled = True
+        for callback in list(self._callbacks):
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Abonne une fonction à l'annulation explicite du jeton.
+
+        L'échéance ne déclenche pas d'appel: les attentes la bornent
+        elles-mêmes. Si le jeton est déjà annulé, la fonction est appelée
+        immédiatement; elle peut l'être deux fois si l'annulation a lieu
+        pendant l'abonnement.
+
+        Args:
+            callback: La fonction à appeler, depuis le thread qui annule.
+
+        Returns:
+            Callable: La fonction qui retire l'abonnement.
+        """
+        self._callbacks.append(callback)
+        if self._cancelled:
+            callback()
+
+        def remove() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return remove
+
+    @property
+    def cancelled(self) -> bool:
+        """Indique si le jeton est annulé ou si son échéance est passée."""
+        return self._cancelled or (
+            self.deadline is not None and time.monotonic() >= self.deadline
+        )
+
+    def remaining(self) -> float | None:
+        """Retourne le temps restant avant l'échéance, en secondes.
+
+        Returns:
+            float | None: Le temps restant (0 au plus tôt), ou None sans
+                          échéance.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self) -> None:
+        """Lève Cancelled si le jeton est annulé ou expiré.
+
+        Raises:
+            Cancelled: Si le calcul doit s'interrompre.
+        """
+        if self._cancelled:
+            raise Cancelled('Calcul annulé')
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise Cancelled('Échéance dépassée')
@@ -0,0 +1,374 @@
+"""Triangulation hors ligne de fichiers PointSet.
+
+Ce module fournit l'interface en ligne de commande du package
+(``python -m src.triangulator``). Elle triangule des fichiers au format
+binaire PointSet et écrit, pour chacun, un fichier au format Triangles,
+sans passer par le service HTTP:
+
+- le fichier d'entrée est projeté en mémoire (mmap) et les coordonnées
+  sont lues directement dans les pages projetées, sans copie du contenu;
+- le fichier de sortie est alloué à sa taille finale puis projeté en
+  mémoire: la partie PointSet y est recopiée telle quelle depuis
+  l'entrée, suivie des indices des triangles.
+
+Les entrées peuvent être des fichiers, des répertoires (tous les fichiers
+qu'ils contiennent, hors fichiers Triangles) ou des motifs glob. Avec
+``--jobs``, les fichiers sont répartis sur un pool de processus. Une
+ligne de rapport (points, triangles, durée, débit) est affichée par
+fichier.
+"""
+
+import argparse
+import glob
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.triangulator.core import triangulate
+from src.triangulator.ordering import ORDERS
+from src.triangulator.serialization import (
+    _float_view,
+    _index_array,
+    _read_point_count,
+    triangles_size,
+)
+
+TRIANGLES_SUFFIX = '.triangles'
+
+
+class FileReport:
+    """Résultat de la triangulation d'un fichier."""
+
+    __slots__ = ('source', 'target', 'points', 'triangles', 'seconds', 'error')
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        points: int = 0,
+        triangles: int = 0,
+        seconds: float = 0.0,
+        error: str | None = None
+    ) -> None:
+        """Initialise le rapport.
+
+        Args:
+            source: Le fichier PointSet lu.
+            target: Le fichier Triangles écrit.
+            points: Nombre de points du PointSet.
+            triangles: Nombre de triangles calculés.
+            seconds: Durée totale (lecture, calcul et écriture).
+            error: Le message d'erreur si le fichier n'a pas été traité.
+        """
+        self.source = source
+        self.target = target
+        self.points = points
+        self.triangles = triangles
+        self.seconds = seconds
+        self.error = error
+
+    def __str__(self) -> str:
+        """Retourne la ligne de rapport du fichier."""
+        if self.error is not None:
+            return f"{self.source}: erreur: {self.error}"
+        rate = self.points / self.seconds if self.seconds else 0.0
+        return (f"{self.source} -> {self.target}: {self.points} points, "
+                f"{self.triangles} triangles, {self.seconds:.3f} s, "
+                f"{rate:.0f} points/s")
+
+
+def _read_points(data: mmap.mmap | bytes) -> list[tuple[float, float]]:
+    """Décode les points d'un PointSet projeté en mémoire.
+
+    Les floats sont lus par une vue sur les pages projetées; la vue est
+    libérée au retour, ce qui permet de fermer la projection ensuite.
+
+    Args:
+        data: Le contenu du fichier PointSet.
+
+    Returns:
+        list: Liste de tuples (x, y) représentant les points.
+
+    Raises:
+        ValueError: Si les données sont malformées ou incomplètes.
+    """
+    count = _read_point_count(data)
+    floats = _float_view(data, 4, 2 * count)
+    try:
+        values = floats.tolist()
+    finally:
+        if isinstance(floats, memoryview):
+            floats.release()
+    return list(zip(values[0::2], values[1::2]))
+
+
+def _write_triangles(
+    target: str,
+    data: mmap.mmap | bytes,
+    point_count: int,
+    triangles: Sequence[tuple[int, int, int]]
+) -> None:
+    """Écrit un fichier Triangles dans une projection préallouée.
+
+    La partie PointSet est celle du fichier d'entrée, recopiée octet pour
+    octet: le résultat est identique à celui de serialize_triangles.
+
+    Args:
+        target: Le fichier à écrire (remplacé s'il existe).
+        data: Le contenu du fichier PointSet d'entrée.
+        point_count: Nombre de points du PointSet.
+        triangles: Les triangles (i1, i2, i3).
+    """
+    vertices_end = 4 + 8 * point_count
+    size = triangles_size(point_count, len(triangles))
+    with open(target, 'w+b') as file:
+        file.truncate(size)
+        with mmap.mmap(file.fileno(), size) as output:
+            with memoryview(output) as out, memoryview(data) as source:
+                out[:vertices_end] = source[:vertices_end]
+                struct.pack_into('<I', out, vertices_end, len(triangles))
+                out[vertices_end + 4:] = memoryview(
+                    _index_array(triangles)
+                ).cast('B')
+
+
+def triangulate_file(
+    source: str,
+    target: str,
+    order: str = 'hilbert'
+) -> FileReport:
+    """Triangule un fichier PointSet et écrit le fichier Triangles.
+
+    Args:
+        source: Le fichier PointSet.
+        target: Le fichier Triangles à écrire.
+        order: Ordre d'insertion des points (voir triangulate).
+
+    Returns:
+        FileReport: Le rapport du fichier; en cas d'échec (fichier
+                    illisible ou malformé), son champ error est renseigné.
+    """
+    start_time = time.perf_counter()
+    try:
+        with open(source, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                raise ValueError("Fichier vide")
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                points = _read_points(data)
+                triangles = triangulate(points, order=order)
+                _write_triangles(target, data, len(points), triangles)
+    except (OSError, ValueError) as e:
+        return FileReport(source, target, error=str(e))
+    return FileReport(source, target, len(points), len(triangles),
+                      time.perf_counter() - start_time)
+
+
+def expand_inputs(inputs: Sequence[str]) -> list[str]:
+    """Liste les fichiers désignés par des chemins, répertoires ou motifs.
+
+    Un répertoire ou un motif glob désigne les fichiers correspondants,
+    hors fichiers Triangles (suffixe TRIANGLES_SUFFIX), pour qu'ils
+    puissent être retraités sans relire les résultats précédents. Un
+    chemin inexistant est interprété comme un motif glob.
+
+    Args:
+        inputs: Les chemins donnés en ligne de commande.
+
+    Returns:
+        list: Les fichiers, sans doublon, dans l'ordre des arguments
+              (trié à l'intérieur d'un répertoire ou d'un motif).
+
+    Raises:
+        ValueError: Si un argument ne désigne aucun fichier.
+    """
+    files: dict[str, None] = {}
+    for path in inputs:
+        if os.path.isdir(path):
+            matches = sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if not name.endswith(TRIANGLES_SUFFIX)
+                and os.path.isfile(os.path.join(path, name))
+            )
+        elif os.path.exists(path):
+            matches = [path]
+        else:
+            matches = sorted(
+                p for p in glob.glob(path)
+                if not p.endswith(TRIANGLES_SUFFIX) and os.path.isfile(p)
+            )
+        if not matches:
+            raise ValueError(f"Aucun fichier ne correspond à {path!r}")
+        files.update(dict.fromkeys(matches))
+    return list(files)
+
+
+def target_path(source: str, output: str | None = None) -> str:
+    """Retourne le chemin du fichier Triangles d'un fichier PointSet.
+
+    Args:
+        source: Le fichier PointSet.
+        output: Répertoire de sortie; si None, celui de source.
+
+    Returns:
+        str: Le chemin de source, suffixe remplacé par TRIANGLES_SUFFIX.
+    """
+    directory, name = os.path.split(source)
+    stem = os.path.splitext(name)[0]
+    return os.path.join(directory if output is None else output,
+                        stem + TRIANGLES_SUFFIX)
+
+
+def plan_jobs(
+    sources: Sequence[str],
+    output: str | None = None
+) -> list[tuple[str, str]]:
+    """Associe à chaque fichier PointSet son fichier Triangles.
+
+    Args:
+        sources: Les fichiers PointSet.
+        output: Répertoire de sortie; si None, celui de chaque fichier.
+
+    Returns:
+        list: Les fichiers source et cible, dans l'ordre de sources.
+
+    Raises:
+        ValueError: Si un fichier Triangles écraserait son PointSet ou si
+                    deux PointSets ont le même fichier Triangles (ex:
+                    a.bin et a.dat).
+    """
+    jobs = [(source, target_path(source, output)) for source in sources]
+    claimed: dict[str, str] = {}
+    for source, target in jobs:
+        key = os.path.normcase(os.path.abspath(target))
+        if key == os.path.normcase(os.path.abspath(source)):
+            raise ValueError(f"{source!r} serait écrasé par son résultat")
+        if key in claimed:
+            raise ValueError(
+                f"{claimed[key]!r} et {source!r} auraient le même résultat "
+                f"{target!r}"
+            )
+        claimed[key] = source
+    return jobs
+
+
+def _triangulate_job(
+    job: tuple[str, str],
+    order: str
+) -> FileReport:
+    """Adapte triangulate_file à ProcessPoolExecutor.map.
+
+    Args:
+        job: Les fichiers source et cible.
+        order: Ordre d'insertion des points.
+
+    Returns:
+        FileReport: Le rapport du fichier.
+    """
+    return triangulate_file(job[0], job[1], order)
+
+
+def run(
+    sources: Sequence[str],
+    output: str | None = None,
+    jobs: int = 1,
+    order: str = 'hilbert'
+) -> Iterator[FileReport]:
+    """Triangule des fichiers PointSet, au besoin dans un pool de processus.
+
+    Args:
+        sources: Les fichiers PointSet.
+        output: Répertoire de sortie; si None, chaque fichier Triangles
+                est écrit à côté de son PointSet.
+        jobs: Nombre de processus. À 1, les fichiers sont traités dans le
+              processus courant.
+        order: Ordre d'insertion des points (voir triangulate).
+
+    Yields:
+        FileReport: Le rapport de chaque fichier, dans l'ordre de sources.
+
+    Raises:
+        ValueError: Voir plan_jobs.
+    """
+    job_list = plan_jobs(sources, output)
+    task = partial(_triangulate_job, order=order)
+    if jobs <= 1 or len(job_list) <= 1:
+        yield from map(task, job_list)
+        return
+
+    context = multiprocessing.get_context('spawn')
+    workers = min(jobs, len(job_list))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        yield from pool.map(task, job_list)
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Construit l'analyseur des arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(
+        prog='triangulator',
+        description="Triangule des fichiers PointSet et écrit les fichiers "
+                    f"Triangles correspondants (suffixe {TRIANGLES_SUFFIX}).",
+    )
+    parser.add_argument(
+        'inputs', nargs='+',
+        help="Fichiers PointSet, répertoires ou motifs glob.",
+    )
+    parser.add_argument(
+        '-o', '--output',
+        help="Répertoire de sortie (par défaut, celui de chaque fichier).",
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help="Nombre de processus (par défaut 1).",
+    )
+    parser.add_argument(
+        '--order', choices=ORDERS, default='hilbert',
+        help="Ordre d'insertion des points.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Point d'entrée de la ligne de commande.
+
+    Args:
+        argv: Les arguments; si None, ceux de sys.argv.
+
+    Returns:
+        int: Le code de sortie: 0 si tous les fichiers ont été
+             triangulés, 1 si l'un a échoué, 2 si les arguments sont
+             invalides.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs doit être au moins 1")
+    try:
+        sources = expand_inputs(args.inputs)
+        plan_jobs(sources, args.output)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.output is not None:
+        os.makedirs(args.output, exist_ok=True)
+
+    status = 0
+    points = 0
+    start_time = time.perf_counter()
+    for report in run(sources, args.output, args.jobs, args.order):
+        if report.error is not None:
+            status = 1
+            print(report, file=sys.stderr)
+        else:
+            points += report.points
+            print(report)
+    duration = time.perf_counter() - start_time
+
+    rate = points / duration if duration else 0.0
+    print(f"{len(sources)} fichiers, {points} points, {duration:.3f} s, "
+          f"{rate:.0f} points/s")
+    return status
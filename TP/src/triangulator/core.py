@@ -5,27 +5,80 @@ en utilisant l'approche Bowyer-Watson incrémentale.
 """
 
 import math
+from array import array
+from collections.abc import Callable, Iterable
 
+from src.triangulator.cancellation import CancellationToken
+from src.triangulator.ordering import ORDERS, insertion_order
+from src.triangulator.predicates import incircle, orient2d
+from src.triangulator.triangles import _UINT32, TriangleArray
 
-def _distance(p1: tuple[float, float], p2: tuple[float, float]) -> float:
-    """Calcule la distance euclidienne entre deux points.
+# Nombre d'insertions entre deux consultations du jeton d'annulation:
+# quelques millisecondes de calcul, pour un coût de consultation
+# négligeable.
+CANCEL_CHECK_INTERVAL = 64
+
+
+class TriangulationStats:
+    """Compteurs internes d'une triangulation (voir set_stats_hook)."""
+
+    __slots__ = ('points', 'incircle_tests', 'cavity_triangles')
+
+    def __init__(self) -> None:
+        """Initialise les compteurs à zéro."""
+        self.points = 0
+        self.incircle_tests = 0
+        self.cavity_triangles = 0
+
+
+_stats_hook: Callable[[TriangulationStats], None] | None = None
+
+
+def set_stats_hook(hook: Callable[[TriangulationStats], None] | None) -> None:
+    """Installe le crochet qui reçoit les compteurs de chaque triangulation.
+
+    Sans crochet (par défaut), triangulate et DelaunayMesh utilisent le
+    maillage ordinaire et ne comptent rien. Avec un crochet, les maillages
+    créés ensuite comptent les points insérés, les tests in-circle et les
+    triangles des cavités, puis appellent le crochet à la fin de chaque
+    triangulation ou lot d'insertions. Le crochet vaut pour tout
+    le processus: les triangulations faites dans d'autres processus (pool
+    de processus, découpage en bandes) ne sont pas comptées.
+
+    Args:
+        hook: Fonction appelée avec les TriangulationStats, ou None pour
+              désactiver le comptage.
+    """
+    global _stats_hook
+    _stats_hook = hook
+
+
+def _squared_distance(
+    p1: tuple[float, float],
+    p2: tuple[float, float]
+) -> float:
+    """Calcule le carré de la distance euclidienne entre deux points.
+
+    Comparer des distances au carré évite une racine carrée inutile.
 
     Args:
         p1: Premier point (x, y).
         p2: Second point (x, y).
 
     Returns:
-        float: La distance entre les deux points.
+        float: Le carré de la distance entre les deux points.
     """
-    return math.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2)
+    dx = p1[0] - p2[0]
+    dy = p1[1] - p2[1]
+    return dx * dx + dy * dy
 
 
-def _circumcircle(
+def _circumcenter(
     p1: tuple[float, float],
     p2: tuple[float, float],
     p3: tuple[float, float]
 ) -> tuple[tuple[float, float], float] | None:
-    """Calcule le cercle circonscrit d'un triangle.
+    """Calcule le centre et le carré du rayon du cercle circonscrit.
 
     Args:
         p1: Premier sommet du triangle.
@@ -33,8 +86,8 @@ def _circumcircle(
         p3: Troisième sommet du triangle.
 
     Returns:
-        tuple: (centre, rayon) du cercle circonscrit, ou None si les points
-               sont colinéaires.
+        tuple: (centre, rayon au carré) du cercle circonscrit, ou None si
+               les points sont colinéaires.
     """
     ax, ay = p1
     bx, by = p2
@@ -42,7 +95,7 @@ def _circumcircle(
 
     d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
 
-    if abs(d) < 1e-10:
+    if d == 0.0 or orient2d(p1, p2, p3) == 0.0:
         return None
 
     ux = (
@@ -58,9 +111,58 @@ def _circumcircle(
     ) / d
 
     center = (ux, uy)
-    radius = _distance(center, p1)
+    return (center, _squared_distance(center, p1))
+
+
+def _circumcircle(
+    p1: tuple[float, float],
+    p2: tuple[float, float],
+    p3: tuple[float, float]
+) -> tuple[tuple[float, float], float] | None:
+    """Calcule le cercle circonscrit d'un triangle.
+
+    Args:
+        p1: Premier sommet du triangle.
+        p2: Deuxième sommet du triangle.
+        p3: Troisième sommet du triangle.
+
+    Returns:
+        tuple: (centre, rayon) du cercle circonscrit, ou None si les points
+               sont colinéaires.
+    """
+    circle = _circumcenter(p1, p2, p3)
+    if circle is None:
+        return None
 
-    return (center, radius)
+    center, squared_radius = circle
+    return (center, math.sqrt(squared_radius))
+
+
+def _super_triangle(
+    min_x: float,
+    max_x: float,
+    min_y: float,
+    max_y: float
+) -> list[tuple[float, float]]:
+    """Calcule un super-triangle qui englobe largement une boîte.
+
+    Args:
+        min_x: Abscisse minimale de la boîte.
+        max_x: Abscisse maximale de la boîte.
+        min_y: Ordonnée minimale de la boîte.
+        max_y: Ordonnée maximale de la boîte.
+
+    Returns:
+        list: Les trois sommets du super-triangle.
+    """
+    delta_max = max(max_x - min_x, max_y - min_y)
+    mid_x = (min_x + max_x) / 2
+    mid_y = (min_y + max_y) / 2
+    return [
+        (mid_x - 20 * delta_max, mid_y - delta_max),
+        (mid_x, mid_y + 20 * delta_max),
+        (mid_x + 20 * delta_max, mid_y - delta_max),
+    ]
 
 
 def _point_in_circumcircle(
@@ -80,12 +182,12 @@ def _point_in_circumcircle(
     Returns:
         bool: True si le point est dans le cercle circonscrit.
     """
-    circle = _circumcircle(p1, p2, p3)
-    if circle is None:
+    orientation = orient2d(p1, p2, p3)
+    if orientation == 0.0:
         return False
 
-    center, radius = circle
-    return _distance(point, center) < radius
+    inside = incircle(p1, p2, p3, point)
+    return inside > 0.0 if orientation > 0.0 else inside < 0.0
 
 
 def _are_collinear(points: list[tuple[float, float]]) -> bool:
@@ -100,115 +202,559 @@ def _are_collinear(points: list[tuple[float, float]]) -> bool:
     if len(points) < 3:
         return True
 
-    x1, y1 = points[0]
-    x2, y2 = points[1]
+    first = points[0]
+    for second in points:
+        if second != first:
+            break
+    else:
+        return True
 
-    for i in range(2, len(points)):
-        x3, y3 = points[i]
-        cross = (x2 - x1) * (y3 - y1) - (y2 - y1) * (x3 - x1)
-        if abs(cross) > 1e-10:
-            return False
+    return all(orient2d(first, second, point) == 0.0 for point in points)
 
-    return True
 
+def deduplicate(
+    points: list[tuple[float, float]],
+    tolerance: float = 0.0
+) -> tuple[list[int], list[int]]:
+    """Regroupe les points coïncidents autour d'un représentant.
 
-def _has_duplicates(points: list[tuple[float, float]]) -> bool:
-    """Vérifie si la liste contient des points dupliqués/coïncidents.
+    Le représentant d'un groupe est son premier point. Les points sont
+    rangés dans une grille de hachage dont les cellules ont pour côté la
+    tolérance: un point ne se compare qu'aux représentants des cellules
+    voisines, et la mémoire reste linéaire. Avec une tolérance nulle, seuls
+    les points de coordonnées identiques sont regroupés et chaque cellule
+    se réduit à un point (un simple dictionnaire).
 
     Args:
-        points: Liste de points à vérifier.
+        points: Liste de points (x, y).
+        tolerance: Distance en dessous de laquelle deux points sont
+                   considérés comme coïncidents.
+
+    Returns:
+        tuple: Les indices des représentants, dans l'ordre croissant, et
+               pour chaque point l'indice de son représentant.
+    """
+    if tolerance <= 0.0:
+        first: dict[tuple[float, float], int] = {}
+        index_map = [first.setdefault(p, i) for i, p in enumerate(points)]
+        if len(first) == len(points):
+            return list(index_map), index_map
+        return sorted(first.values()), index_map
+
+    squared_tolerance = tolerance * tolerance
+    cells: dict[tuple[int, int], list[int]] = {}
+    index_map = []
+    unique = []
+    for i, (x, y) in enumerate(points):
+        column = math.floor(x / tolerance)
+        row = math.floor(y / tolerance)
+        representative = i
+        for key in ((column + dc, row + dr)
+                    for dc in (-1, 0, 1) for dr in (-1, 0, 1)):
+            for j in cells.get(key, ()):
+                if _squared_distance(points[j], (x, y)) <= squared_tolerance:
+                    representative = j
+                    break
+            if representative != i:
+                break
+        if representative == i:
+            cells.setdefault((column, row), []).append(i)
+            unique.append(i)
+        index_map.append(representative)
+    return unique, index_map
+
+
+class _TriangleMesh:
+    """Maillage triangulaire avec liens d'adjacence.
+
+    Les triangles sont stockés dans des listes plates: les sommets du
+    triangle ``t`` sont ``tri_vertices[3 * t:3 * t + 3]`` (orientés dans le
+    sens trigonométrique) et ``tri_neighbors[3 * t + k]`` est le triangle
+    adjacent par l'arête opposée au sommet ``k`` (-1 s'il n'existe pas).
+    Les emplacements des triangles supprimés sont réutilisés.
+    """
+
+    __slots__ = ('vertices', 'tri_vertices', 'tri_neighbors', 'alive',
+                 '_free', '_last')
+
+    # Test in-circle de _find_cavity, remplaçable par une sous-classe.
+    _incircle = staticmethod(incircle)
+
+    def __init__(self, vertices: list[tuple[float, float]]) -> None:
+        """Initialise un maillage vide.
+
+        Args:
+            vertices: Liste des sommets référencés par les triangles.
+        """
+        self.vertices = vertices
+        self.tri_vertices: list[int] = []
+        self.tri_neighbors: list[int] = []
+        self.alive: list[bool] = []
+        self._free: list[int] = []
+        self._last = 0
+
+    def add_triangle(self, a: int, b: int, c: int) -> int:
+        """Ajoute un triangle sans voisin et retourne son identifiant.
+
+        Args:
+            a: Indice du premier sommet.
+            b: Indice du deuxième sommet.
+            c: Indice du troisième sommet.
+
+        Returns:
+            int: L'identifiant du triangle créé.
+        """
+        vertices = self.vertices
+        if orient2d(vertices[a], vertices[b], vertices[c]) < 0:
+            b, c = c, b
+
+        if self._free:
+            t = self._free.pop()
+            base = 3 * t
+            self.tri_vertices[base:base + 3] = (a, b, c)
+            self.tri_neighbors[base:base + 3] = (-1, -1, -1)
+            self.alive[t] = True
+        else:
+            t = len(self.alive)
+            self.tri_vertices.extend((a, b, c))
+            self.tri_neighbors.extend((-1, -1, -1))
+            self.alive.append(True)
+        return t
+
+    def locate(self, point: tuple[float, float]) -> int:
+        """Trouve le triangle contenant un point par marche de visibilité.
+
+        La marche part du dernier triangle créé: avec un ordre d'insertion
+        cohérent spatialement, elle ne traverse que quelques triangles.
+
+        Args:
+            point: Le point à localiser.
+
+        Returns:
+            int: L'identifiant du triangle contenant le point.
+        """
+        vertices = self.vertices
+        tri_vertices = self.tri_vertices
+        tri_neighbors = self.tri_neighbors
+
+        t = self._last
+        if not self.alive[t]:
+            t = self.alive.index(True)
+
+        previous = -1
+        while True:
+            base = 3 * t
+            for k in range(3):
+                a = vertices[tri_vertices[base + (k + 1) % 3]]
+                b = vertices[tri_vertices[base + (k + 2) % 3]]
+                neighbor = tri_neighbors[base + k]
+                if (neighbor != previous and neighbor != -1
+                        and orient2d(a, b, point) < 0):
+                    previous = t
+                    t = neighbor
+                    break
+            else:
+                return t
+
+    def _find_cavity(self, point: tuple[float, float], start: int) -> list[int]:
+        """Parcourt en largeur les triangles dont le cercle contient le point.
+
+        Un voisin est aussi ajouté lorsque le point n'est pas strictement du
+        côté intérieur de l'arête partagée, ce qui garantit que la cavité
+        reste étoilée par rapport au point.
+
+        Args:
+            point: Le point inséré.
+            start: Le triangle contenant le point.
+
+        Returns:
+            list: Les identifiants des triangles de la cavité.
+        """
+        vertices = self.vertices
+        tri_vertices = self.tri_vertices
+        tri_neighbors = self.tri_neighbors
+        in_circle = self._incircle
+
+        cavity = [start]
+        visited = {start}
+        queue_index = 0
+        while queue_index < len(cavity):
+            t = cavity[queue_index]
+            queue_index += 1
+            base = 3 * t
+            for k in range(3):
+                u = tri_neighbors[base + k]
+                if u == -1 or u in visited:
+                    continue
+                a = vertices[tri_vertices[base + (k + 1) % 3]]
+                b = vertices[tri_vertices[base + (k + 2) % 3]]
+                ubase = 3 * u
+                if (orient2d(a, b, point) <= 0 or in_circle(
+                        vertices[tri_vertices[ubase]],
+                        vertices[tri_vertices[ubase + 1]],
+                        vertices[tri_vertices[ubase + 2]],
+                        point) > 0):
+                    visited.add(u)
+                    cavity.append(u)
+        return cavity
+
+    def insert(self, index: int) -> None:
+        """Insère un sommet dans le maillage (étape de Bowyer-Watson).
+
+        Args:
+            index: Indice du sommet à insérer dans ``vertices``.
+        """
+        point = self.vertices[index]
+        tri_vertices = self.tri_vertices
+        tri_neighbors = self.tri_neighbors
+
+        cavity = self._find_cavity(point, self.locate(point))
+        in_cavity = set(cavity)
+
+        boundary = []
+        for t in cavity:
+            base = 3 * t
+            for k in range(3):
+                outer = tri_neighbors[base + k]
+                if outer in in_cavity:
+                    continue
+                a = tri_vertices[base + (k + 1) % 3]
+                b = tri_vertices[base + (k + 2) % 3]
+                slot = -1
+                if outer != -1:
+                    slot = 3 * outer + tri_neighbors[3 * outer:3 * outer + 3].index(t)
+                boundary.append((a, b, outer, slot))
+
+        for t in cavity:
+            self.alive[t] = False
+            self._free.append(t)
+
+        by_start = {}
+        by_end = {}
+        for a, b, outer, slot in boundary:
+            t = self.add_triangle(a, b, index)
+            tri_neighbors[3 * t + 2] = outer
+            if slot != -1:
+                tri_neighbors[slot] = t
+            by_start[a] = t
+            by_end[b] = t
+
+        for a, b, _, _ in boundary:
+            t = by_start[a]
+            tri_neighbors[3 * t] = by_start[b]
+            tri_neighbors[3 * t + 1] = by_end[a]
+
+        self._last = t
+
+    def stitch(
+        self,
+        created: list[int],
+        boundary: dict[tuple[int, int], tuple[int, int]]
+    ) -> None:
+        """Relie des triangles créés entre eux et au reste du maillage.
+
+        Args:
+            created: Les identifiants des triangles créés.
+            boundary: Pour chaque arête (a, b) du bord, orientée comme dans
+                      le triangle créé qui la porte, le triangle extérieur
+                      et l'emplacement de son lien vers l'intérieur (-1 s'il
+                      n'existe pas).
+        """
+        tri_vertices = self.tri_vertices
+        tri_neighbors = self.tri_neighbors
+        edges = {}
+        for t in created:
+            base = 3 * t
+            for k in range(3):
+                a = tri_vertices[base + (k + 1) % 3]
+                b = tri_vertices[base + (k + 2) % 3]
+                outer = boundary.get((a, b))
+                if outer is not None:
+                    tri_neighbors[base + k], slot = outer
+                    if slot != -1:
+                        tri_neighbors[slot] = t
+                    continue
+                twin = edges.pop((b, a), None)
+                if twin is None:
+                    edges[(a, b)] = base + k
+                else:
+                    tri_neighbors[base + k] = twin // 3
+                    tri_neighbors[twin] = t
+
+    def remove(self, index: int) -> None:
+        """Retire un sommet intérieur et retriangule le trou laissé.
+
+        Les triangles qui entourent le sommet sont supprimés; le polygone
+        formé par leurs arêtes opposées est retriangulé par oreilles
+        successives, en ne retenant que des oreilles dont le cercle
+        circonscrit ne contient aucun autre sommet du polygone: le résultat
+        reste une triangulation de Delaunay. Le coût ne dépend que du degré
+        du sommet (et de la marche qui le localise).
+
+        Args:
+            index: Indice du sommet à retirer dans ``vertices``.
+        """
+        vertices = self.vertices
+        tri_vertices = self.tri_vertices
+        tri_neighbors = self.tri_neighbors
+
+        start = self.locate(vertices[index])
+        polygon = []
+        boundary = {}
+        star = []
+        t = start
+        while True:
+            base = 3 * t
+            k = tri_vertices[base:base + 3].index(index)
+            a = tri_vertices[base + (k + 1) % 3]
+            b = tri_vertices[base + (k + 2) % 3]
+            outer = tri_neighbors[base + k]
+            slot = -1
+            if outer != -1:
+                slot = 3 * outer + tri_neighbors[3 * outer:3 * outer + 3].index(t)
+            boundary[(a, b)] = (outer, slot)
+            polygon.append(a)
+            star.append(t)
+            t = tri_neighbors[base + (k + 1) % 3]
+            if t == start:
+                break
+
+        for t in star:
+            self.alive[t] = False
+            self._free.append(t)
+
+        created = []
+        while len(polygon) > 3:
+            m = len(polygon)
+            for i in range(m):
+                a, b, c = polygon[i], polygon[(i + 1) % m], polygon[(i + 2) % m]
+                pa, pb, pc = vertices[a], vertices[b], vertices[c]
+                if orient2d(pa, pb, pc) <= 0:
+                    continue
+                if any(incircle(pa, pb, pc, vertices[q]) > 0
+                       for q in polygon if q != a and q != b and q != c):
+                    continue
+                created.append(self.add_triangle(a, b, c))
+                del polygon[(i + 1) % m]
+                break
+            else:
+                raise RuntimeError(
+                    f'Aucune oreille de Delaunay autour du sommet {index}'
+                )
+        created.append(self.add_triangle(*polygon))
+
+        self.stitch(created, boundary)
+        self._last = created[-1]
+
+    def triangles(self, limit: int | None = None, first: int = 0) -> TriangleArray:
+        """Retourne les triangles vivants du maillage.
+
+        Args:
+            limit: Si fourni, seuls les triangles dont tous les sommets ont
+                   un indice inférieur à limit sont retenus.
+            first: Seuls les triangles dont tous les sommets ont un indice
+                   supérieur ou égal à first sont retenus, et leurs indices
+                   sont décalés de first.
+
+        Returns:
+            TriangleArray: Les sommets de chaque triangle.
+        """
+        if limit is None:
+            limit = len(self.vertices)
+        tri_vertices = self.tri_vertices
+        indices = array(_UINT32)
+        for t, alive in enumerate(self.alive):
+            if alive:
+                a, b, c = tri_vertices[3 * t:3 * t + 3]
+                if first <= a < limit and first <= b < limit and first <= c < limit:
+                    indices.extend((a - first, b - first, c - first))
+        return TriangleArray(indices)
+
+
+class _CountingTriangleMesh(_TriangleMesh):
+    """Maillage qui compte le travail de ses insertions.
+
+    Utilisé à la place de _TriangleMesh seulement quand un crochet est
+    installé: le maillage ordinaire ne paie aucun compteur.
+    """
+
+    __slots__ = ('stats',)
+
+    def __init__(self, vertices: list[tuple[float, float]]) -> None:
+        """Initialise un maillage vide et ses compteurs.
+
+        Args:
+            vertices: Liste des sommets référencés par les triangles.
+        """
+        super().__init__(vertices)
+        self.stats = TriangulationStats()
+
+    def _incircle(
+        self,
+        a: tuple[float, float],
+        b: tuple[float, float],
+        c: tuple[float, float],
+        point: tuple[float, float]
+    ) -> float:
+        """Évalue le prédicat incircle en comptant le test.
+
+        Args:
+            a: Premier sommet du triangle.
+            b: Deuxième sommet du triangle.
+            c: Troisième sommet du triangle.
+            point: Le point inséré.
+
+        Returns:
+            float: Le résultat de incircle.
+        """
+        self.stats.incircle_tests += 1
+        return incircle(a, b, c, point)
+
+    def _find_cavity(self, point: tuple[float, float], start: int) -> list[int]:
+        """Parcourt la cavité comme _TriangleMesh, en comptant sa taille.
+
+        Args:
+            point: Le point inséré.
+            start: Le triangle contenant le point.
+
+        Returns:
+            list: Les identifiants des triangles de la cavité.
+        """
+        cavity = super()._find_cavity(point, start)
+        stats = self.stats
+        stats.points += 1
+        stats.cavity_triangles += len(cavity)
+        return cavity
+
+
+def _counted_mesh(vertices: list[tuple[float, float]]) -> _TriangleMesh:
+    """Crée un maillage vide, qui compte son travail si un crochet est installé.
+
+    Args:
+        vertices: Liste des sommets référencés par les triangles.
 
     Returns:
-        bool: True si des points sont coïncidents.
+        _TriangleMesh: Le maillage ordinaire, ou un _CountingTriangleMesh.
+    """
+    if _stats_hook is None:
+        return _TriangleMesh(vertices)
+    return _CountingTriangleMesh(vertices)
+
+
+def _report_stats(mesh: _TriangleMesh) -> None:
+    """Transmet au crochet le travail d'un maillage depuis le dernier envoi.
+
+    Args:
+        mesh: Le maillage; rien n'est transmis s'il ne compte pas son
+              travail ou s'il n'a inséré aucun point.
+    """
+    hook = _stats_hook
+    if hook is not None and isinstance(mesh, _CountingTriangleMesh):
+        stats, mesh.stats = mesh.stats, TriangulationStats()
+        if stats.points:
+            hook(stats)
+
+
+def _insert_all(
+    mesh: _TriangleMesh,
+    indices: Iterable[int],
+    cancel: CancellationToken | None = None
+) -> None:
+    """Insère des sommets un à un, en consultant le jeton d'annulation.
+
+    Args:
+        mesh: Le maillage.
+        indices: Les indices des sommets, dans l'ordre d'insertion.
+        cancel: Jeton consulté toutes les CANCEL_CHECK_INTERVAL
+                insertions, ou None.
+
+    Raises:
+        Cancelled: Si le jeton est annulé ou expiré. Le maillage est alors
+                   incomplet et doit être abandonné.
     """
-    seen = set()
-    for p in points:
-        rounded = (round(p[0], 10), round(p[1], 10))
-        if rounded in seen:
-            return True
-        seen.add(rounded)
-    return False
+    insert = mesh.insert
+    if cancel is None:
+        for i in indices:
+            insert(i)
+        return
+    for count, i in enumerate(indices):
+        if not count % CANCEL_CHECK_INTERVAL:
+            cancel.check()
+        insert(i)
 
 
 def triangulate(
-    point_set: list[tuple[float, float]]
-) -> list[tuple[int, int, int]]:
+    point_set: list[tuple[float, float]],
+    order: str = 'hilbert',
+    workers: int | None = None,
+    cancel: CancellationToken | None = None
+) -> TriangleArray:
     """Triangule un ensemble de points avec l'algorithme de Bowyer-Watson.
 
+    Chaque point est localisé par une marche dans le maillage d'adjacence,
+    puis la cavité des triangles invalidés est explorée de voisin en voisin:
+    le coût d'une insertion ne dépend que de la taille locale de la cavité.
+    Les points sont insérés dans un ordre spatial (voir le module
+    ordering) pour que la marche reste courte. Les points dupliqués sont
+    écartés au préalable (voir deduplicate): les triangles ne référencent
+    que le premier exemplaire de chaque point. Si un crochet est installé
+    (voir set_stats_hook), il reçoit les compteurs du calcul.
+    Un jeton d'annulation est consulté toutes les CANCEL_CHECK_INTERVAL
+    insertions.
+
     Args:
         point_set: Liste de points (x, y) à trianguler.
+        order: Ordre d'insertion: 'hilbert' (par défaut), 'brio' ou
+               'none' pour l'ordre d'arrivée des points.
+        workers: Nombre de processus. Au-delà de 1, les points sont
+                 découpés en bandes triangulées en parallèle (voir le
+                 module parallel).
+        cancel: Jeton d'annulation, ou None. Le découpage en bandes ne le
+                consulte qu'avant le calcul.
 
     Returns:
-        list: Liste de tuples (i1, i2, i3) représentant les indices des
-              sommets de chaque triangle dans le point_set original.
+        TriangleArray: Séquence de tuples (i1, i2, i3) représentant les
+                       indices des sommets de chaque triangle dans le
+                       point_set original.
+
+    Raises:
+        ValueError: Si l'ordre d'insertion est inconnu.
+        Cancelled: Si le jeton est annulé ou expiré en cours de calcul.
     """
-    if len(point_set) < 3:
-        return []
+    if order not in ORDERS:
+        raise ValueError(f"Ordre d'insertion inconnu: {order!r}")
 
-    if _are_collinear(point_set) or _has_duplicates(point_set):
-        return []
+    if len(point_set) < 3:
+        return TriangleArray()
 
-    min_x = min(p[0] for p in point_set)
-    max_x = max(p[0] for p in point_set)
-    min_y = min(p[1] for p in point_set)
-    max_y = max(p[1] for p in point_set)
+    unique, _ = deduplicate(point_set)
+    if len(unique) < len(point_set):
+        points = [point_set[i] for i in unique]
+        triangles = triangulate(points, order, workers, cancel)
+        return TriangleArray(array(_UINT32, map(unique.__getitem__,
+                                                triangles.indices)))
 
-    dx = max_x - min_x
-    dy = max_y - min_y
-    delta_max = max(dx, dy)
-    mid_x = (min_x + max_x) / 2
-    mid_y = (min_y + max_y) / 2
+    if workers is not None and workers > 1:
+        if cancel is not None:
+            cancel.check()
+        from src.triangulator.parallel import triangulate_parallel
+        return triangulate_parallel(point_set, workers, order)
 
-    st_p1 = (mid_x - 20 * delta_max, mid_y - delta_max)
-    st_p2 = (mid_x, mid_y + 20 * delta_max)
-    st_p3 = (mid_x + 20 * delta_max, mid_y - delta_max)
+    if _are_collinear(point_set):
+        return TriangleArray()
 
     n = len(point_set)
-    vertices = list(point_set) + [st_p1, st_p2, st_p3]
+    vertices = list(point_set) + _super_triangle(
+        min(p[0] for p in point_set),
+        max(p[0] for p in point_set),
+        min(p[1] for p in point_set),
+        max(p[1] for p in point_set),
+    )
 
-    triangles = [(n, n + 1, n + 2)]
+    mesh = _counted_mesh(vertices)
+    mesh.add_triangle(n, n + 1, n + 2)
 
-    for i, point in enumerate(point_set):
-        bad_triangles = []
+    _insert_all(mesh, insertion_order(point_set, order), cancel)
 
-        for tri in triangles:
-            p1, p2, p3 = vertices[tri[0]], vertices[tri[1]], vertices[tri[2]]
-            if _point_in_circumcircle(point, p1, p2, p3):
-                bad_triangles.append(tri)
-
-        polygon = []
-        for tri in bad_triangles:
-            edges = [
-                (tri[0], tri[1]),
-                (tri[1], tri[2]),
-                (tri[2], tri[0])
-            ]
-            for edge in edges:
-                edge_reversed = (edge[1], edge[0])
-                is_shared = False
-                for other_tri in bad_triangles:
-                    if other_tri == tri:
-                        continue
-                    other_edges = [
-                        (other_tri[0], other_tri[1]),
-                        (other_tri[1], other_tri[2]),
-                        (other_tri[2], other_tri[0])
-                    ]
-                    if edge in other_edges or edge_reversed in other_edges:
-                        is_shared = True
-                        break
-                if not is_shared:
-                    polygon.append(edge)
-
-        for tri in bad_triangles:
-            triangles.remove(tri)
-
-        for edge in polygon:
-            triangles.append((edge[0], edge[1], i))
-
-    result = []
-    for tri in triangles:
-        if tri[0] < n and tri[1] < n and tri[2] < n:
-            result.append(tri)
-
-    return result
+    _report_stats(mesh)
+    return mesh.triangles(n)
@@ -0,0 +1,215 @@
+"""Triangulation différentielle des PointSets déjà vus.
+
+Un client qui renvoie un PointSet modifié ne change souvent que quelques
+points de sa version précédente. Les envois d'une même série désignent
+cette version par son empreinte (voir service.delta_series); MeshStore
+garde le maillage (DelaunayMesh) des derniers PointSets de séries, par
+empreinte de contenu: les points sont comparés à ceux du maillage de la
+version précédente et seuls les points retirés ou ajoutés sont traités,
+par suppressions et insertions locales.
+
+Une modification coûte bien plus cher par point qu'une triangulation
+complète (chaque point est localisé par une marche dans le maillage):
+au-delà d'une part de points modifiés, ou si un point ajouté sort de la
+boîte du maillage (qui serait alors reconstruit en entier), le PointSet
+est triangulé à nouveau.
+"""
+
+import threading
+from array import array
+from collections import OrderedDict
+
+from src.triangulator.cancellation import CancellationToken
+from src.triangulator.core import triangulate
+from src.triangulator.mesh import DelaunayMesh
+from src.triangulator.ordering import insertion_order
+from src.triangulator.triangles import _UINT32, TriangleArray
+
+PATH_DELTA = 'delta'
+PATH_FULL = 'full'
+
+
+def _remap(
+    mesh: DelaunayMesh,
+    points: list[tuple[float, float]]
+) -> TriangleArray:
+    """Exprime les triangles d'un maillage en indices d'un PointSet.
+
+    Comme dans triangulate, un point répété est représenté par son
+    premier exemplaire dans points.
+
+    Args:
+        mesh: Le maillage, dont les points présents sont ceux de points.
+        points: Les points du PointSet.
+
+    Returns:
+        TriangleArray: Les triangles, en indices de points.
+    """
+    first: dict[tuple[float, float], int] = {}
+    for i, point in enumerate(points):
+        first.setdefault(point, i)
+    remap = array(_UINT32, (
+        0 if point is None else first[point] for point in mesh.vertices
+    ))
+    return TriangleArray(
+        array(_UINT32, map(remap.__getitem__, mesh.triangles().indices))
+    )
+
+
+class MeshStore:
+    """Maillages des derniers PointSets de séries, par empreinte."""
+
+    def __init__(self, max_points: int, max_churn: float) -> None:
+        """Initialise un stock vide.
+
+        Args:
+            max_points: Nombre total maximal de points des maillages
+                        conservés (éviction LRU).
+            max_churn: Part maximale de modifications (points retirés et
+                       ajoutés, rapportés à la taille du PointSet) traitée
+                       par différence.
+        """
+        self.max_points = max_points
+        self.max_churn = max_churn
+        self._lock = threading.Lock()
+        self._meshes: OrderedDict[str, tuple[DelaunayMesh, int]] = (
+            OrderedDict()
+        )
+        self._points = 0
+
+    def _take(self, key: str) -> tuple[DelaunayMesh, int] | None:
+        """Retire un maillage du stock pour le modifier.
+
+        Une requête concurrente dérivée de la même version ne le trouve
+        donc pas et triangule son PointSet entièrement.
+
+        Args:
+            key: L'empreinte du PointSet du maillage.
+
+        Returns:
+            tuple | None: Le maillage et son nombre de points, ou None
+                          s'il est absent.
+        """
+        with self._lock:
+            entry = self._meshes.pop(key, None)
+            if entry is not None:
+                self._points -= entry[1]
+            return entry
+
+    def _keep(self, key: str, mesh: DelaunayMesh, size: int) -> None:
+        """Range un maillage, en évinçant les moins récents.
+
+        Args:
+            key: L'empreinte du PointSet du maillage.
+            mesh: Le maillage.
+            size: Son nombre de points.
+        """
+        with self._lock:
+            previous = self._meshes.pop(key, None)
+            if previous is not None:
+                self._points -= previous[1]
+            while self._meshes and self._points + size > self.max_points:
+                _, (_, evicted) = self._meshes.popitem(last=False)
+                self._points -= evicted
+            self._meshes[key] = (mesh, size)
+            self._points += size
+
+    def _apply(
+        self,
+        mesh: DelaunayMesh,
+        points: list[tuple[float, float]],
+        cancel: CancellationToken | None = None
+    ) -> bool:
+        """Amène un maillage aux points donnés, si la différence est petite.
+
+        Args:
+            mesh: Le maillage à modifier.
+            points: Les nouveaux points.
+            cancel: Jeton d'annulation, consulté avant les suppressions et
+                    pendant les insertions.
+
+        Returns:
+            bool: False si la différence est trop grande ou si un point
+                  ajouté sort de la boîte du maillage (le maillage n'est
+                  alors pas modifié).
+        """
+        # Les indices retirés restent occupés: au-delà d'autant d'indices
+        # libres que de points, une reconstruction compacte le maillage.
+        if len(mesh.vertices) > 2 * len(points):
+            return False
+        removed, added = mesh.diff(points)
+        if len(removed) + len(added) > self.max_churn * len(points):
+            return False
+        if not all(map(mesh.covers, added)):
+            return False
+
+        # Dans l'ordre de la courbe de Hilbert, chaque point est localisé
+        # près du précédent.
+        vertices = mesh.vertices
+        if cancel is not None:
+            cancel.check()
+        for j in insertion_order([vertices[i] for i in removed], 'hilbert'):
+            mesh.remove(removed[j])
+        mesh.insert(added, cancel)
+        return True
+
+    def triangulate(
+        self,
+        key: str,
+        points: list[tuple[float, float]],
+        base: str | None = None,
+        cancel: CancellationToken | None = None
+    ) -> tuple[TriangleArray, str]:
+        """Triangule un PointSet en repartant du maillage de sa version de base.
+
+        Le maillage obtenu est gardé sous l'empreinte du PointSet, pour la
+        version suivante de la série.
+
+        Args:
+            key: L'empreinte du PointSet.
+            points: Ses points.
+            base: L'empreinte de la version dont il dérive, ou None.
+            cancel: Jeton d'annulation, ou None.
+
+        Returns:
+            tuple: Les triangles, comme ceux de triangulate, et le chemin
+                   suivi: PATH_DELTA ou PATH_FULL.
+
+        Raises:
+            Cancelled: Si le jeton est annulé ou expiré. Le maillage en
+                       cours de modification est abandonné.
+        """
+        if len(points) > self.max_points:
+            return triangulate(points, cancel=cancel), PATH_FULL
+
+        entry = None if base is None else self._take(base)
+        if entry is not None:
+            mesh, size = entry
+            try:
+                applied = self._apply(mesh, points, cancel)
+            except RuntimeError:
+                # Maillage laissé incohérent par un échec: il est abandonné.
+                applied = False
+            else:
+                if not applied:
+                    # Maillage intact: il peut encore servir de base.
+                    self._keep(base, mesh, size)
+            if applied:
+                triangles = _remap(mesh, points)
+                self._keep(key, mesh, len(points))
+                return triangles, PATH_DELTA
+
+        # Le maillage reconstruit sert de base à la version suivante.
+        mesh = DelaunayMesh(points, cancel=cancel)
+        triangles = _remap(mesh, points)
+        self._keep(key, mesh, len(points))
+        return triangles, PATH_FULL
+
+    def stats(self) -> dict[str, int]:
+        """Retourne l'occupation du stock.
+
+        Returns:
+            dict: Nombre de maillages et de points conservés.
+        """
+        with self._lock:
+            return {'meshes': len(self._meshes), 'points': self._points}
@@ -0,0 +1,405 @@
+"""Formats de réponse compacts, négociés par Accept et Accept-Encoding.
+
+Le format Triangles de la spécification reste celui par défaut. Un client
+peut en demander d'autres par l'en-tête Accept:
+
+- FORMAT_TRIANGLES_VARINT: le bloc des sommets inchangé, suivi des
+  triangles codés en varints (voir encode_varint_triangles);
+- FORMAT_INDICES et FORMAT_INDICES_VARINT: les triangles seuls, sans le
+  bloc des sommets, pour un client qui a déjà les points (ceux qu'il a
+  envoyés ou qu'il a lus au PointSetManager);
+
+et une compression par Accept-Encoding: gzip, ou zstd si le paquet
+optionnel zstandard est installé.
+
+Chaque format a son propre ETag, comme la réponse étendue avec table des
+doublons, et chaque représentation (format et compression) sa propre
+entrée de cache.
+"""
+
+import gzip
+import struct
+from array import array
+from collections.abc import Sequence
+
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+
+from src.triangulator.serialization import (
+    _LITTLE_ENDIAN,
+    _index_array,
+    _write_point_set,
+    deserialize_point_set,
+    iter_serialize_index_map,
+)
+from src.triangulator.triangles import _UINT32, TriangleArray
+
+# Dépendances optionnelles: zstandard pour la compression zstd, NumPy
+# pour accélérer le codage en varints.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FORMAT_TRIANGLES = 'application/octet-stream'
+FORMAT_TRIANGLES_VARINT = 'application/vnd.triangulator.triangles+varint'
+FORMAT_INDICES = 'application/vnd.triangulator.indices'
+FORMAT_INDICES_VARINT = 'application/vnd.triangulator.indices+varint'
+
+# Le format par défaut en tête: c'est lui que désigne */*.
+FORMATS = (
+    FORMAT_TRIANGLES,
+    FORMAT_TRIANGLES_VARINT,
+    FORMAT_INDICES,
+    FORMAT_INDICES_VARINT,
+)
+
+_FORMAT_TAGS = {
+    FORMAT_TRIANGLES: '',
+    FORMAT_TRIANGLES_VARINT: '+varint',
+    FORMAT_INDICES: '+indices',
+    FORMAT_INDICES_VARINT: '+indices+varint',
+}
+
+# Par ordre de préférence à qualité égale.
+ENCODINGS = ('zstd', 'gzip') if zstandard is not None else ('gzip',)
+
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+
+def negotiate(
+    accept: str | None,
+    accept_encoding: str | None
+) -> tuple[str, str | None]:
+    """Choisit le format et la compression d'une réponse.
+
+    Args:
+        accept: L'en-tête Accept de la requête.
+        accept_encoding: L'en-tête Accept-Encoding de la requête.
+
+    Returns:
+        tuple: Le type de média (FORMAT_TRIANGLES si aucun format connu
+               n'est accepté) et la compression (None pour aucune).
+    """
+    media_type = parse_accept_header(accept, MIMEAccept).best_match(FORMATS)
+    encoding = parse_accept_header(accept_encoding).best_match(ENCODINGS)
+    return media_type or FORMAT_TRIANGLES, encoding
+
+
+def representation_key(key: str, media_type: str) -> str:
+    """Retourne l'empreinte d'un format d'un résultat.
+
+    Une réponse compressée garde l'empreinte de son format, en ETag faible
+    (le contenu décompressé est le même); seule son entrée de cache est
+    distincte.
+
+    Args:
+        key: L'empreinte du résultat au format par défaut.
+        media_type: Le type de média.
+
+    Returns:
+        str: L'empreinte, égale à key pour le format par défaut.
+    """
+    return key + _FORMAT_TAGS[media_type]
+
+
+def _varint_values(indices: array) -> tuple[list[int], array]:
+    """Calcule l'ordre canonique des triangles.
+
+    Args:
+        indices: Les indices des triangles, à plat.
+
+    Returns:
+        tuple: Les positions des triangles, triées de façon stable par
+               plus petit indice, et ces plus petits indices.
+    """
+    mins = array(_UINT32, map(min, indices[0::3], indices[1::3], indices[2::3]))
+    return sorted(range(len(mins)), key=mins.__getitem__), mins
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Ajoute un entier positif codé en varint (7 bits par byte)."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _encode_varints(indices: array) -> bytearray:
+    """Code les écarts des triangles en varints, en Python pur.
+
+    Args:
+        indices: Les indices des triangles, à plat.
+
+    Returns:
+        bytearray: Les varints.
+    """
+    first, second, third = indices[0::3], indices[1::3], indices[2::3]
+    order, _ = _varint_values(indices)
+    out = bytearray()
+    push = out.append
+    previous = 0
+    for t in order:
+        a, b, c = first[t], second[t], third[t]
+        if b < a and b < c:
+            a, b, c = b, c, a
+        elif c < a and c < b:
+            a, b, c = c, a, b
+        step = a - previous
+        previous = a
+        # Chemin rapide: l'écart entre premiers indices tient presque
+        # toujours en un byte, les deux autres en un à trois.
+        if step < 0x80:
+            push(step)
+        else:
+            _write_varint(out, step)
+        for value in (b - a, c - a):
+            if value < 0x80:
+                push(value)
+            elif value < 0x4000:
+                push(value & 0x7F | 0x80)
+                push(value >> 7)
+            else:
+                _write_varint(out, value)
+    return out
+
+
+def _encode_varints_numpy(indices: array) -> bytes:
+    """Code les écarts des triangles en varints, vectorisé avec NumPy.
+
+    Produit exactement les mêmes bytes que _encode_varints.
+
+    Args:
+        indices: Les indices des triangles, à plat.
+
+    Returns:
+        bytes: Les varints.
+    """
+    triangles = np.frombuffer(indices, dtype=np.uint32).reshape(-1, 3)
+    triangles = triangles.astype(np.int64)
+    rows = np.arange(len(triangles))
+    rotation = np.argmin(triangles, axis=1)
+    columns = (rotation[:, None] + np.arange(3)) % 3
+    rotated = triangles[rows[:, None], columns]
+    rotated = rotated[np.argsort(rotated[:, 0], kind='stable')]
+
+    values = np.empty_like(rotated)
+    values[:, 0] = np.diff(rotated[:, 0], prepend=0)
+    values[:, 1:] = rotated[:, 1:] - rotated[:, :1]
+    values = values.ravel()
+
+    lengths = np.ones(len(values), dtype=np.int64)
+    for bits in (7, 14, 21, 28):
+        lengths += values >= (1 << bits)
+    offsets = np.cumsum(lengths) - lengths
+    out = np.zeros(int(lengths.sum()), dtype=np.uint8)
+    for k in range(5):
+        present = lengths > k
+        group = (values[present] >> (7 * k)) & 0x7F
+        group |= np.where(lengths[present] > k + 1, 0x80, 0)
+        out[offsets[present] + k] = group
+    return out.tobytes()
+
+
+def encode_varint_triangles(triangles: Sequence[tuple[int, int, int]]) -> bytes:
+    """Code des triangles en varints.
+
+    Chaque triangle est tourné pour commencer par son plus petit indice,
+    ce qui conserve son orientation, puis les triangles sont triés (de
+    façon stable) selon cet indice. Le premier indice est codé par son
+    écart au premier indice du triangle précédent, les deux autres par
+    leur écart au premier: tous ces écarts sont positifs, et le premier
+    vaut presque toujours 0 ou 1.
+
+    Le bloc produit:
+    - 4 bytes: unsigned int (32-bit) pour le nombre de triangles
+    - 4 bytes: unsigned int (32-bit) pour la taille des varints en bytes
+    - les varints, trois par triangle
+
+    Args:
+        triangles: Séquence de tuples (i1, i2, i3).
+
+    Returns:
+        bytes: Le bloc des triangles.
+    """
+    if not isinstance(triangles, TriangleArray):
+        triangles = TriangleArray.from_triangles(triangles)
+    indices = triangles.indices
+    if np is not None and indices:
+        out = _encode_varints_numpy(indices)
+    else:
+        out = _encode_varints(indices)
+    return struct.pack('<II', len(triangles), len(out)) + out
+
+
+def decode_varint_triangles(
+    data: bytes,
+    offset: int = 0
+) -> tuple[TriangleArray, int]:
+    """Décode un bloc produit par encode_varint_triangles.
+
+    Args:
+        data: Les données.
+        offset: Position du bloc.
+
+    Returns:
+        tuple: Les triangles et la position qui suit le bloc.
+
+    Raises:
+        ValueError: Si le bloc est incomplet ou incohérent.
+    """
+    if len(data) < offset + 8:
+        raise ValueError("Données insuffisantes pour l'en-tête des triangles")
+    count, size = struct.unpack_from('<II', data, offset)
+    start = offset + 8
+    end = start + size
+    if len(data) < end:
+        raise ValueError(
+            f"Données incomplètes: attendu {end} bytes, reçu {len(data)} bytes"
+        )
+
+    values = []
+    value = shift = 0
+    for byte in memoryview(data)[start:end]:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    if shift or len(values) != 3 * count:
+        raise ValueError(f"{len(values)} varints pour {count} triangles")
+
+    indices = array(_UINT32)
+    first = 0
+    for t in range(0, len(values), 3):
+        first += values[t]
+        indices.extend((first, first + values[t + 1], first + values[t + 2]))
+    return TriangleArray(indices), end
+
+
+def encode_body(
+    points: list[tuple[float, float]],
+    triangles: Sequence[tuple[int, int, int]],
+    media_type: str,
+    index_map: list[int] | None = None
+) -> bytes:
+    """Sérialise une triangulation dans le format demandé.
+
+    Args:
+        points: Les sommets.
+        triangles: Les triangles.
+        media_type: Un des FORMATS.
+        index_map: La table des doublons à ajouter après les triangles,
+                   ou None.
+
+    Returns:
+        bytes: La représentation binaire, non compressée.
+    """
+    parts = []
+    if media_type in (FORMAT_TRIANGLES, FORMAT_TRIANGLES_VARINT):
+        vertices = bytearray(4 + 8 * len(points))
+        _write_point_set(vertices, 0, points)
+        parts.append(vertices)
+    if media_type in (FORMAT_TRIANGLES_VARINT, FORMAT_INDICES_VARINT):
+        parts.append(encode_varint_triangles(triangles))
+    else:
+        parts.append(struct.pack('<I', len(triangles)))
+        parts.append(_index_array(triangles))
+    if index_map is not None:
+        parts.extend(iter_serialize_index_map(index_map))
+    return b''.join(parts)
+
+
+def decode_body(
+    data: bytes,
+    media_type: str
+) -> tuple[list[tuple[float, float]] | None, TriangleArray]:
+    """Désérialise une représentation produite par encode_body.
+
+    Une éventuelle table des doublons qui suit les triangles est ignorée.
+
+    Args:
+        data: La représentation binaire, décompressée.
+        media_type: Son type de média.
+
+    Returns:
+        tuple: Les sommets (None pour les formats sans sommets) et les
+               triangles.
+
+    Raises:
+        ValueError: Si les données sont malformées ou incomplètes.
+    """
+    points = None
+    offset = 0
+    if media_type in (FORMAT_TRIANGLES, FORMAT_TRIANGLES_VARINT):
+        points = deserialize_point_set(data)
+        offset = 4 + 8 * len(points)
+
+    if media_type in (FORMAT_TRIANGLES_VARINT, FORMAT_INDICES_VARINT):
+        triangles, _ = decode_varint_triangles(data, offset)
+        return points, triangles
+
+    if len(data) < offset + 4:
+        raise ValueError("Données insuffisantes pour le compteur de triangles")
+    count = struct.unpack_from('<I', data, offset)[0]
+    end = offset + 4 + 12 * count
+    if len(data) < end:
+        raise ValueError(
+            f"Données incomplètes: attendu {end} bytes, reçu {len(data)} bytes"
+        )
+    indices = array(_UINT32)
+    indices.frombytes(memoryview(data)[offset + 4:end])
+    if not _LITTLE_ENDIAN:
+        indices.byteswap()
+    return points, TriangleArray(indices)
+
+
+def compress(data: bytes, encoding: str | None) -> bytes:
+    """Compresse une représentation.
+
+    Args:
+        data: Les données.
+        encoding: 'gzip', 'zstd' ou None.
+
+    Returns:
+        bytes: Les données compressées (inchangées pour None).
+
+    Raises:
+        ValueError: Si la compression n'est pas disponible.
+    """
+    if encoding is None:
+        return bytes(data)
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+    raise ValueError(f'Compression non disponible: {encoding}')
+
+
+def decompress(data: bytes, encoding: str | None) -> bytes:
+    """Décompresse une représentation produite par compress.
+
+    Args:
+        data: Les données compressées.
+        encoding: 'gzip', 'zstd' ou None.
+
+    Returns:
+        bytes: Les données.
+
+    Raises:
+        ValueError: Si la compression n'est pas disponible.
+    """
+    if encoding is None:
+        return bytes(data)
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f'Compression non disponible: {encoding}')
@@ -0,0 +1,39 @@
+"""Erreurs de l'API du Triangulator.
+
+Chaque erreur porte le code interne et le message renvoyés au client dans
+le corps JSON (schéma Error de triangulator.yml), ainsi que le statut HTTP
+et les en-têtes éventuels de la réponse.
+"""
+
+
+class ApiError(Exception):
+    """Erreur destinée au client de l'API."""
+
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        status: int,
+        headers: dict[str, str] | None = None
+    ) -> None:
+        """Initialise l'erreur.
+
+        Args:
+            code: Code interne de l'erreur (ex: 'NOT_FOUND').
+            message: Message lisible par un humain.
+            status: Statut HTTP de la réponse.
+            headers: En-têtes HTTP à ajouter à la réponse.
+        """
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+        self.headers = headers or {}
+
+    def to_dict(self) -> dict[str, str]:
+        """Retourne le corps JSON de l'erreur.
+
+        Returns:
+            dict: Le code et le message de l'erreur.
+        """
+        return {'code': self.code, 'message': self.message}
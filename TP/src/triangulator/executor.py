@@ -0,0 +1,313 @@
+"""Exécution des triangulations hors du thread de requête.
+
+Deux exécuteurs partagent la même interface ``run(payload, timeout)``:
+
+- InlineExecutor triangule dans le thread appelant;
+- ProcessExecutor confie le calcul à un pool de processus, ce qui libère
+  le GIL du processus Flask. Le PointSet est transmis tel quel, en bytes
+  bruts sur un pipe (aucun pickle de tuples), et les indices des triangles
+  reviennent sous la même forme.
+
+Les deux bornent le nombre de travaux acceptés (en cours et en attente)
+et lèvent ExecutorSaturated au-delà. Le pool de processus applique aussi
+un délai par travail: un calcul qui le dépasse est interrompu en tuant
+son processus, remplacé aussitôt. Les deux acceptent un jeton
+d'annulation (voir cancellation): le calcul en ligne le consulte entre
+deux lots d'insertions, le pool tue le processus du calcul annulé.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from array import array
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any, TypeVar
+
+from src.triangulator.cancellation import CancellationToken, Cancelled
+from src.triangulator.core import triangulate
+from src.triangulator.serialization import (
+    _LITTLE_ENDIAN,
+    _index_array,
+    deserialize_point_set,
+)
+from src.triangulator.triangles import _UINT32, TriangleArray
+
+T = TypeVar('T')
+
+_OK = b'\x00'
+_FAILED = b'\x01'
+
+# Intervalle de consultation du jeton d'annulation pendant les attentes du
+# pool de processus, en secondes.
+_CANCEL_POLL_INTERVAL = 0.005
+
+
+class ExecutorSaturated(Exception):
+    """Trop de travaux sont déjà acceptés par l'exécuteur."""
+
+
+class JobTimeout(Exception):
+    """Le travail a dépassé son délai et a été interrompu."""
+
+
+def _wait(
+    ready: Callable[[float | None], bool],
+    timeout: float | None,
+    cancel: CancellationToken | None
+) -> bool:
+    """Attend une condition, en consultant le jeton d'annulation.
+
+    Args:
+        ready: Attend la condition au plus le délai donné (None: sans
+               limite) et indique si elle est remplie.
+        timeout: Délai maximal de l'attente, en secondes, ou None.
+        cancel: Jeton consulté toutes les _CANCEL_POLL_INTERVAL secondes,
+                ou None.
+
+    Returns:
+        bool: False si le délai est écoulé avant la condition.
+
+    Raises:
+        Cancelled: Si le jeton est annulé ou expiré pendant l'attente.
+    """
+    if cancel is None:
+        return ready(timeout)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        cancel.check()
+        step = _CANCEL_POLL_INTERVAL
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            step = min(step, remaining)
+        if ready(step):
+            return True
+
+
+def _worker_main(conn: Connection) -> None:
+    """Boucle d'un processus de calcul.
+
+    Chaque message reçu est un PointSet binaire; la réponse est un octet
+    de statut suivi des indices des triangles (ou du message d'erreur).
+
+    Args:
+        conn: L'extrémité du pipe côté processus de calcul.
+    """
+    while True:
+        try:
+            payload = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+        try:
+            triangles = triangulate(deserialize_point_set(payload))
+            conn.send_bytes(_OK + _index_array(triangles).tobytes())
+        except Exception as e:
+            conn.send_bytes(_FAILED + str(e).encode())
+
+
+class InlineExecutor:
+    """Exécuteur qui triangule dans le thread appelant."""
+
+    def __init__(self, max_pending: int) -> None:
+        """Initialise l'exécuteur.
+
+        Args:
+            max_pending: Nombre maximal de triangulations simultanées.
+        """
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def run(
+        self,
+        payload: bytes,
+        timeout: float | None = None,
+        point_set: list[tuple[float, float]] | None = None,
+        cancel: CancellationToken | None = None
+    ) -> TriangleArray:
+        """Triangule un PointSet binaire.
+
+        Args:
+            payload: Le PointSet au format binaire.
+            timeout: Ignoré: seul le jeton d'annulation interrompt un
+                     calcul dans le thread appelant.
+            point_set: Les points déjà désérialisés, pour éviter de
+                       relire payload.
+            cancel: Jeton d'annulation consulté par triangulate, ou None.
+
+        Returns:
+            TriangleArray: Les triangles (i1, i2, i3).
+
+        Raises:
+            ExecutorSaturated: Si trop de triangulations sont en cours.
+            Cancelled: Si le jeton est annulé ou expiré.
+        """
+        if point_set is None:
+            point_set = deserialize_point_set(payload)
+        return self.call(lambda: triangulate(point_set, cancel=cancel))
+
+    def call(self, fn: Callable[..., T], *args: Any) -> T:
+        """Exécute un calcul quelconque sous la même limite de travaux.
+
+        Args:
+            fn: Le calcul.
+            *args: Ses arguments.
+
+        Returns:
+            Le résultat du calcul.
+
+        Raises:
+            ExecutorSaturated: Si trop de calculs sont en cours.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise ExecutorSaturated()
+        try:
+            return fn(*args)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Ne fait rien: l'exécuteur ne possède aucune ressource."""
+
+
+class _Worker:
+    """Processus de calcul et son extrémité de pipe côté parent."""
+
+    __slots__ = ('process', 'conn')
+
+    def __init__(self, context: multiprocessing.context.BaseContext) -> None:
+        """Démarre un processus de calcul.
+
+        Args:
+            context: Contexte multiprocessing utilisé pour le démarrage.
+        """
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn,), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        """Arrête le processus immédiatement."""
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ProcessExecutor:
+    """Exécuteur qui confie les triangulations à un pool de processus."""
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        start_method: str = 'spawn'
+    ) -> None:
+        """Démarre le pool de processus.
+
+        Args:
+            workers: Nombre de processus de calcul.
+            queue_size: Nombre de travaux qui peuvent attendre un processus
+                        libre; au-delà, les travaux sont refusés.
+            start_method: Méthode de démarrage des processus.
+        """
+        self._context = multiprocessing.get_context(start_method)
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._workers = [_Worker(self._context) for _ in range(workers)]
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        """Tue un processus et le remplace par un nouveau.
+
+        Args:
+            worker: Le processus à remplacer.
+
+        Returns:
+            _Worker: Le nouveau processus.
+        """
+        worker.kill()
+        replacement = _Worker(self._context)
+        self._workers[self._workers.index(worker)] = replacement
+        return replacement
+
+    def run(
+        self,
+        payload: bytes,
+        timeout: float | None = None,
+        point_set: list[tuple[float, float]] | None = None,
+        cancel: CancellationToken | None = None
+    ) -> TriangleArray:
+        """Triangule un PointSet binaire dans un processus du pool.
+
+        Args:
+            payload: Le PointSet au format binaire.
+            timeout: Délai maximal du calcul (attente d'un processus libre
+                     comprise), en secondes. Si None, pas de limite.
+            point_set: Ignoré: le processus de calcul relit payload.
+            cancel: Jeton d'annulation, ou None. Un calcul annulé est
+                    interrompu en tuant son processus, remplacé aussitôt.
+
+        Returns:
+            TriangleArray: Les triangles (i1, i2, i3).
+
+        Raises:
+            ExecutorSaturated: Si trop de travaux sont déjà acceptés.
+            JobTimeout: Si le calcul n'est pas terminé dans le délai.
+            Cancelled: Si le jeton est annulé ou expiré.
+            RuntimeError: Si la triangulation a échoué.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise ExecutorSaturated()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            idle = []
+
+            def take_idle(wait: float | None) -> bool:
+                try:
+                    idle.append(self._idle.get(timeout=wait))
+                except queue.Empty:
+                    return False
+                return True
+
+            if not _wait(take_idle, timeout, cancel):
+                raise JobTimeout()
+            worker = idle[0]
+
+            try:
+                worker.conn.send_bytes(payload)
+                if deadline is not None:
+                    timeout = max(0.0, deadline - time.monotonic())
+                try:
+                    replied = _wait(worker.conn.poll, timeout, cancel)
+                except Cancelled:
+                    worker = self._replace(worker)
+                    raise
+                if not replied:
+                    worker = self._replace(worker)
+                    raise JobTimeout()
+                reply = worker.conn.recv_bytes()
+            except (EOFError, OSError) as e:
+                worker = self._replace(worker)
+                raise RuntimeError(f'Processus de calcul perdu: {e}') from None
+            finally:
+                self._idle.put(worker)
+        finally:
+            self._slots.release()
+
+        if reply[:1] != _OK:
+            raise RuntimeError(reply[1:].decode(errors='replace'))
+
+        indices = array(_UINT32)
+        indices.frombytes(reply[1:])
+        if not _LITTLE_ENDIAN:
+            indices.byteswap()
+        return TriangleArray(indices)
+
+    def close(self) -> None:
+        """Arrête tous les processus du pool."""
+        for worker in self._workers:
+            worker.kill()
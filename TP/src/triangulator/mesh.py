@@ -0,0 +1,365 @@
+"""Triangulation incrémentale: insertion et suppression de points.
+
+DelaunayMesh conserve l'état que triangulate construit puis abandonne:
+les sommets, le super-triangle et le maillage d'adjacence. Insérer ou
+retirer quelques points ne coûte alors que le travail local de
+Bowyer-Watson (ou de la retriangulation du trou), au lieu d'une
+triangulation complète.
+
+Les points sont numérotés dans l'ordre d'insertion et un indice n'est
+jamais réutilisé: après remove(i), les triangles ne référencent plus i,
+mais les autres indices ne changent pas. Comme dans triangulate, un point
+qui coïncide avec un point présent n'entre pas dans le maillage: les
+triangles référencent son premier exemplaire.
+
+Le super-triangle est celui de triangulate, dimensionné sur la boîte
+englobante des points: tant que les points insérés restent dans cette
+boîte élargie d'un quart, le maillage est complété sur place; au-delà, il
+est reconstruit avec un super-triangle plus grand, au coût d'une
+triangulation complète.
+"""
+
+import math
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+
+from src.triangulator.cancellation import CancellationToken
+from src.triangulator.core import (
+    _counted_mesh,
+    _insert_all,
+    _report_stats,
+    _super_triangle,
+    _TriangleMesh,
+)
+from src.triangulator.ordering import ORDERS, insertion_order
+from src.triangulator.serialization import deserialize_triangles, serialize_triangles
+from src.triangulator.triangles import _UINT32, TriangleArray
+
+# Les sommets du super-triangle occupent les premiers indices du maillage.
+_SUPER = 3
+
+_REMOVED = (math.nan, math.nan)
+
+
+def _float32(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """Arrondit des points aux floats 32 bits du format binaire.
+
+    Args:
+        points: Les points à arrondir.
+
+    Returns:
+        list: Les points arrondis.
+    """
+    floats = array('f', [c for p in points for c in p]).tolist()
+    return list(zip(floats[0::2], floats[1::2]))
+
+
+def _super_corners(
+    min_x: float,
+    max_x: float,
+    min_y: float,
+    max_y: float
+) -> list[tuple[float, float]]:
+    """Calcule le super-triangle d'une boîte, en floats 32 bits.
+
+    Les sommets doivent survivre tels quels à to_bytes. Loin de l'origine,
+    l'arrondi en 32 bits peut dépasser la taille de la boîte et déformer le
+    super-triangle au point de ne plus l'englober: la boîte est alors
+    élargie jusqu'à ce que l'arrondi devienne négligeable.
+
+    Args:
+        min_x: Abscisse minimale de la boîte.
+        max_x: Abscisse maximale de la boîte.
+        min_y: Ordonnée minimale de la boîte.
+        max_y: Ordonnée maximale de la boîte.
+
+    Returns:
+        list: Les trois sommets du super-triangle.
+    """
+    while True:
+        corners = _super_triangle(min_x, max_x, min_y, max_y)
+        rounded = _float32(corners)
+        extent = max(max_x - min_x, max_y - min_y)
+        if all(
+            abs(a[0] - b[0]) <= extent / 16 and abs(a[1] - b[1]) <= extent / 16
+            for a, b in zip(corners, rounded)
+        ):
+            return rounded
+        min_x, max_x = min_x - extent, max_x + extent
+        min_y, max_y = min_y - extent, max_y + extent
+
+
+class DelaunayMesh:
+    """Triangulation de Delaunay modifiable point par point."""
+
+    __slots__ = ('order', '_points', '_twins', '_mesh', '_box')
+
+    def __init__(
+        self,
+        points: Iterable[tuple[float, float]] = (),
+        order: str = 'hilbert',
+        cancel: CancellationToken | None = None
+    ) -> None:
+        """Triangule un premier ensemble de points.
+
+        Args:
+            points: Les points initiaux.
+            order: Ordre d'insertion des lots de points (voir ordering).
+            cancel: Jeton d'annulation de la triangulation initiale.
+
+        Raises:
+            ValueError: Si l'ordre d'insertion est inconnu.
+            Cancelled: Si le jeton est annulé ou expiré.
+        """
+        if order not in ORDERS:
+            raise ValueError(f"Ordre d'insertion inconnu: {order!r}")
+        self.order = order
+        self._points: list[tuple[float, float] | None] = []
+        self._twins: dict[tuple[float, float], list[int]] = {}
+        self._mesh: _TriangleMesh | None = None
+        self._box: tuple[float, float, float, float] | None = None
+        self.insert(points, cancel)
+
+    @property
+    def vertices(self) -> list[tuple[float, float] | None]:
+        """Les points, par indice (None pour un point retiré)."""
+        return self._points
+
+    @property
+    def super_triangle(self) -> list[tuple[float, float]]:
+        """Les sommets du super-triangle (vide si aucun point)."""
+        if self._mesh is None:
+            return []
+        return self._mesh.vertices[:_SUPER]
+
+    def covers(self, point: tuple[float, float]) -> bool:
+        """Indique si un point peut être inséré sans reconstruction."""
+        if self._box is None:
+            return False
+        min_x, max_x, min_y, max_y = self._box
+        return min_x <= point[0] <= max_x and min_y <= point[1] <= max_y
+
+    def _rebuild(self, cancel: CancellationToken | None = None) -> None:
+        """Reconstruit le maillage sur un super-triangle adapté aux points.
+
+        Args:
+            cancel: Jeton d'annulation, ou None.
+        """
+        live = [twins[0] for twins in self._twins.values()]
+        points = [self._points[i] for i in live]
+        min_x = min(p[0] for p in points)
+        max_x = max(p[0] for p in points)
+        min_y = min(p[1] for p in points)
+        max_y = max(p[1] for p in points)
+        if min_x == max_x and min_y == max_y:
+            min_x, max_x = min_x - 1.0, max_x + 1.0
+        corners = _super_corners(min_x, max_x, min_y, max_y)
+        margin = max(max_x - min_x, max_y - min_y) / 4
+        self._box = (min_x - margin, max_x + margin,
+                     min_y - margin, max_y + margin)
+
+        mesh = _counted_mesh(corners + [
+            _REMOVED if p is None else p for p in self._points
+        ])
+        mesh.add_triangle(0, 1, 2)
+        _insert_all(mesh, (
+            live[j] + _SUPER for j in insertion_order(points, self.order)
+        ), cancel)
+        self._mesh = mesh
+
+    def insert(
+        self,
+        points: Iterable[tuple[float, float]],
+        cancel: CancellationToken | None = None
+    ) -> list[int]:
+        """Insère des points dans la triangulation.
+
+        Args:
+            points: Les points à insérer.
+            cancel: Jeton d'annulation, ou None.
+
+        Returns:
+            list: Les indices attribués aux points, dans l'ordre donné.
+
+        Raises:
+            Cancelled: Si le jeton est annulé ou expiré. Le maillage est
+                       alors incohérent et doit être abandonné.
+        """
+        first = len(self._points)
+        added = [(x, y) for x, y in points]
+        self._points.extend(added)
+
+        fresh = []
+        for i, point in enumerate(added, first):
+            twins = self._twins.setdefault(point, [])
+            twins.append(i)
+            if len(twins) == 1:
+                fresh.append(i)
+
+        if fresh:
+            if self._mesh is None or not all(
+                self.covers(self._points[i]) for i in fresh
+            ):
+                self._rebuild(cancel)
+            else:
+                mesh = self._mesh
+                mesh.vertices.extend(added)
+                fresh_points = [self._points[i] for i in fresh]
+                _insert_all(mesh, (
+                    fresh[j] + _SUPER
+                    for j in insertion_order(fresh_points, self.order)
+                ), cancel)
+            _report_stats(self._mesh)
+        elif self._mesh is not None:
+            self._mesh.vertices.extend(added)
+
+        return list(range(first, len(self._points)))
+
+    def remove(self, index: int) -> None:
+        """Retire un point et retriangule le trou qu'il laisse.
+
+        Si un autre exemplaire du même point est présent, il prend sa
+        place dans le maillage.
+
+        Args:
+            index: L'indice du point à retirer.
+
+        Raises:
+            IndexError: Si aucun point n'est présent à cet indice.
+        """
+        if not 0 <= index < len(self._points) or self._points[index] is None:
+            raise IndexError(f"Aucun point à l'indice {index}")
+
+        point = self._points[index]
+        self._points[index] = None
+        twins = self._twins[point]
+        representative = twins[0] == index
+        twins.remove(index)
+        if not twins:
+            del self._twins[point]
+
+        if representative:
+            self._mesh.remove(index + _SUPER)
+            if twins:
+                self._mesh.insert(twins[0] + _SUPER)
+
+    def diff(
+        self,
+        points: Iterable[tuple[float, float]]
+    ) -> tuple[list[int], list[tuple[float, float]]]:
+        """Compare les points présents à un nouvel ensemble de points.
+
+        Les doublons sont comptés: un point présent deux fois ici et une
+        fois dans points donne une suppression.
+
+        Args:
+            points: Le nouvel ensemble de points.
+
+        Returns:
+            tuple: Les indices à retirer et les points à insérer pour que
+                   les points présents soient ceux de points.
+        """
+        counts = Counter(points)
+        removed = []
+        added = []
+        for point, twins in self._twins.items():
+            extra = len(twins) - counts.pop(point, 0)
+            if extra > 0:
+                # Les derniers exemplaires d'abord: retirer le premier
+                # obligerait à insérer un suivant à sa place.
+                removed.extend(reversed(twins[-extra:]))
+            else:
+                added.extend([point] * -extra)
+        for point, count in counts.items():
+            added.extend([point] * count)
+        return removed, added
+
+    def triangles(self) -> TriangleArray:
+        """Retourne les triangles entre points présents.
+
+        Returns:
+            TriangleArray: Les indices des sommets de chaque triangle.
+        """
+        if self._mesh is None:
+            return TriangleArray()
+        return self._mesh.triangles(first=_SUPER)
+
+    def to_bytes(self) -> bytes:
+        """Sérialise l'état complet du maillage au format Triangles.
+
+        Les sommets sont les points, par indice (NaN pour un point retiré),
+        suivis des trois sommets du super-triangle; les triangles incluent
+        ceux qui touchent le super-triangle. Les coordonnées sont écrites
+        en floats 32 bits, comme dans tout PointSet: la restauration n'est
+        exacte que pour des points représentables ainsi.
+
+        Returns:
+            bytes: La représentation binaire.
+        """
+        if self._mesh is None:
+            return serialize_triangles([], TriangleArray())
+
+        count = len(self._points)
+        mesh = self._mesh
+        shift = [count + k for k in range(_SUPER)]
+        indices = array(_UINT32)
+        tri_vertices = mesh.tri_vertices
+        for t, alive in enumerate(mesh.alive):
+            if alive:
+                indices.extend(
+                    v - _SUPER if v >= _SUPER else shift[v]
+                    for v in tri_vertices[3 * t:3 * t + 3]
+                )
+        vertices = [_REMOVED if p is None else p for p in self._points]
+        return serialize_triangles(
+            vertices + mesh.vertices[:_SUPER], TriangleArray(indices)
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes, order: str = 'hilbert') -> 'DelaunayMesh':
+        """Restaure un maillage sérialisé par to_bytes.
+
+        Args:
+            data: La représentation binaire.
+            order: Ordre d'insertion des lots de points suivants.
+
+        Returns:
+            DelaunayMesh: Le maillage restauré.
+
+        Raises:
+            ValueError: Si les données sont malformées ou ne décrivent pas
+                        un maillage sérialisé par to_bytes.
+        """
+        vertices, triangles = deserialize_triangles(data)
+        mesh = cls(order=order)
+        if not vertices and not triangles:
+            return mesh
+        if len(vertices) < _SUPER or not triangles:
+            raise ValueError("Aucun super-triangle dans les données")
+
+        count = len(vertices) - _SUPER
+        corners = vertices[count:]
+        inner = _TriangleMesh(corners + vertices[:count])
+        created = [
+            inner.add_triangle(*(v + _SUPER if v < count else v - count
+                                 for v in triangle))
+            for triangle in triangles
+        ]
+        inner.stitch(created, {})
+
+        for i, point in enumerate(vertices[:count]):
+            if math.isnan(point[0]):
+                mesh._points.append(None)
+            else:
+                mesh._points.append(point)
+                mesh._twins.setdefault(point, []).append(i)
+
+        # Boîte englobante de départ, élargie d'un quart (voir _rebuild).
+        delta = (corners[2][0] - corners[0][0]) / 40
+        mid_x = corners[1][0]
+        mid_y = corners[0][1] + delta
+        half = 0.75 * delta
+        mesh._box = (mid_x - half, mid_x + half, mid_y - half, mid_y + half)
+        mesh._mesh = inner
+        return mesh
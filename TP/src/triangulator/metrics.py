@@ -0,0 +1,313 @@
+"""Mesures du service au format texte de Prometheus.
+
+Metrics regroupe les mesures d'une application:
+
+- la durée de chaque étape d'une triangulation (histogrammes par étape:
+  récupération auprès du PointSetManager, désérialisation, calcul,
+  sérialisation);
+- la taille des PointSets reçus et des réponses produites;
+- l'attente des triangulations dans chaque voie de l'ordonnanceur;
+- le nombre d'erreurs renvoyées, par code d'erreur;
+- les compteurs internes de triangulate (tests in-circle, taille des
+  cavités, points insérés), s'ils sont activés (voir
+  core.set_stats_hook).
+
+render produit le texte servi par l'endpoint /metrics. Les mesures sont
+gardées en mémoire, dans le processus du service, sans dépendance.
+"""
+
+import math
+import threading
+import time
+from collections.abc import Iterator, Mapping
+
+from src.triangulator.core import TriangulationStats
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+STAGE_FETCH = 'fetch'
+STAGE_DESERIALIZE = 'deserialize'
+STAGE_TRIANGULATE = 'triangulate'
+STAGE_SERIALIZE = 'serialize'
+
+PAYLOAD_POINT_SET = 'point_set'
+PAYLOAD_TRIANGLES = 'triangles'
+
+# Bornes des histogrammes: de 1 ms à 1 min, et de 1 Kio à 256 Mio.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = tuple(1024 * 4 ** k for k in range(10))
+
+
+def _format_value(value: float) -> str:
+    """Formate une valeur comme le fait le client Prometheus."""
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    """Formate des étiquettes: ``{nom="valeur",...}``, vide si aucune."""
+    if not labels:
+        return ''
+    pairs = (
+        '{}="{}"'.format(name, value.replace('\\', r'\\')
+                         .replace('"', r'\"').replace('\n', r'\n'))
+        for name, value in labels.items()
+    )
+    return '{' + ','.join(pairs) + '}'
+
+
+class _Counter:
+    """Compteur, éventuellement décliné selon une étiquette."""
+
+    __slots__ = ('name', 'help', 'label', 'values')
+
+    def __init__(self, name: str, help: str, label: str | None = None) -> None:
+        """Initialise le compteur à zéro.
+
+        Args:
+            name: Nom de la mesure.
+            help: Description de la mesure.
+            label: Nom de l'étiquette, ou None pour un compteur unique.
+        """
+        self.name = name
+        self.help = help
+        self.label = label
+        self.values: dict[str, float] = {} if label else {'': 0}
+
+    def inc(self, amount: float = 1, value: str = '') -> None:
+        """Incrémente le compteur (appelant détenteur du verrou).
+
+        Args:
+            amount: L'incrément.
+            value: La valeur de l'étiquette.
+        """
+        self.values[value] = self.values.get(value, 0) + amount
+
+    def lines(self) -> Iterator[str]:
+        """Produit les lignes de la mesure."""
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} counter'
+        for value, count in sorted(self.values.items()):
+            labels = {self.label: value} if self.label else {}
+            yield f'{self.name}{_format_labels(labels)} {_format_value(count)}'
+
+
+class _Histogram:
+    """Histogramme cumulatif décliné selon une étiquette."""
+
+    __slots__ = ('name', 'help', 'label', 'buckets', 'series')
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label: str,
+        buckets: tuple[float, ...]
+    ) -> None:
+        """Initialise un histogramme vide.
+
+        Args:
+            name: Nom de la mesure.
+            help: Description de la mesure.
+            label: Nom de l'étiquette.
+            buckets: Bornes supérieures des intervalles, croissantes.
+        """
+        self.name = name
+        self.help = help
+        self.label = label
+        self.buckets = buckets
+        # Par valeur d'étiquette: effectifs des intervalles (le dernier est
+        # +Inf), puis somme des observations.
+        self.series: dict[str, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: str, amount: float) -> None:
+        """Enregistre une observation (appelant détenteur du verrou).
+
+        Args:
+            value: La valeur de l'étiquette.
+            amount: La valeur observée.
+        """
+        series = self.series.get(value)
+        if series is None:
+            series = self.series[value] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        for i, bound in enumerate(self.buckets):
+            if amount <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+        total[0] += amount
+
+    def lines(self) -> Iterator[str]:
+        """Produit les lignes de la mesure (effectifs cumulés)."""
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} histogram'
+        for value, (counts, total) in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = {self.label: value, 'le': _format_value(bound)}
+                yield (f'{self.name}_bucket{_format_labels(labels)} '
+                       f'{cumulative}')
+            labels = _format_labels({self.label: value})
+            yield f'{self.name}_sum{labels} {_format_value(total[0])}'
+            yield f'{self.name}_count{labels} {cumulative}'
+
+
+class Metrics:
+    """Mesures d'une application, partagées entre ses threads."""
+
+    def __init__(self) -> None:
+        """Initialise des mesures vides."""
+        self._lock = threading.Lock()
+        self.stages = _Histogram(
+            'triangulator_stage_duration_seconds',
+            "Durée de chaque étape d'une triangulation.", 'stage',
+            LATENCY_BUCKETS,
+        )
+        self.queue_waits = _Histogram(
+            'triangulator_queue_wait_seconds',
+            "Attente d'une triangulation dans sa voie de l'ordonnanceur.",
+            'lane', LATENCY_BUCKETS,
+        )
+        self.payloads = _Histogram(
+            'triangulator_payload_size_bytes',
+            'Taille des PointSets reçus et des triangulations produites.',
+            'kind', SIZE_BUCKETS,
+        )
+        self.errors = _Counter(
+            'triangulator_errors_total', "Erreurs renvoyées, par code.", 'code'
+        )
+        self.triangulations = _Counter(
+            'triangulator_instrumented_triangulations_total',
+            'Triangulations dont les compteurs internes sont mesurés.',
+        )
+        self.points = _Counter(
+            'triangulator_points_inserted_total',
+            'Points insérés par les triangulations mesurées.',
+        )
+        self.incircle_tests = _Counter(
+            'triangulator_incircle_tests_total',
+            'Tests in-circle des triangulations mesurées.',
+        )
+        self.cavity_triangles = _Counter(
+            'triangulator_cavity_triangles_total',
+            'Triangles des cavités des triangulations mesurées (taille '
+            'moyenne: rapporter à triangulator_points_inserted_total).',
+        )
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """Enregistre la durée d'une étape.
+
+        Args:
+            stage: L'étape (STAGE_*).
+            seconds: Sa durée en secondes.
+        """
+        with self._lock:
+            self.stages.observe(stage, seconds)
+
+    def observe_queue_wait(self, lane: str, seconds: float) -> None:
+        """Enregistre l'attente d'une triangulation avant son exécution.
+
+        Args:
+            lane: La voie de l'ordonnanceur (scheduler.LANE_*).
+            seconds: L'attente en secondes.
+        """
+        with self._lock:
+            self.queue_waits.observe(lane, seconds)
+
+    def observe_payload(self, kind: str, size: int) -> None:
+        """Enregistre la taille d'un PointSet ou d'une réponse.
+
+        Args:
+            kind: PAYLOAD_POINT_SET ou PAYLOAD_TRIANGLES.
+            size: La taille en bytes.
+        """
+        with self._lock:
+            self.payloads.observe(kind, size)
+
+    def count_error(self, code: str) -> None:
+        """Compte une erreur renvoyée au client.
+
+        Args:
+            code: Le code de l'erreur (voir ApiError).
+        """
+        with self._lock:
+            self.errors.inc(1, code)
+
+    def observe_triangulation(self, stats: TriangulationStats) -> None:
+        """Cumule les compteurs internes d'une triangulation.
+
+        Cette méthode est le crochet passé à core.set_stats_hook.
+
+        Args:
+            stats: Les compteurs de la triangulation.
+        """
+        with self._lock:
+            self.triangulations.inc()
+            self.points.inc(stats.points)
+            self.incircle_tests.inc(stats.incircle_tests)
+            self.cavity_triangles.inc(stats.cavity_triangles)
+
+    def timed(
+        self,
+        stage: str,
+        chunks: Iterator[bytes],
+        elapsed: float = 0.0
+    ) -> Iterator[bytes]:
+        """Relaie des morceaux en mesurant le temps passé à les produire.
+
+        Le temps passé par le consommateur entre deux morceaux (envoi au
+        client) n'est pas compté. La durée n'est enregistrée que si tous
+        les morceaux ont été produits.
+
+        Args:
+            stage: L'étape mesurée.
+            chunks: Les morceaux, produits à la demande.
+            elapsed: Durée déjà passée dans l'étape, en secondes.
+
+        Yields:
+            bytes: Les morceaux, inchangés.
+        """
+        iterator = iter(chunks)
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                elapsed += time.perf_counter() - start
+            yield chunk
+        self.observe_stage(stage, elapsed)
+
+    def render(self, gauges: Mapping[str, Mapping[str, int]] | None = None) -> str:
+        """Produit les mesures au format texte de Prometheus.
+
+        Args:
+            gauges: Valeurs instantanées à ajouter, par composant (ex:
+                    ``{'cache': cache.stats()}`` donne
+                    ``triangulator_cache_hits``...).
+
+        Returns:
+            str: Le texte servi par /metrics.
+        """
+        with self._lock:
+            lines = [
+                line
+                for metric in (self.stages, self.queue_waits, self.payloads,
+                               self.errors, self.triangulations, self.points,
+                               self.incircle_tests, self.cavity_triangles)
+                for line in metric.lines()
+            ]
+        for component, values in (gauges or {}).items():
+            for name, value in values.items():
+                metric = f'triangulator_{component}_{name}'
+                lines.append(f'# TYPE {metric} gauge')
+                lines.append(f'{metric} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
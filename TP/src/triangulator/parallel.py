@@ -0,0 +1,289 @@
+"""Triangulation parallèle par découpage en bandes.
+
+Les points sont triés selon x puis répartis en bandes verticales de même
+effectif, triangulées chacune dans un processus séparé avec le moteur
+séquentiel. Le résultat est ensuite recollé le long des coutures:
+
+- un triangle d'une bande dont le cercle circonscrit reste à l'intérieur
+  de la bande (sans atteindre les points des bandes voisines) est un
+  triangle de Delaunay de l'ensemble complet: il est « certifié »;
+- les autres triangles de Delaunay ont tous leurs sommets parmi les points
+  de couture: sommets de triangles non certifiés, sommets du bord d'une
+  bande et points qu'aucun triangle de leur bande ne couvre;
+- la triangulation de ces points de couture fournit donc tous les
+  triangles manquants. Chacun n'est retenu que s'il n'aurait pas pu être
+  certifié et que son cercle ne contient aucun autre point, ce qu'une
+  grille régulière permet de vérifier localement.
+
+Le résultat est une triangulation de Delaunay de l'ensemble complet. Elle
+coïncide avec celle du moteur séquentiel, à deux différences près: les
+diagonales des points cocirculaires (une grille, par exemple) peuvent être
+choisies autrement, et quelques triangles de l'enveloppe convexe que le
+super-triangle du moteur séquentiel fait perdre sont ici retrouvés.
+"""
+
+import bisect
+import math
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from src.triangulator.core import (
+    _are_collinear,
+    _circumcenter,
+    triangulate,
+)
+from src.triangulator.predicates import incircle
+from src.triangulator.triangles import _UINT32, TriangleArray
+
+# En dessous de cet effectif par bande, le découpage ne paie pas.
+MIN_STRIP_POINTS = 64
+
+# Marge relative qui rend la certification prudente face aux arrondis.
+_CERTIFY_TOLERANCE = 1e-9
+
+
+def _is_local(
+    circle: tuple[tuple[float, float], float] | None,
+    left: float,
+    right: float,
+    tolerance: float
+) -> bool:
+    """Indique si un cercle circonscrit reste strictement dans une bande.
+
+    Args:
+        circle: (centre, rayon au carré), ou None pour un triangle dégénéré.
+        left: Abscisse du dernier point de la bande de gauche.
+        right: Abscisse du premier point de la bande de droite.
+        tolerance: Marge absolue exigée de part et d'autre.
+
+    Returns:
+        bool: True si aucun point d'une autre bande ne peut être dans le
+              cercle.
+    """
+    if circle is None:
+        return False
+    (ux, _), squared_radius = circle
+    radius = math.sqrt(squared_radius)
+    return ux - radius > left + tolerance and ux + radius < right - tolerance
+
+
+def _triangulate_strip(
+    coords: bytes,
+    left: float,
+    right: float,
+    order: str,
+    tolerance: float
+) -> tuple[bytes, bytes]:
+    """Triangule une bande et sépare les triangles certifiés de la couture.
+
+    Args:
+        coords: Les coordonnées x0, y0, x1, y1... de la bande, en float64.
+        left: Abscisse du dernier point de la bande de gauche.
+        right: Abscisse du premier point de la bande de droite.
+        order: Ordre d'insertion des points.
+        tolerance: Marge de certification.
+
+    Returns:
+        tuple: Les indices (locaux) des triangles certifiés, à plat, et
+               ceux des points de couture, en uint32 natifs.
+    """
+    values = array('d')
+    values.frombytes(coords)
+    points = list(zip(values[0::2], values[1::2]))
+    triangles = triangulate(points, order=order)
+
+    edges = set()
+    for a, b, c in triangles:
+        edges.add((a, b))
+        edges.add((b, c))
+        edges.add((c, a))
+
+    certified = array(_UINT32)
+    seam = set()
+    covered = set()
+    for a, b, c in triangles:
+        covered.update((a, b, c))
+        circle = _circumcenter(points[a], points[b], points[c])
+        if _is_local(circle, left, right, tolerance):
+            certified.extend((a, b, c))
+        else:
+            seam.update((a, b, c))
+        for u, v in ((a, b), (b, c), (c, a)):
+            if (v, u) not in edges:
+                seam.update((u, v))
+
+    seam.update(i for i in range(len(points)) if i not in covered)
+    return certified.tobytes(), array(_UINT32, sorted(seam)).tobytes()
+
+
+class _Grid:
+    """Grille régulière de points pour les recherches dans un disque."""
+
+    def __init__(self, points: list[tuple[float, float]]) -> None:
+        """Répartit les points dans des cellules d'environ deux points.
+
+        Args:
+            points: Les points à indexer.
+        """
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        self.min_x = min(xs)
+        self.min_y = min(ys)
+        extent = max(max(xs) - self.min_x, max(ys) - self.min_y) or 1.0
+        self.size = max(extent / math.sqrt(len(points) / 2), 1e-300)
+        self.columns = int((max(xs) - self.min_x) / self.size) + 1
+        self.rows = int((max(ys) - self.min_y) / self.size) + 1
+
+        self.cells: dict[int, list[int]] = {}
+        for i, (x, y) in enumerate(points):
+            key = self._column(x) * self.rows + self._row(y)
+            self.cells.setdefault(key, []).append(i)
+
+    def _column(self, x: float) -> int:
+        """Retourne la colonne (bornée à la grille) d'une abscisse."""
+        return min(max(int((x - self.min_x) / self.size), 0), self.columns - 1)
+
+    def _row(self, y: float) -> int:
+        """Retourne la ligne (bornée à la grille) d'une ordonnée."""
+        return min(max(int((y - self.min_y) / self.size), 0), self.rows - 1)
+
+    def any_inside(
+        self,
+        points: list[tuple[float, float]],
+        triangle: tuple[int, int, int],
+        circle: tuple[tuple[float, float], float],
+        ignored: bytearray
+    ) -> bool:
+        """Cherche un point strictement intérieur au cercle d'un triangle.
+
+        Les colonnes sont parcourues à partir de celle du centre, et pour
+        chacune seules les cellules que le disque (légèrement agrandi) peut
+        toucher sont lues, ce qui garde la recherche locale même pour un
+        très grand cercle. Chaque candidat est tranché par le prédicat
+        exact incircle.
+
+        Args:
+            points: Les points indexés.
+            triangle: Les indices des sommets, dans le sens trigonométrique.
+            circle: (centre, rayon au carré) approché du triangle.
+            ignored: Drapeaux des points à ne pas considérer.
+
+        Returns:
+            bool: True si un point non ignoré est dans le cercle.
+        """
+        a, b, c = (points[i] for i in triangle)
+        (ux, uy), squared_radius = circle
+        radius = math.sqrt(squared_radius) * (1 + _CERTIFY_TOLERANCE)
+        squared_radius = radius * radius
+        first = self._column(ux - radius)
+        last = self._column(ux + radius)
+        center = self._column(ux)
+        by_distance = sorted(range(first, last + 1), key=lambda c: abs(c - center))
+
+        cells = self.cells
+        for column in by_distance:
+            left = self.min_x + column * self.size
+            nearest = min(max(ux, left), left + self.size) - ux
+            span = squared_radius - nearest * nearest
+            if span < 0:
+                continue
+            span = math.sqrt(span)
+            base = column * self.rows
+            for row in range(self._row(uy - span), self._row(uy + span) + 1):
+                for i in cells.get(base + row, ()):
+                    if not ignored[i] and incircle(a, b, c, points[i]) > 0:
+                        return True
+        return False
+
+
+def triangulate_parallel(
+    point_set: list[tuple[float, float]],
+    workers: int,
+    order: str = 'hilbert'
+) -> TriangleArray:
+    """Triangule un ensemble de points sur plusieurs processus.
+
+    Les points doivent être distincts: triangulate écarte les doublons
+    avant d'appeler cette fonction.
+
+    Args:
+        point_set: Liste de points (x, y) à trianguler.
+        workers: Nombre de processus (et de bandes).
+        order: Ordre d'insertion utilisé dans chaque bande.
+
+    Returns:
+        TriangleArray: Séquence de tuples (i1, i2, i3) représentant les
+                       indices des sommets de chaque triangle dans le
+                       point_set original.
+    """
+    n = len(point_set)
+    strips = min(workers, n // MIN_STRIP_POINTS)
+    if strips < 2:
+        return triangulate(point_set, order=order)
+
+    if _are_collinear(point_set):
+        return TriangleArray()
+
+    by_x = sorted(range(n), key=point_set.__getitem__)
+    starts = [i * n // strips for i in range(strips + 1)]
+    xs = [point_set[i][0] for i in by_x]
+    extent = max(max(p[1] for p in point_set) - min(p[1] for p in point_set),
+                 xs[-1] - xs[0])
+    tolerance = _CERTIFY_TOLERANCE * extent
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=strips, mp_context=context) as pool:
+        futures = []
+        for s in range(strips):
+            ids = by_x[starts[s]:starts[s + 1]]
+            coords = array('d')
+            for i in ids:
+                coords.extend(point_set[i])
+            left = xs[starts[s] - 1] if s > 0 else -math.inf
+            right = xs[starts[s + 1]] if s < strips - 1 else math.inf
+            futures.append(pool.submit(
+                _triangulate_strip, coords.tobytes(), left, right, order,
+                tolerance
+            ))
+
+        # La grille est construite pendant que les bandes sont calculées.
+        grid = _Grid(point_set)
+
+        triangles = array(_UINT32)
+        seam_flags = bytearray(n)
+        for s, future in enumerate(futures):
+            certified_bytes, seam_bytes = future.result()
+            base = starts[s]
+            certified = array(_UINT32)
+            certified.frombytes(certified_bytes)
+            triangles.extend(by_x[base + i] for i in certified)
+            seam = array(_UINT32)
+            seam.frombytes(seam_bytes)
+            for i in seam:
+                seam_flags[by_x[base + i]] = 1
+
+    position = [0] * n
+    for rank, i in enumerate(by_x):
+        position[i] = rank
+
+    def strip_of(i: int) -> int:
+        return bisect.bisect_right(starts, position[i]) - 1
+
+    seam_ids = [i for i in range(n) if seam_flags[i]]
+    seam_points = [point_set[i] for i in seam_ids]
+    for a, b, c in triangulate(seam_points, order=order):
+        tri = (seam_ids[a], seam_ids[b], seam_ids[c])
+        circle = _circumcenter(seam_points[a], seam_points[b], seam_points[c])
+        if circle is None:
+            continue
+        s = strip_of(tri[0])
+        if s == strip_of(tri[1]) == strip_of(tri[2]):
+            left = xs[starts[s] - 1] if s > 0 else -math.inf
+            right = xs[starts[s + 1]] if s < strips - 1 else math.inf
+            if _is_local(circle, left, right, tolerance):
+                continue
+        if not grid.any_inside(point_set, tri, circle, seam_flags):
+            triangles.extend(tri)
+
+    return TriangleArray(triangles)
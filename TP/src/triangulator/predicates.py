@@ -0,0 +1,191 @@
+"""Prédicats géométriques robustes (orientation et cercle circonscrit).
+
+Les deux prédicats suivent l'approche de Shewchuk: le déterminant est
+d'abord évalué en flottants, avec une borne d'erreur qui dépend de la
+taille des termes. Si le résultat dépasse la borne, son signe est sûr;
+sinon le déterminant est recalculé exactement, en entiers, à partir des
+valeurs exactes des flottants. Le chemin exact est rare en pratique mais
+coûteux: les compteurs exact_counts() permettent d'en mesurer la part.
+
+Seul le signe des résultats est garanti: le chemin rapide renvoie le
+déterminant approché, le chemin exact renvoie -1.0, 0.0 ou 1.0.
+"""
+
+_EPSILON = 2.0 ** -53
+_CCW_ERRBOUND_A = (3.0 + 16.0 * _EPSILON) * _EPSILON
+_ICC_ERRBOUND_A = (10.0 + 96.0 * _EPSILON) * _EPSILON
+
+_exact_counts = {'orient2d': 0, 'incircle': 0}
+
+
+def exact_counts() -> dict[str, int]:
+    """Retourne le nombre de passages par le calcul exact, par prédicat.
+
+    Returns:
+        dict: Nombre d'évaluations exactes de orient2d et de incircle.
+    """
+    return dict(_exact_counts)
+
+
+def reset_exact_counts() -> None:
+    """Remet les compteurs de calcul exact à zéro."""
+    for name in _exact_counts:
+        _exact_counts[name] = 0
+
+
+def _scaled(*values: float) -> list[int]:
+    """Ramène des flottants à des entiers par un même facteur 2**k.
+
+    Tout flottant fini vaut n / 2**k; multiplier toutes les valeurs par le
+    plus grand 2**k en fait des entiers exacts, sur lesquels les
+    déterminants se calculent sans erreur et changent d'échelle sans
+    changer de signe.
+
+    Args:
+        *values: Les coordonnées.
+
+    Returns:
+        list: Les coordonnées mises à l'échelle, entières.
+    """
+    ratios = [value.as_integer_ratio() for value in values]
+    shift = max(denominator for _, denominator in ratios).bit_length() - 1
+    return [
+        numerator << (shift - denominator.bit_length() + 1)
+        for numerator, denominator in ratios
+    ]
+
+
+def _sign(value: int) -> float:
+    """Retourne le signe d'un déterminant exact.
+
+    Args:
+        value: Le déterminant exact (à un facteur positif près).
+
+    Returns:
+        float: -1.0, 0.0 ou 1.0.
+    """
+    return float((value > 0) - (value < 0))
+
+
+def _orient2d_exact(
+    a: tuple[float, float],
+    b: tuple[float, float],
+    c: tuple[float, float]
+) -> float:
+    """Calcule exactement le déterminant d'orientation."""
+    _exact_counts['orient2d'] += 1
+    ax, ay, bx, by, cx, cy = _scaled(a[0], a[1], b[0], b[1], c[0], c[1])
+    return _sign((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+def orient2d(
+    a: tuple[float, float],
+    b: tuple[float, float],
+    c: tuple[float, float]
+) -> float:
+    """Calcule l'orientation du triplet de points (a, b, c).
+
+    Args:
+        a: Premier point.
+        b: Deuxième point.
+        c: Troisième point.
+
+    Returns:
+        float: Une valeur positive si les points tournent dans le sens
+               trigonométrique, négative dans le sens horaire, nulle
+               exactement s'ils sont colinéaires.
+    """
+    detleft = (a[0] - c[0]) * (b[1] - c[1])
+    detright = (a[1] - c[1]) * (b[0] - c[0])
+    det = detleft - detright
+
+    if detleft > 0.0:
+        if detright <= 0.0:
+            return det
+        detsum = detleft + detright
+    elif detleft < 0.0:
+        if detright >= 0.0:
+            return det
+        detsum = -detleft - detright
+    else:
+        return det
+
+    errbound = _CCW_ERRBOUND_A * detsum
+    if det >= errbound or -det >= errbound:
+        return det
+    return _orient2d_exact(a, b, c)
+
+
+def _incircle_exact(
+    a: tuple[float, float],
+    b: tuple[float, float],
+    c: tuple[float, float],
+    d: tuple[float, float]
+) -> float:
+    """Calcule exactement le déterminant du cercle circonscrit."""
+    _exact_counts['incircle'] += 1
+    ax, ay, bx, by, cx, cy, dx, dy = _scaled(
+        a[0], a[1], b[0], b[1], c[0], c[1], d[0], d[1]
+    )
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    return _sign(
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+
+
+def incircle(
+    a: tuple[float, float],
+    b: tuple[float, float],
+    c: tuple[float, float],
+    d: tuple[float, float]
+) -> float:
+    """Situe le point d par rapport au cercle passant par a, b et c.
+
+    Args:
+        a: Premier sommet, le triangle (a, b, c) étant orienté dans le sens
+           trigonométrique.
+        b: Deuxième sommet.
+        c: Troisième sommet.
+        d: Le point à tester.
+
+    Returns:
+        float: Une valeur positive si d est strictement à l'intérieur du
+               cercle, négative s'il est à l'extérieur, nulle exactement
+               s'il est sur le cercle. Le signe est inversé si (a, b, c)
+               est orienté dans le sens horaire.
+    """
+    dx, dy = d
+    adx = a[0] - dx
+    ady = a[1] - dy
+    bdx = b[0] - dx
+    bdy = b[1] - dy
+    cdx = c[0] - dx
+    cdy = c[1] - dy
+
+    bdxcdy = bdx * cdy
+    cdxbdy = cdx * bdy
+    alift = adx * adx + ady * ady
+
+    cdxady = cdx * ady
+    adxcdy = adx * cdy
+    blift = bdx * bdx + bdy * bdy
+
+    adxbdy = adx * bdy
+    bdxady = bdx * ady
+    clift = cdx * cdx + cdy * cdy
+
+    det = (alift * (bdxcdy - cdxbdy)
+           + blift * (cdxady - adxcdy)
+           + clift * (adxbdy - bdxady))
+
+    permanent = ((abs(bdxcdy) + abs(cdxbdy)) * alift
+                 + (abs(cdxady) + abs(adxcdy)) * blift
+                 + (abs(adxbdy) + abs(bdxady)) * clift)
+    errbound = _ICC_ERRBOUND_A * permanent
+    if det > errbound or -det > errbound:
+        return det
+    return _incircle_exact(a, b, c, d)
@@ -0,0 +1,388 @@
+"""Client HTTP du PointSetManager.
+
+Le client réutilise un pool de connexions persistantes (keep-alive) au
+lieu d'ouvrir une connexion TCP par requête. Les erreurs transitoires
+sont retentées un nombre borné de fois, avec un délai exponentiel
+aléatoire (jitter), et un disjoncteur (circuit breaker) coupe les appels
+tant que le PointSetManager reste en échec, pour échouer tout de suite
+plutôt que d'accumuler des threads en attente.
+
+Le corps de la réponse est lu en flux: le nombre de points annoncé par
+l'en-tête est vérifié dès le premier morceau, avant de télécharger le
+reste, et les points sont décodés au fil des morceaux reçus.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.triangulator.serialization import DEFAULT_CHUNK_SIZE, PointSetDecoder
+
+RETRYABLE_STATUSES = frozenset({502, 503, 504})
+
+
+class PointSetManagerError(Exception):
+    """Le PointSetManager a répondu avec un statut d'erreur."""
+
+    def __init__(self, status_code: int) -> None:
+        """Initialise l'erreur.
+
+        Args:
+            status_code: Le statut HTTP renvoyé par le PointSetManager.
+        """
+        super().__init__(f'Le PointSetManager a répondu {status_code}')
+        self.status_code = status_code
+
+
+class PointSetNotFound(PointSetManagerError):
+    """Le PointSet demandé n'existe pas (404)."""
+
+    def __init__(self) -> None:
+        """Initialise l'erreur."""
+        super().__init__(404)
+
+
+class PointSetManagerUnavailable(Exception):
+    """Le PointSetManager est injoignable."""
+
+
+class PointSetTooLarge(Exception):
+    """Le PointSet annonce plus de points que la limite du client."""
+
+    def __init__(self, point_count: int, max_points: int) -> None:
+        """Initialise l'erreur.
+
+        Args:
+            point_count: Le nombre de points annoncé par l'en-tête.
+            max_points: La limite dépassée.
+        """
+        super().__init__(
+            f'{point_count} points annoncés, au plus {max_points} acceptés'
+        )
+        self.point_count = point_count
+        self.max_points = max_points
+
+
+def _check_point_count(decoder: PointSetDecoder, max_points: int | None) -> None:
+    """Vérifie le nombre de points annoncé, dès que l'en-tête est reçu.
+
+    Args:
+        decoder: Le décodeur en cours de remplissage.
+        max_points: Nombre maximal de points, ou None si illimité.
+
+    Raises:
+        PointSetTooLarge: Si l'en-tête annonce plus de max_points points.
+    """
+    count = decoder.point_count
+    if max_points is not None and count is not None and count > max_points:
+        raise PointSetTooLarge(count, max_points)
+
+
+class CircuitOpenError(PointSetManagerUnavailable):
+    """Le disjoncteur est ouvert: l'appel n'a pas été tenté."""
+
+    def __init__(self, retry_after: float) -> None:
+        """Initialise l'erreur.
+
+        Args:
+            retry_after: Délai avant la prochaine tentative, en secondes.
+        """
+        super().__init__('Disjoncteur ouvert')
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Disjoncteur à trois états: fermé, ouvert et semi-ouvert.
+
+    Après failure_threshold échecs consécutifs, le disjoncteur s'ouvre et
+    refuse les appels pendant reset_timeout secondes. Il laisse ensuite
+    passer un seul appel d'essai: un succès le referme, un échec le
+    rouvre.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialise un disjoncteur fermé.
+
+        Args:
+            failure_threshold: Nombre d'échecs consécutifs avant ouverture.
+            reset_timeout: Durée d'ouverture, en secondes.
+            clock: Horloge utilisée pour les délais.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        """État courant: 'closed', 'open' ou 'half-open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._clock() - self._opened_at < self.reset_timeout:
+                return 'open'
+            return 'half-open'
+
+    def before_call(self) -> None:
+        """Autorise un appel ou lève CircuitOpenError.
+
+        Raises:
+            CircuitOpenError: Si le disjoncteur refuse l'appel.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_timeout - (self._clock() - self._opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(remaining)
+            if self._trial_running:
+                raise CircuitOpenError(self.reset_timeout)
+            self._trial_running = True
+
+    def record_success(self) -> None:
+        """Enregistre un appel réussi et referme le disjoncteur."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Enregistre un échec et ouvre le disjoncteur si besoin."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_running = False
+
+    def release_trial(self) -> None:
+        """Libère l'appel d'essai en cours sans compter d'échec.
+
+        Sert aux appels interrompus (annulation, interruption) dont l'issue
+        ne dit rien de l'état du service.
+        """
+        with self._lock:
+            self._trial_running = False
+
+
+class PointSetManagerClient:
+    """Client du PointSetManager avec pool de connexions et reprises."""
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 10,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 30.0,
+        retries: int = 2,
+        backoff: float = 0.1,
+        breaker: CircuitBreaker | None = None,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        """Initialise le client.
+
+        Args:
+            base_url: URL de base du PointSetManager.
+            pool_size: Nombre maximal de connexions gardées ouvertes.
+            connect_timeout: Délai maximal d'établissement de connexion.
+            read_timeout: Délai maximal d'attente de la réponse.
+            retries: Nombre de nouvelles tentatives après un échec
+                     transitoire.
+            backoff: Délai de base entre deux tentatives, doublé à chaque
+                     tentative et tiré aléatoirement dans [0, délai].
+            breaker: Disjoncteur à utiliser. Si None, un disjoncteur qui
+                     s'ouvre après 5 échecs pendant 30 secondes.
+            sleep: Fonction d'attente entre deux tentatives.
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker(5, 30.0)
+        self._sleep = sleep
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Calcule le délai avant une nouvelle tentative (full jitter).
+
+        Args:
+            attempt: Numéro de la tentative qui vient d'échouer (0, 1...).
+
+        Returns:
+            float: Le délai en secondes.
+        """
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def get_point_set(
+        self,
+        point_set_id: str,
+        max_points: int | None = None
+    ) -> bytearray:
+        """Récupère la représentation binaire d'un PointSet.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            max_points: Nombre maximal de points accepté, ou None.
+
+        Returns:
+            bytearray: Le PointSet au format binaire.
+
+        Raises:
+            PointSetNotFound: Si le PointSet n'existe pas.
+            PointSetManagerError: Si le PointSetManager renvoie une erreur.
+            PointSetManagerUnavailable: Si le PointSetManager est injoignable
+                                        ou si le disjoncteur est ouvert.
+            PointSetTooLarge: Si le PointSet dépasse max_points.
+            ValueError: Si le PointSet reçu est incomplet.
+        """
+        return self._fetch(point_set_id, max_points, False).payload()
+
+    def fetch_point_set(
+        self,
+        point_set_id: str,
+        max_points: int | None = None
+    ) -> PointSetDecoder:
+        """Récupère un PointSet et ses points, décodés pendant la réception.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            max_points: Nombre maximal de points accepté, ou None.
+
+        Returns:
+            PointSetDecoder: Le décodeur complet, dont payload() et
+                             point_set() donnent le PointSet binaire et
+                             ses points.
+
+        Raises:
+            PointSetNotFound: Si le PointSet n'existe pas.
+            PointSetManagerError: Si le PointSetManager renvoie une erreur.
+            PointSetManagerUnavailable: Si le PointSetManager est injoignable
+                                        ou si le disjoncteur est ouvert.
+            PointSetTooLarge: Si le PointSet dépasse max_points.
+            ValueError: Si le PointSet reçu est incomplet.
+        """
+        decoder = self._fetch(point_set_id, max_points, True)
+        decoder.point_set()
+        return decoder
+
+    def _read(
+        self,
+        response: requests.Response,
+        max_points: int | None,
+        decode_points: bool
+    ) -> PointSetDecoder:
+        """Lit en flux le corps d'une réponse 200.
+
+        La connexion est abandonnée dès que le PointSet est complet ou
+        refusé: les données qui suivent ne sont pas téléchargées.
+
+        Args:
+            response: La réponse, ouverte en flux.
+            max_points: Nombre maximal de points accepté, ou None.
+            decode_points: Si True, décode les points au fil des morceaux.
+
+        Returns:
+            PointSetDecoder: Le décodeur rempli.
+
+        Raises:
+            PointSetTooLarge: Si le PointSet dépasse max_points.
+            requests.exceptions.RequestException: Si la lecture échoue.
+        """
+        decoder = PointSetDecoder(
+            decode_points, ignore_trailing=True,
+            check_header=partial(_check_point_count, max_points=max_points)
+        )
+        try:
+            for chunk in response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE):
+                decoder.feed(chunk)
+                if decoder.done:
+                    break
+        finally:
+            response.close()
+        return decoder
+
+    def _fetch(
+        self,
+        point_set_id: str,
+        max_points: int | None,
+        decode_points: bool
+    ) -> PointSetDecoder:
+        """Récupère un PointSet en flux, avec reprises et disjoncteur.
+
+        Args:
+            point_set_id: L'identifiant du PointSet.
+            max_points: Nombre maximal de points accepté, ou None.
+            decode_points: Si True, décode les points au fil des morceaux.
+
+        Returns:
+            PointSetDecoder: Le décodeur, rempli jusqu'à la fin de la
+                             réponse (le PointSet peut être incomplet).
+
+        Raises:
+            PointSetNotFound: Si le PointSet n'existe pas.
+            PointSetManagerError: Si le PointSetManager renvoie une erreur.
+            PointSetManagerUnavailable: Si le PointSetManager est injoignable
+                                        ou si le disjoncteur est ouvert.
+            PointSetTooLarge: Si le PointSet dépasse max_points.
+        """
+        self.breaker.before_call()
+        url = f'{self.base_url}/pointset/{point_set_id}'
+
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.get(
+                    url, timeout=self.timeout, stream=True
+                )
+                if response.status_code == 200:
+                    decoder = self._read(response, max_points, decode_points)
+            except requests.exceptions.RequestException as e:
+                error = PointSetManagerUnavailable(str(e))
+            except PointSetTooLarge:
+                self.breaker.record_success()
+                raise
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                self.breaker.release_trial()
+                raise
+            else:
+                if response.status_code == 200:
+                    self.breaker.record_success()
+                    return decoder
+                response.close()
+                if response.status_code not in RETRYABLE_STATUSES:
+                    if response.status_code < 500:
+                        self.breaker.record_success()
+                    else:
+                        self.breaker.record_failure()
+                    if response.status_code == 404:
+                        raise PointSetNotFound()
+                    raise PointSetManagerError(response.status_code)
+                error = PointSetManagerError(response.status_code)
+
+            if attempt < self.retries:
+                self._sleep(self._backoff_delay(attempt))
+
+        self.breaker.record_failure()
+        raise error
+
+    def close(self) -> None:
+        """Ferme les connexions du pool."""
+        self.session.close()
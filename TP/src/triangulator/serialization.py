@@ -3,41 +3,96 @@
 Ce module fournit les fonctions nécessaires pour convertir les structures
 de données PointSet et Triangles depuis et vers leur format binaire,
 tel que défini dans la spécification du projet.
+
+Les conversions travaillent en bloc: le décodage lit les coordonnées au
+travers d'une ``memoryview`` sans copier la charge utile, et l'encodage
+écrit tout le résultat dans un unique tampon préalloué.
 """
 
 import struct
+import sys
+import time
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from itertools import chain
 
+from src.triangulator.triangles import _UINT32, TriangleArray
 
-def serialize_point_set(point_set: list[tuple[float, float]]) -> bytes:
-    """Sérialise un ensemble de points au format binaire.
+_LITTLE_ENDIAN = sys.byteorder == 'little'
 
-    Le format binaire est:
-    - 4 premiers bytes: unsigned int (32-bit) indiquant le nombre de points
-    - Pour chaque point: 8 bytes (2 floats de 4 bytes pour X et Y)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _float_view(data: bytes, offset: int, count: int) -> memoryview | array:
+    """Retourne une vue des floats little-endian contenus dans data.
+
+    Sur une machine little-endian la vue ne copie pas les données; sinon
+    les floats sont copiés une fois puis remis dans l'ordre natif.
+
+    Args:
+        data: Tampon binaire (bytes, bytearray, mmap, memoryview...).
+        offset: Position du premier float en bytes.
+        count: Nombre de floats à lire.
+
+    Returns:
+        memoryview | array: Une séquence de floats.
+    """
+    view = memoryview(data).cast('B')[offset:offset + 4 * count]
+    if _LITTLE_ENDIAN:
+        return view.cast('f')
+
+    floats = array('f')
+    floats.frombytes(view)
+    floats.byteswap()
+    return floats
+
+
+def _float_array(point_set: list[tuple[float, float]]) -> array:
+    """Convertit des points en floats little-endian contigus.
 
     Args:
         point_set: Liste de tuples (x, y) représentant les points.
 
     Returns:
-        bytes: La représentation binaire du PointSet.
+        array: Les coordonnées x0, y0, x1, y1... au format du fil.
     """
-    count = len(point_set)
-    result = struct.pack('<I', count)
+    floats = array('f', chain.from_iterable(point_set))
+    if not _LITTLE_ENDIAN:
+        floats.byteswap()
+    return floats
 
-    for x, y in point_set:
-        result += struct.pack('<ff', x, y)
 
-    return result
+def _index_array(triangles: Sequence[tuple[int, int, int]]) -> array:
+    """Convertit des triangles en entiers 32 bits little-endian contigus.
 
+    Les indices d'un TriangleArray sont repris sans copie sur une machine
+    little-endian.
+
+    Args:
+        triangles: Séquence de tuples (i1, i2, i3).
+
+    Returns:
+        array: Les indices i1, i2, i3... au format du fil.
+    """
+    if isinstance(triangles, TriangleArray):
+        if _LITTLE_ENDIAN:
+            return triangles.indices
+        indices = array(_UINT32, triangles.indices)
+    else:
+        indices = array(_UINT32, chain.from_iterable(triangles))
+    if not _LITTLE_ENDIAN:
+        indices.byteswap()
+    return indices
 
-def deserialize_point_set(data: bytes) -> list[tuple[float, float]]:
-    """Désérialise des bytes en liste de points.
+
+def _read_point_count(data: bytes) -> int:
+    """Lit et valide le nombre de points d'un PointSet binaire.
 
     Args:
         data: La représentation binaire d'un PointSet.
 
     Returns:
-        list: Liste de tuples (x, y) représentant les points.
+        int: Le nombre de points annoncé par l'en-tête.
 
     Raises:
         ValueError: Si les données sont malformées ou incomplètes.
@@ -45,7 +100,7 @@ def deserialize_point_set(data: bytes) -> list[tuple[float, float]]:
     if len(data) < 4:
         raise ValueError("Données insuffisantes pour le compteur de points")
 
-    count = struct.unpack('<I', data[:4])[0]
+    count = struct.unpack_from('<I', data, 0)[0]
     expected_size = 4 + count * 8
 
     if len(data) < expected_size:
@@ -54,20 +109,226 @@ def deserialize_point_set(data: bytes) -> list[tuple[float, float]]:
             f"reçu {len(data)} bytes"
         )
 
-    points = []
-    offset = 4
+    return count
 
-    for _ in range(count):
-        x, y = struct.unpack('<ff', data[offset:offset + 8])
-        points.append((x, y))
-        offset += 8
 
-    return points
+def _write_point_set(
+    buffer: bytearray,
+    offset: int,
+    point_set: list[tuple[float, float]]
+) -> int:
+    """Écrit un PointSet dans un tampon préalloué.
+
+    Args:
+        buffer: Le tampon de destination.
+        offset: Position d'écriture en bytes.
+        point_set: Liste de tuples (x, y) représentant les points.
+
+    Returns:
+        int: La position qui suit les données écrites.
+    """
+    count = len(point_set)
+    struct.pack_into('<I', buffer, offset, count)
+    offset += 4
+
+    buffer[offset:offset + 8 * count] = memoryview(_float_array(point_set)).cast('B')
+
+    return offset + 8 * count
+
+
+def serialize_point_set(point_set: list[tuple[float, float]]) -> bytes:
+    """Sérialise un ensemble de points au format binaire.
+
+    Le format binaire est:
+    - 4 premiers bytes: unsigned int (32-bit) indiquant le nombre de points
+    - Pour chaque point: 8 bytes (2 floats de 4 bytes pour X et Y)
+
+    Args:
+        point_set: Liste de tuples (x, y) représentant les points.
+
+    Returns:
+        bytes: La représentation binaire du PointSet.
+    """
+    buffer = bytearray(4 + 8 * len(point_set))
+    _write_point_set(buffer, 0, point_set)
+    return bytes(buffer)
+
+
+def deserialize_point_set(data: bytes) -> list[tuple[float, float]]:
+    """Désérialise des bytes en liste de points.
+
+    Args:
+        data: La représentation binaire d'un PointSet.
+
+    Returns:
+        list: Liste de tuples (x, y) représentant les points.
+
+    Raises:
+        ValueError: Si les données sont malformées ou incomplètes.
+    """
+    count = _read_point_count(data)
+    floats = _float_view(data, 4, 2 * count).tolist()
+    return list(zip(floats[0::2], floats[1::2]))
+
+
+def deserialize_point_set_columns(data: bytes) -> tuple[array, array]:
+    """Désérialise des bytes en deux colonnes de coordonnées.
+
+    Cette variante évite de créer un tuple par point: elle convient aux
+    traitements qui consomment les coordonnées en colonnes.
+
+    Args:
+        data: La représentation binaire d'un PointSet.
+
+    Returns:
+        tuple: (xs, ys), deux ``array('f')`` de même longueur.
+
+    Raises:
+        ValueError: Si les données sont malformées ou incomplètes.
+    """
+    count = _read_point_count(data)
+    floats = array('f')
+    floats.frombytes(memoryview(data).cast('B')[4:4 + 8 * count])
+    if not _LITTLE_ENDIAN:
+        floats.byteswap()
+    return floats[0::2], floats[1::2]
+
+
+class PointSetDecoder:
+    """Décodeur incrémental d'un PointSet binaire.
+
+    Les morceaux reçus sont copiés directement dans un tampon préalloué
+    dès que l'en-tête annonce le nombre de points: la charge utile n'est
+    jamais accumulée puis recopiée. Le tampon n'est alloué qu'après le
+    contrôle de l'en-tête (check_header): un en-tête qui annonce des
+    milliards de points est refusé sans rien allouer. Sur demande, les
+    points complets sont aussi décodés à chaque morceau, ce qui recouvre le
+    décodage par la réception du reste.
+    """
+
+    def __init__(
+        self,
+        decode_points: bool = False,
+        ignore_trailing: bool = False,
+        check_header: Callable[['PointSetDecoder'], None] | None = None
+    ) -> None:
+        """Initialise un décodeur vide.
+
+        Args:
+            decode_points: Si True, décode les points au fil des morceaux
+                           (voir point_set); decode_seconds cumule alors
+                           la durée de ce décodage.
+            ignore_trailing: Si True, les données qui suivent le PointSet
+                             annoncé sont ignorées au lieu d'être une
+                             erreur, comme le fait deserialize_point_set.
+            check_header: Fonction appelée avec le décodeur dès que
+                          l'en-tête est lu, avant l'allocation du tampon
+                          (point_count et expected_size sont connus).
+                          Son exception interrompt feed.
+        """
+        self._header = bytearray()
+        self._count: int | None = None
+        self._check_header = check_header
+        self._buffer: bytearray | None = None
+        self._filled = 0
+        self._points: list[tuple[float, float]] | None = (
+            [] if decode_points else None
+        )
+        self._ignore_trailing = ignore_trailing
+        self.decode_seconds = 0.0
+
+    @property
+    def point_count(self) -> int | None:
+        """Nombre de points annoncé, ou None si l'en-tête est incomplet."""
+        return self._count
+
+    @property
+    def expected_size(self) -> int | None:
+        """Taille totale attendue, ou None si l'en-tête est incomplet."""
+        return None if self._count is None else 4 + 8 * self._count
+
+    @property
+    def done(self) -> bool:
+        """Indique si le PointSet a été reçu en entier."""
+        return self._buffer is not None and self._filled == len(self._buffer)
+
+    def feed(self, chunk: bytes) -> None:
+        """Ajoute un morceau de données.
+
+        Args:
+            chunk: Le morceau suivant de la représentation binaire.
+
+        Raises:
+            ValueError: Si les données dépassent la taille annoncée.
+            Exception: Celle de check_header, si l'en-tête est refusé.
+        """
+        view = memoryview(chunk).cast('B')
+        if self._buffer is None:
+            missing = 4 - len(self._header)
+            self._header += view[:missing]
+            view = view[missing:]
+            if len(self._header) < 4:
+                return
+            self._count = struct.unpack('<I', self._header)[0]
+            if self._check_header is not None:
+                self._check_header(self)
+            self._buffer = bytearray(self.expected_size)
+            self._buffer[:4] = self._header
+            self._filled = 4
+
+        end = self._filled + len(view)
+        if end > len(self._buffer):
+            if not self._ignore_trailing:
+                raise ValueError(
+                    f"Données en trop: attendu {len(self._buffer)} bytes"
+                )
+            end = len(self._buffer)
+            view = view[:end - self._filled]
+        self._buffer[self._filled:end] = view
+        self._filled = end
+
+        points = self._points
+        if points is not None:
+            start = 4 + 8 * len(points)
+            count = (end - start) // 8
+            if count:
+                began = time.perf_counter()
+                floats = _float_view(self._buffer, start, 2 * count).tolist()
+                points.extend(zip(floats[0::2], floats[1::2]))
+                self.decode_seconds += time.perf_counter() - began
+
+    def payload(self) -> bytearray:
+        """Retourne le PointSet binaire complet.
+
+        Returns:
+            bytearray: La représentation binaire reçue.
+
+        Raises:
+            ValueError: Si le PointSet n'a pas été reçu en entier.
+        """
+        if not self.done:
+            raise ValueError("Données incomplètes")
+        return self._buffer
+
+    def point_set(self) -> list[tuple[float, float]]:
+        """Retourne les points décodés au fil des morceaux.
+
+        Returns:
+            list: Liste de tuples (x, y), comme deserialize_point_set.
+
+        Raises:
+            ValueError: Si le PointSet n'a pas été reçu en entier.
+        """
+        if self._points is None:
+            return deserialize_point_set(self.payload())
+        if not self.done:
+            raise ValueError("Données incomplètes")
+        return self._points
 
 
 def serialize_triangles(
     points: list[tuple[float, float]],
-    triangles: list[tuple[int, int, int]]
+    triangles: Sequence[tuple[int, int, int]]
 ) -> bytes:
     """Sérialise les triangles au format binaire.
 
@@ -79,18 +340,211 @@ def serialize_triangles(
 
     Args:
         points: Liste des sommets (points).
-        triangles: Liste de tuples (i1, i2, i3) représentant les indices
-                   des sommets de chaque triangle.
+        triangles: Séquence de tuples (i1, i2, i3) représentant les
+                   indices des sommets de chaque triangle.
 
     Returns:
         bytes: La représentation binaire des Triangles.
     """
-    result = serialize_point_set(points)
-
     triangle_count = len(triangles)
-    result += struct.pack('<I', triangle_count)
+    buffer = bytearray(4 + 8 * len(points) + 4 + 12 * triangle_count)
+    offset = _write_point_set(buffer, 0, points)
+
+    struct.pack_into('<I', buffer, offset, triangle_count)
+    offset += 4
+
+    buffer[offset:] = memoryview(_index_array(triangles)).cast('B')
+
+    return bytes(buffer)
+
+
+def triangles_size(point_count: int, triangle_count: int) -> int:
+    """Calcule la taille en bytes d'une structure Triangles sérialisée.
+
+    Args:
+        point_count: Nombre de sommets.
+        triangle_count: Nombre de triangles.
+
+    Returns:
+        int: La taille exacte produite par serialize_triangles.
+    """
+    return 4 + 8 * point_count + 4 + 12 * triangle_count
+
+
+def deserialize_triangles(
+    data: bytes
+) -> tuple[list[tuple[float, float]], TriangleArray]:
+    """Désérialise une structure Triangles.
+
+    Args:
+        data: La représentation binaire des Triangles.
+
+    Returns:
+        tuple: Les sommets (liste de tuples (x, y)) et les triangles.
+
+    Raises:
+        ValueError: Si les données sont malformées, incomplètes, ou si un
+                    triangle référence un sommet inexistant.
+    """
+    point_count = _read_point_count(data)
+    points = deserialize_point_set(data)
+    offset = 4 + 8 * point_count
+    if len(data) < offset + 4:
+        raise ValueError("Données insuffisantes pour le compteur de triangles")
+
+    triangle_count = struct.unpack_from('<I', data, offset)[0]
+    offset += 4
+    expected_size = offset + 12 * triangle_count
+    if len(data) < expected_size:
+        raise ValueError(
+            f"Données incomplètes: attendu {expected_size} bytes, "
+            f"reçu {len(data)} bytes"
+        )
+
+    indices = array(_UINT32)
+    indices.frombytes(memoryview(data).cast('B')[offset:expected_size])
+    if not _LITTLE_ENDIAN:
+        indices.byteswap()
+    if indices and max(indices) >= point_count:
+        raise ValueError("Un triangle référence un sommet inexistant")
+    return points, TriangleArray(indices)
+
+
+def iter_serialize_triangles(
+    points: list[tuple[float, float]],
+    triangles: Sequence[tuple[int, int, int]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Sérialise les triangles par morceaux de taille bornée.
+
+    Produit exactement les mêmes bytes que serialize_triangles, mais sans
+    jamais matérialiser le résultat complet: le bloc des sommets puis celui
+    des triangles sont émis en morceaux d'au plus chunk_size bytes
+    (en-têtes de 4 bytes mis à part).
+
+    Args:
+        points: Liste des sommets (points).
+        triangles: Séquence de tuples (i1, i2, i3) représentant les
+                   indices des sommets de chaque triangle.
+        chunk_size: Taille maximale d'un morceau en bytes.
+
+    Yields:
+        bytes: Les morceaux successifs de la représentation binaire.
+    """
+    points_per_chunk = max(1, chunk_size // 8)
+    yield struct.pack('<I', len(points))
+    for start in range(0, len(points), points_per_chunk):
+        yield _float_array(points[start:start + points_per_chunk]).tobytes()
 
-    for i1, i2, i3 in triangles:
-        result += struct.pack('<III', i1, i2, i3)
+    triangles_per_chunk = max(1, chunk_size // 12)
+    yield struct.pack('<I', len(triangles))
+    for start in range(0, len(triangles), triangles_per_chunk):
+        yield _index_array(triangles[start:start + triangles_per_chunk]).tobytes()
 
-    return result
+
+def index_map_size(point_count: int) -> int:
+    """Calcule la taille en bytes d'une table des doublons sérialisée.
+
+    Args:
+        point_count: Nombre de points du PointSet.
+
+    Returns:
+        int: La taille exacte produite par iter_serialize_index_map.
+    """
+    return 4 + 4 * point_count
+
+
+def iter_serialize_index_map(
+    index_map: list[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Sérialise la table des doublons par morceaux de taille bornée.
+
+    La table suit la structure Triangles dans la réponse étendue:
+    - 4 bytes: unsigned int (32-bit) pour le nombre de points
+    - Pour chaque point: 4 bytes (unsigned int), l'indice du point qui le
+      représente dans les triangles (lui-même s'il n'est pas un doublon)
+
+    Args:
+        index_map: Pour chaque point, l'indice de son représentant.
+        chunk_size: Taille maximale d'un morceau en bytes.
+
+    Yields:
+        bytes: Les morceaux successifs de la représentation binaire.
+    """
+    indices_per_chunk = max(1, chunk_size // 4)
+    yield struct.pack('<I', len(index_map))
+    for start in range(0, len(index_map), indices_per_chunk):
+        indices = array(_UINT32, index_map[start:start + indices_per_chunk])
+        if not _LITTLE_ENDIAN:
+            indices.byteswap()
+        yield indices.tobytes()
+
+
+BATCH_RECORD_TRIANGLES = 0
+BATCH_RECORD_ERROR = 1
+
+_BATCH_RECORD_HEADER = struct.Struct('<BI')
+
+
+def encode_batch_header(record_count: int) -> bytes:
+    """Encode l'en-tête d'une réponse par lot.
+
+    Une réponse par lot est composée de:
+    - 4 bytes: unsigned int (32-bit) pour le nombre d'enregistrements
+    - Pour chaque enregistrement, dans l'ordre des identifiants demandés:
+      - 1 byte: type (0: Triangles, 1: erreur JSON)
+      - 4 bytes: unsigned int (32-bit) pour la taille du contenu
+      - le contenu: une structure Triangles ou un objet Error en UTF-8
+
+    Args:
+        record_count: Nombre d'enregistrements qui suivent.
+
+    Returns:
+        bytes: L'en-tête binaire.
+    """
+    return struct.pack('<I', record_count)
+
+
+def encode_batch_record(kind: int, payload: bytes) -> bytes:
+    """Encode l'en-tête d'un enregistrement suivi de son contenu.
+
+    Args:
+        kind: BATCH_RECORD_TRIANGLES ou BATCH_RECORD_ERROR.
+        payload: Le contenu de l'enregistrement.
+
+    Returns:
+        bytes: L'enregistrement binaire.
+    """
+    return _BATCH_RECORD_HEADER.pack(kind, len(payload)) + payload
+
+
+def decode_batch(data: bytes) -> list[tuple[int, bytes]]:
+    """Décode une réponse par lot.
+
+    Args:
+        data: La réponse binaire complète.
+
+    Returns:
+        list: Liste de tuples (type, contenu), dans l'ordre des
+              identifiants demandés.
+
+    Raises:
+        ValueError: Si les données sont malformées ou incomplètes.
+    """
+    if len(data) < 4:
+        raise ValueError("Données insuffisantes pour le compteur d'enregistrements")
+
+    count = struct.unpack_from('<I', data, 0)[0]
+    offset = 4
+    records = []
+    for _ in range(count):
+        if len(data) < offset + _BATCH_RECORD_HEADER.size:
+            raise ValueError("En-tête d'enregistrement incomplet")
+        kind, size = _BATCH_RECORD_HEADER.unpack_from(data, offset)
+        offset += _BATCH_RECORD_HEADER.size
+        if len(data) < offset + size:
+            raise ValueError("Contenu d'enregistrement incomplet")
+        records.append((kind, bytes(data[offset:offset + size])))
+        offset += size
+    return records
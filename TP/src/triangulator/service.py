@@ -0,0 +1,822 @@
+"""Logique commune aux applications Flask et ASGI du Triangulator.
+
+Les deux modes de service partagent la configuration (DEFAULT_CONFIG), la
+construction des composants (cache, exécuteur, ordonnanceur, mesures...),
+la traduction des exceptions en erreurs de l'API, le calcul des
+triangulations et la préparation des réponses binaires. Seuls le routage
+et l'émission des réponses sont propres à chaque application.
+"""
+
+import math
+import mmap
+import os
+import time
+from collections.abc import Iterator
+from itertools import chain
+
+from werkzeug.http import parse_etags
+
+from src.triangulator.cache import ResultCache
+from src.triangulator.cancellation import CancellationToken, Cancelled
+from src.triangulator.core import deduplicate, set_stats_hook
+from src.triangulator.delta import PATH_FULL, MeshStore
+from src.triangulator.encodings import (
+    FORMAT_TRIANGLES,
+    compress,
+    encode_body,
+    representation_key,
+)
+from src.triangulator.errors import ApiError
+from src.triangulator.executor import (
+    ExecutorSaturated,
+    InlineExecutor,
+    JobTimeout,
+    ProcessExecutor,
+)
+from src.triangulator.metrics import (
+    PAYLOAD_TRIANGLES,
+    STAGE_DESERIALIZE,
+    STAGE_SERIALIZE,
+    STAGE_TRIANGULATE,
+    Metrics,
+)
+from src.triangulator.predicates import exact_counts
+from src.triangulator.psm_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    PointSetManagerError,
+    PointSetNotFound,
+    PointSetTooLarge,
+)
+from src.triangulator.scheduler import (
+    DEFAULT_COST_FACTOR,
+    Admission,
+    Scheduler,
+    SchedulerSaturated,
+)
+from src.triangulator.serialization import (
+    DEFAULT_CHUNK_SIZE,
+    PointSetDecoder,
+    deserialize_point_set,
+    index_map_size,
+    iter_serialize_index_map,
+    iter_serialize_triangles,
+    triangles_size,
+)
+from src.triangulator.singleflight import AsyncSingleFlight, SingleFlight
+from src.triangulator.triangles import TriangleArray
+
+# En-tête par lequel le client fixe l'échéance de sa requête: le délai
+# restant, en secondes.
+DEADLINE_HEADER = 'X-Request-Timeout'
+
+# En-tête par lequel un PointSet envoyé désigne la version dont il dérive:
+# l'ETag d'une triangulation reçue, ou '*' pour démarrer une série.
+BASE_HEADER = 'X-Triangulation-Base'
+
+DEFAULT_CONFIG = {
+    # Taille maximale du cache de résultats en bytes (0 pour le désactiver).
+    'CACHE_MAX_BYTES': 64 * 1024 * 1024,
+    # Durée de vie des entrées du cache, en secondes.
+    'CACHE_TTL': 300.0,
+    # Répertoire du cache sur disque (None: cache en mémoire).
+    'CACHE_DIR': None,
+    # Mémorise l'empreinte de chaque PointSetID pour répondre sans
+    # interroger le PointSetManager.
+    'CACHE_ID_MAP': True,
+    # Nombre maximal de connexions persistantes vers le PointSetManager.
+    'PSM_POOL_SIZE': 10,
+    # Délais d'établissement de connexion et de lecture, en secondes.
+    'PSM_CONNECT_TIMEOUT': 3.05,
+    'PSM_READ_TIMEOUT': 30.0,
+    # Nouvelles tentatives après un échec transitoire, et délai de base.
+    'PSM_RETRIES': 2,
+    'PSM_RETRY_BACKOFF': 0.1,
+    # Échecs consécutifs avant ouverture du disjoncteur, et durée
+    # d'ouverture en secondes.
+    'PSM_BREAKER_THRESHOLD': 5,
+    'PSM_BREAKER_RESET': 30.0,
+    # Attente maximale d'une requête regroupée avec un calcul identique
+    # déjà en cours, en secondes.
+    'SINGLEFLIGHT_MAX_WAIT': 60.0,
+    # Exécuteur des triangulations: 'inline' (thread de la requête) ou
+    # 'process' (pool de processus).
+    'EXECUTOR': 'inline',
+    # Nombre de processus du pool (None: un par cœur).
+    'EXECUTOR_WORKERS': None,
+    # Triangulations acceptées en plus de celles en cours; au-delà, le
+    # service répond 503.
+    'EXECUTOR_QUEUE_SIZE': 16,
+    # Délai maximal d'une triangulation dans le pool, en secondes.
+    'TRIANGULATION_TIMEOUT': 120.0,
+    # Nombre maximal d'identifiants dans une requête par lot.
+    'BATCH_MAX_ITEMS': 1000,
+    # Nombre d'éléments de lot traités simultanément (toutes requêtes
+    # confondues).
+    'BATCH_CONCURRENCY': 8,
+    # Taille maximale d'un PointSet envoyé directement, en bytes.
+    'UPLOAD_MAX_BYTES': 64 * 1024 * 1024,
+    # Nombre maximal de points d'un PointSet, récupéré ou envoyé. Il est
+    # vérifié dès la lecture de l'en-tête, avant de recevoir les points
+    # (None pour ne pas limiter).
+    'MAX_POINTS': 8_000_000,
+    # Nombre total de points des maillages gardés pour trianguler par
+    # différence les PointSets envoyés avec X-Triangulation-Base (0 pour
+    # désactiver).
+    # Les maillages vivent dans le processus du service: seul l'exécuteur
+    # 'inline' en garde.
+    'DELTA_MAX_POINTS': 1_000_000,
+    # Part maximale de points retirés et ajoutés, rapportée à la taille du
+    # PointSet, traitée par différence; au-delà, le PointSet est triangulé
+    # entièrement.
+    'DELTA_MAX_CHURN': 0.5,
+    # Compte le travail interne de chaque triangulation (tests in-circle,
+    # taille des cavités, points insérés) pour /metrics. Le comptage vaut
+    # pour tout le processus et seulement pour les calculs qui y ont lieu
+    # (exécuteur 'inline', moteur Python).
+    'METRICS_TRIANGULATION_COUNTERS': False,
+    # Ordonnanceur des triangulations: les PointSets de plus de
+    # SCHEDULER_HEAVY_POINTS points passent par une voie lourde limitée à
+    # SCHEDULER_HEAVY_WORKERS calculs simultanés, les autres par une voie
+    # rapide (SCHEDULER_LIGHT_WORKERS calculs, None: un par cœur).
+    'SCHEDULER_HEAVY_POINTS': 50_000,
+    'SCHEDULER_HEAVY_WORKERS': 1,
+    'SCHEDULER_LIGHT_WORKERS': None,
+    # Attente estimée dans une voie au-delà de laquelle une triangulation
+    # est refusée avec un 503, en secondes (None: jamais refusée).
+    'SCHEDULER_MAX_WAIT': 30.0,
+    # Durée estimée d'une triangulation de n points, rapportée à
+    # n · log2(n), en secondes.
+    'SCHEDULER_COST_FACTOR': DEFAULT_COST_FACTOR,
+    # Échéance des requêtes qui n'envoient pas l'en-tête X-Request-Timeout,
+    # en secondes (None: aucune). Une triangulation dont la requête a
+    # dépassé son échéance est interrompue et répond 504.
+    'REQUEST_TIMEOUT': None,
+}
+
+
+def build_cache(config: dict) -> ResultCache | None:
+    """Crée le cache de résultats décrit par la configuration.
+
+    Args:
+        config: La configuration de l'application.
+
+    Returns:
+        ResultCache | None: Le cache, ou None s'il est désactivé.
+    """
+    if config['CACHE_MAX_BYTES'] <= 0:
+        return None
+    return ResultCache(
+        max_bytes=config['CACHE_MAX_BYTES'],
+        ttl=config['CACHE_TTL'],
+        directory=config['CACHE_DIR'],
+    )
+
+
+def build_breaker(config: dict) -> CircuitBreaker:
+    """Crée le disjoncteur du client PointSetManager.
+
+    Args:
+        config: La configuration de l'application.
+
+    Returns:
+        CircuitBreaker: Le disjoncteur, fermé.
+    """
+    return CircuitBreaker(
+        config['PSM_BREAKER_THRESHOLD'], config['PSM_BREAKER_RESET']
+    )
+
+
+def build_executor(config: dict) -> InlineExecutor | ProcessExecutor:
+    """Crée l'exécuteur des triangulations décrit par la configuration.
+
+    Args:
+        config: La configuration de l'application.
+
+    Returns:
+        InlineExecutor | ProcessExecutor: L'exécuteur.
+
+    Raises:
+        ValueError: Si le type d'exécuteur est inconnu.
+    """
+    workers = config['EXECUTOR_WORKERS'] or os.cpu_count() or 1
+    if config['EXECUTOR'] == 'process':
+        return ProcessExecutor(workers, config['EXECUTOR_QUEUE_SIZE'])
+    if config['EXECUTOR'] == 'inline':
+        return InlineExecutor(workers + config['EXECUTOR_QUEUE_SIZE'])
+    raise ValueError(f"Exécuteur inconnu: {config['EXECUTOR']}")
+
+
+def build_meshes(config: dict) -> MeshStore | None:
+    """Crée le stock de maillages décrit par la configuration.
+
+    Args:
+        config: La configuration de l'application.
+
+    Returns:
+        MeshStore | None: Le stock, ou None s'il est désactivé ou si les
+                          calculs ont lieu dans un pool de processus.
+    """
+    if config['DELTA_MAX_POINTS'] <= 0 or config['EXECUTOR'] != 'inline':
+        return None
+    return MeshStore(config['DELTA_MAX_POINTS'], config['DELTA_MAX_CHURN'])
+
+
+def build_scheduler(config: dict) -> Scheduler:
+    """Crée l'ordonnanceur des triangulations décrit par la configuration.
+
+    Args:
+        config: La configuration de l'application.
+
+    Returns:
+        Scheduler: L'ordonnanceur, voies vides.
+    """
+    return Scheduler(
+        config['SCHEDULER_HEAVY_POINTS'],
+        config['SCHEDULER_LIGHT_WORKERS'] or os.cpu_count() or 1,
+        config['SCHEDULER_HEAVY_WORKERS'],
+        config['SCHEDULER_MAX_WAIT'],
+        config['SCHEDULER_COST_FACTOR'],
+    )
+
+
+def build_metrics(config: dict) -> Metrics:
+    """Crée les mesures de l'application.
+
+    Args:
+        config: La configuration de l'application.
+
+    Returns:
+        Metrics: Les mesures, vides. Si la configuration le demande, elles
+                 reçoivent aussi les compteurs internes de triangulate.
+    """
+    metrics = Metrics()
+    # Le crochet vaut pour tout le processus: une application sans
+    # compteurs retire celui d'une application créée avant elle.
+    set_stats_hook(
+        metrics.observe_triangulation
+        if config['METRICS_TRIANGULATION_COUNTERS'] else None
+    )
+    return metrics
+
+
+def metrics_gauges(
+    cache: ResultCache | None,
+    meshes: MeshStore | None,
+    scheduler: Scheduler | None = None,
+    flights: SingleFlight | AsyncSingleFlight | None = None
+) -> dict[str, dict[str, int | float]]:
+    """Retourne l'occupation des composants à publier avec les mesures.
+
+    Les passages par le calcul exact des prédicats sont comptés dans le
+    processus du service: ceux des workers d'un pool de processus n'y
+    figurent pas.
+
+    Args:
+        cache: Le cache de résultats, s'il existe.
+        meshes: Le stock de maillages, s'il existe.
+        scheduler: L'ordonnanceur des triangulations, s'il existe.
+        flights: Le groupe de regroupement des calculs identiques.
+
+    Returns:
+        dict: Les compteurs de chaque composant présent.
+    """
+    gauges = {'predicates_exact': exact_counts()}
+    if scheduler is not None:
+        gauges['scheduler'] = scheduler.stats()
+    if flights is not None:
+        gauges['singleflight'] = flights.stats()
+    if cache is not None:
+        gauges['cache'] = cache.stats()
+    if meshes is not None:
+        gauges['delta'] = meshes.stats()
+    return gauges
+
+
+def too_many_points(point_count: int, max_points: int) -> ApiError:
+    """Construit l'erreur d'un PointSet qui dépasse la limite de points.
+
+    Args:
+        point_count: Le nombre de points annoncé par l'en-tête.
+        max_points: La limite configurée.
+
+    Returns:
+        ApiError: L'erreur 413 à renvoyer au client.
+    """
+    return ApiError(
+        'TOO_MANY_POINTS',
+        f'{point_count} points annoncés, au plus {max_points} acceptés.', 413
+    )
+
+
+def scheduler_busy(error: SchedulerSaturated) -> ApiError:
+    """Traduit le refus de l'ordonnanceur en erreur de l'API.
+
+    Args:
+        error: Le refus, avec l'attente estimée dans la voie.
+
+    Returns:
+        ApiError: L'erreur 503, avec Retry-After.
+    """
+    return ApiError(
+        'SERVICE_BUSY',
+        f'Trop de triangulations en attente (voie {error.lane}).', 503,
+        {'Retry-After': str(max(1, math.ceil(error.retry_after)))}
+    )
+
+
+def deadline_exceeded() -> ApiError:
+    """Construit l'erreur d'une requête dont l'échéance est dépassée.
+
+    Returns:
+        ApiError: L'erreur 504 DEADLINE_EXCEEDED.
+    """
+    return ApiError(
+        'DEADLINE_EXCEEDED',
+        'Échéance de la requête dépassée: triangulation interrompue.', 504
+    )
+
+
+def invalid_point_set(error: ValueError) -> ApiError:
+    """Construit l'erreur d'un PointSet reçu du PointSetManager mal formé.
+
+    Args:
+        error: L'erreur du décodage.
+
+    Returns:
+        ApiError: L'erreur 500 INVALID_DATA.
+    """
+    return ApiError('INVALID_DATA', f'Données PointSet invalides: {error}', 500)
+
+
+def computation_busy() -> ApiError:
+    """Construit l'erreur d'une requête lassée d'attendre un calcul identique.
+
+    Returns:
+        ApiError: L'erreur 503 SERVICE_BUSY, avec Retry-After.
+    """
+    return ApiError(
+        'SERVICE_BUSY', 'Le calcul de ce PointSet est encore en cours.', 503,
+        {'Retry-After': '1'}
+    )
+
+
+def route_not_found() -> ApiError:
+    """Construit l'erreur d'une URL qui ne correspond à aucune route.
+
+    Returns:
+        ApiError: L'erreur 404 NOT_FOUND.
+    """
+    return ApiError('NOT_FOUND', 'Ressource inconnue.', 404)
+
+
+def method_not_allowed(allowed: list[str]) -> ApiError:
+    """Construit l'erreur d'une méthode HTTP non acceptée par une route.
+
+    Args:
+        allowed: Les méthodes acceptées.
+
+    Returns:
+        ApiError: L'erreur 405 METHOD_NOT_ALLOWED, avec Allow.
+    """
+    return ApiError(
+        'METHOD_NOT_ALLOWED', 'Méthode non autorisée pour cette ressource.', 405,
+        {'Allow': ', '.join(allowed)}
+    )
+
+
+def deadline_token(
+    value: str | None,
+    default: float | None
+) -> CancellationToken:
+    """Crée le jeton d'annulation d'une requête.
+
+    Args:
+        value: La valeur de l'en-tête X-Request-Timeout, ou None.
+        default: L'échéance par défaut (REQUEST_TIMEOUT), ou None.
+
+    Returns:
+        CancellationToken: Le jeton, qui expire à l'échéance demandée.
+
+    Raises:
+        ApiError: Si l'en-tête n'est pas un nombre de secondes positif.
+    """
+    if value is None:
+        return CancellationToken.after(default)
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = math.nan
+    if not 0 <= seconds < math.inf:
+        raise ApiError(
+            'INVALID_REQUEST',
+            f'{DEADLINE_HEADER} doit être un nombre de secondes positif.', 400
+        )
+    return CancellationToken.after(seconds)
+
+
+def delta_series(key: str, base: str | None) -> tuple[str, str | None] | None:
+    """Rattache un PointSet envoyé à sa série de versions.
+
+    Args:
+        key: L'empreinte du PointSet envoyé.
+        base: La valeur de l'en-tête X-Triangulation-Base, ou None.
+
+    Returns:
+        tuple | None: L'empreinte du PointSet et celle de la version dont
+                      il dérive (None pour '*' ou un ETag illisible), ou
+                      None si la requête n'appartient à aucune série.
+    """
+    if base is None:
+        return None
+    tags = parse_etags(base).as_set(include_weak=True)
+    if len(tags) != 1:
+        return key, None
+    # Un ETag de triangulation commence par l'empreinte du PointSet, suivie
+    # des suffixes de son format (voir response_tag).
+    return key, tags.pop().split('+', 1)[0]
+
+
+def batch_ids(body: object, max_items: int) -> list[str]:
+    """Valide le corps JSON d'une requête par lot.
+
+    Args:
+        body: Le corps décodé, ou None s'il n'est pas du JSON.
+        max_items: Nombre maximal d'identifiants (BATCH_MAX_ITEMS).
+
+    Returns:
+        list: Les identifiants des PointSets, dans l'ordre de la requête.
+
+    Raises:
+        ApiError: Si le corps n'est pas {"pointSetIds": [...]} (400) ou
+                  compte trop d'identifiants (413).
+    """
+    ids = body.get('pointSetIds') if isinstance(body, dict) else None
+    if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+        raise ApiError(
+            'INVALID_REQUEST',
+            'Le corps doit être {"pointSetIds": [identifiants]}.', 400
+        )
+    if len(ids) > max_items:
+        raise ApiError(
+            'BATCH_TOO_LARGE', f'Au plus {max_items} identifiants par lot.', 413
+        )
+    return ids
+
+
+def check_upload_length(length: int | None, max_bytes: int) -> int:
+    """Vérifie la taille annoncée d'un PointSet envoyé dans le corps.
+
+    Args:
+        length: La valeur de Content-Length, ou None si elle est absente.
+        max_bytes: La taille maximale acceptée (UPLOAD_MAX_BYTES).
+
+    Returns:
+        int: La taille annoncée.
+
+    Raises:
+        ApiError: Si la taille est absente (411) ou trop grande (413).
+    """
+    if length is None:
+        raise ApiError('LENGTH_REQUIRED', 'En-tête Content-Length requis.', 411)
+    if length > max_bytes:
+        raise ApiError(
+            'PAYLOAD_TOO_LARGE', f'Le PointSet dépasse {max_bytes} bytes.', 413
+        )
+    return length
+
+
+def check_upload_header(
+    decoder: PointSetDecoder,
+    length: int,
+    max_points: int | None
+) -> None:
+    """Confronte le compteur de points d'un PointSet envoyé à sa taille.
+
+    Sert de ``check_header`` au décodeur, qui n'alloue son tampon qu'une
+    fois ce contrôle passé.
+
+    Args:
+        decoder: Le décodeur, dont l'en-tête est lu.
+        length: La valeur de Content-Length.
+        max_points: Le nombre maximal de points (MAX_POINTS), ou None.
+
+    Raises:
+        ApiError: Si le PointSet annonce trop de points (413) ou une
+                  taille différente de Content-Length (400).
+    """
+    if max_points is not None and decoder.point_count > max_points:
+        raise too_many_points(decoder.point_count, max_points)
+    if decoder.expected_size != length:
+        raise ApiError(
+            'INVALID_DATA',
+            f'{decoder.point_count} points annoncés ({decoder.expected_size}'
+            f' bytes) pour un Content-Length de {length}', 400
+        )
+
+
+def admit(
+    scheduler: Scheduler,
+    point_count: int,
+    metrics: Metrics | None = None,
+    cancel: CancellationToken | None = None
+) -> Admission:
+    """Attend le tour d'une triangulation dans sa voie.
+
+    Args:
+        scheduler: L'ordonnanceur des triangulations.
+        point_count: Le nombre de points du PointSet.
+        metrics: Les mesures qui reçoivent la durée d'attente.
+        cancel: Jeton dont l'échéance borne l'attente, ou None.
+
+    Returns:
+        Admission: La place accordée, à rendre par scheduler.release.
+
+    Raises:
+        ApiError: Si l'attente estimée dépasse le budget (SERVICE_BUSY)
+                  ou si l'échéance passe avant le tour du calcul
+                  (DEADLINE_EXCEEDED).
+    """
+    try:
+        admission = scheduler.acquire(point_count, cancel)
+    except SchedulerSaturated as e:
+        raise scheduler_busy(e) from None
+    except Cancelled:
+        raise deadline_exceeded() from None
+    if metrics is not None:
+        metrics.observe_queue_wait(admission.lane.name, admission.wait)
+    return admission
+
+
+def psm_api_error(error: Exception, point_set_id: str) -> ApiError:
+    """Traduit une erreur du client PointSetManager en erreur de l'API.
+
+    Args:
+        error: L'erreur levée par le client.
+        point_set_id: L'identifiant du PointSet demandé.
+
+    Returns:
+        ApiError: L'erreur à renvoyer au client.
+    """
+    if isinstance(error, PointSetTooLarge):
+        return too_many_points(error.point_count, error.max_points)
+    if isinstance(error, PointSetNotFound):
+        return ApiError(
+            'NOT_FOUND', f'PointSet {point_set_id} non trouvé.', 404
+        )
+    if isinstance(error, PointSetManagerError):
+        return ApiError('PSM_ERROR', 'Erreur du PointSetManager.', 502)
+    if isinstance(error, CircuitOpenError):
+        return ApiError(
+            'PSM_UNAVAILABLE', 'Le PointSetManager est indisponible.', 503,
+            {'Retry-After': str(max(1, round(error.retry_after)))}
+        )
+    return ApiError(
+        'PSM_UNAVAILABLE', 'Le PointSetManager est indisponible.', 503
+    )
+
+
+def run_triangulation(
+    executor: InlineExecutor | ProcessExecutor,
+    payload: bytes,
+    timeout: float | None,
+    meshes: MeshStore | None = None,
+    series: tuple[str, str | None] | None = None,
+    metrics: Metrics | None = None,
+    point_set: list[tuple[float, float]] | None = None,
+    scheduler: Scheduler | None = None,
+    cancel: CancellationToken | None = None
+) -> tuple[list[tuple[float, float]], TriangleArray, str]:
+    """Désérialise et triangule un PointSet binaire.
+
+    Un PointSet qui appartient à une série (voir delta_series) est
+    triangulé par le stock de maillages, s'il existe: par différence avec
+    le maillage de sa version de base quand c'est possible. Avec un
+    ordonnanceur, le calcul attend d'abord son tour dans la voie qui
+    correspond à sa taille. Un jeton d'annulation interrompt l'attente et
+    le calcul (DEADLINE_EXCEEDED).
+
+    Args:
+        executor: L'exécuteur des triangulations.
+        payload: Le PointSet au format binaire.
+        timeout: Délai maximal de la triangulation, en secondes.
+        meshes: Le stock de maillages (exécuteur 'inline' seulement).
+        series: L'empreinte du PointSet et celle de sa version de base,
+                s'il appartient à une série.
+        metrics: Les mesures qui reçoivent la durée de chaque étape.
+        point_set: Les points déjà décodés pendant la réception, le cas
+                   échéant: payload n'est alors pas désérialisé.
+        scheduler: L'ordonnanceur des triangulations, le cas échéant.
+        cancel: Le jeton d'annulation de la requête, le cas échéant.
+
+    Returns:
+        tuple: Les points, les triangles et le chemin suivi ('delta' ou
+               'full').
+
+    Raises:
+        ApiError: Si les données sont invalides, si la triangulation
+                  échoue, dépasse son délai ou est annulée, ou si
+                  l'exécuteur ou l'ordonnanceur est saturé.
+    """
+    if point_set is None:
+        start = time.perf_counter()
+        try:
+            point_set = deserialize_point_set(payload)
+        except ValueError as e:
+            raise invalid_point_set(e) from None
+        if metrics is not None:
+            metrics.observe_stage(
+                STAGE_DESERIALIZE, time.perf_counter() - start
+            )
+
+    if cancel is not None and cancel.cancelled:
+        raise deadline_exceeded()
+    admission = None
+    if scheduler is not None:
+        admission = admit(scheduler, len(point_set), metrics, cancel)
+
+    start = time.perf_counter()
+    try:
+        if meshes is not None and series is not None:
+            key, base = series
+            triangles, path = executor.call(
+                meshes.triangulate, key, point_set, base, cancel
+            )
+        else:
+            triangles = executor.run(payload, timeout, point_set, cancel)
+            path = PATH_FULL
+    except Cancelled:
+        raise deadline_exceeded() from None
+    except ExecutorSaturated:
+        raise ApiError(
+            'SERVICE_BUSY', 'Trop de triangulations en cours.', 503,
+            {'Retry-After': '1'}
+        ) from None
+    except JobTimeout:
+        raise ApiError(
+            'TRIANGULATION_FAILED',
+            'Échec de la triangulation: délai dépassé.', 500
+        ) from None
+    except Exception as e:
+        raise ApiError(
+            'TRIANGULATION_FAILED', f'Échec de la triangulation: {e}', 500
+        ) from None
+    finally:
+        if admission is not None:
+            scheduler.release(admission)
+    if metrics is not None:
+        metrics.observe_stage(STAGE_TRIANGULATE, time.perf_counter() - start)
+
+    return point_set, triangles, path
+
+
+def _index_map_key(key: str) -> str:
+    """Retourne l'empreinte de la réponse étendue d'un PointSet.
+
+    La réponse étendue a son propre ETag et sa propre entrée de cache.
+
+    Args:
+        key: L'empreinte du PointSet.
+
+    Returns:
+        str: L'empreinte de la réponse avec table des doublons.
+    """
+    return key + '+index-map'
+
+
+def response_tag(key: str, index_map: bool, media_type: str) -> str:
+    """Retourne l'ETag d'une réponse de triangulation.
+
+    Args:
+        key: L'empreinte du PointSet.
+        index_map: Si True, la table des doublons suit les triangles.
+        media_type: Le format négocié (voir encodings).
+
+    Returns:
+        str: L'empreinte de la réponse, sans sa compression.
+    """
+    if index_map:
+        key = _index_map_key(key)
+    return representation_key(key, media_type)
+
+
+def cache_entry(tag: str, encoding: str | None) -> str:
+    """Retourne la clé de cache d'une réponse, compression comprise.
+
+    Args:
+        tag: L'ETag de la réponse.
+        encoding: Sa compression, ou None.
+
+    Returns:
+        str: La clé de cache.
+    """
+    return tag if encoding is None else f'{tag}+{encoding}'
+
+
+def representation_headers(
+    media_type: str,
+    encoding: str | None
+) -> dict[str, str]:
+    """Retourne les en-têtes qui décrivent le format d'une réponse.
+
+    Args:
+        media_type: Le format négocié.
+        encoding: La compression négociée, ou None.
+
+    Returns:
+        dict: Content-Type, Vary et, si besoin, Content-Encoding.
+    """
+    headers = {'Content-Type': media_type, 'Vary': 'Accept, Accept-Encoding'}
+    if encoding is not None:
+        headers['Content-Encoding'] = encoding
+    return headers
+
+
+def triangulation_chunks(
+    point_set: list[tuple[float, float]],
+    triangles: TriangleArray,
+    index_map: bool,
+    media_type: str = FORMAT_TRIANGLES,
+    encoding: str | None = None,
+    metrics: Metrics | None = None
+) -> tuple[int, Iterator[bytes]]:
+    """Prépare l'émission par morceaux d'une triangulation.
+
+    Seul le format par défaut non compressé est produit au fil de l'eau;
+    les autres représentations, plus petites, sont construites d'un bloc.
+
+    Args:
+        point_set: Les points du PointSet.
+        triangles: Les triangles calculés.
+        index_map: Si True, la table des doublons suit les triangles.
+        media_type: Le format négocié.
+        encoding: La compression négociée, ou None.
+        metrics: Les mesures qui reçoivent la taille de la réponse et la
+                 durée de sa sérialisation (comptée quand le dernier
+                 morceau est produit).
+
+    Returns:
+        tuple: La taille totale en bytes et l'itérateur des morceaux.
+    """
+    start = time.perf_counter()
+    if media_type != FORMAT_TRIANGLES or encoding is not None:
+        body = compress(encode_body(
+            point_set, triangles, media_type,
+            deduplicate(point_set)[1] if index_map else None
+        ), encoding)
+        size, chunks = len(body), iter((body,))
+    else:
+        size = triangles_size(len(point_set), len(triangles))
+        chunks = iter_serialize_triangles(point_set, triangles)
+        if index_map:
+            size += index_map_size(len(point_set))
+            chunks = chain(
+                chunks, iter_serialize_index_map(deduplicate(point_set)[1])
+            )
+
+    if metrics is not None:
+        metrics.observe_payload(PAYLOAD_TRIANGLES, size)
+        chunks = metrics.timed(
+            STAGE_SERIALIZE, chunks, time.perf_counter() - start
+        )
+    return size, chunks
+
+
+def iter_mapped(blob: mmap.mmap) -> Iterator[bytes]:
+    """Émet un blob projeté en mémoire par morceaux.
+
+    La projection peut être partagée entre plusieurs réponses: elle est
+    libérée par le ramasse-miettes quand plus aucune ne l'utilise.
+
+    Args:
+        blob: Le blob projeté en mémoire.
+
+    Yields:
+        bytes: Les morceaux successifs du blob.
+    """
+    for start in range(0, len(blob), DEFAULT_CHUNK_SIZE):
+        yield blob[start:start + DEFAULT_CHUNK_SIZE]
+
+
+def store_while_streaming(
+    chunks: Iterator[bytes],
+    cache: ResultCache,
+    key: str
+) -> Iterator[bytes]:
+    """Relaie des morceaux et enregistre le blob complet dans le cache.
+
+    Le blob n'est enregistré que si la réponse a été entièrement émise.
+
+    Args:
+        chunks: Les morceaux de la réponse.
+        cache: Le cache de résultats.
+        key: L'empreinte du PointSet.
+
+    Yields:
+        bytes: Les morceaux, inchangés.
+    """
+    blob = bytearray()
+    for chunk in chunks:
+        blob += chunk
+        yield chunk
+    cache.put(key, blob)
@@ -0,0 +1,174 @@
+"""Regroupement des calculs concurrents identiques (single-flight).
+
+Quand plusieurs requêtes demandent en même temps le même travail, seule
+la première l'exécute; les suivantes attendent son issue et reçoivent le
+même résultat, ou la même exception.
+
+SingleFlight sert les threads de l'application Flask, AsyncSingleFlight
+les coroutines de l'application ASGI.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlightTimeout(Exception):
+    """L'attente du calcul en cours a dépassé le délai maximal."""
+
+
+class _Call:
+    """Calcul en cours partagé entre l'exécutant et ses attentes."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+        """Initialise un calcul sans issue."""
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Exécute au plus un calcul à la fois par clé."""
+
+    def __init__(self, max_wait: float | None = None) -> None:
+        """Initialise le groupe de calculs.
+
+        Args:
+            max_wait: Durée maximale d'attente d'un calcul en cours, en
+                      secondes. Si None, l'attente n'est pas bornée.
+        """
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.timeouts = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Exécute fn, ou attend l'issue du calcul déjà lancé pour key.
+
+        Args:
+            key: Clé identifiant le calcul.
+            fn: Le calcul à exécuter.
+
+        Returns:
+            Le résultat du calcul.
+
+        Raises:
+            SingleFlightTimeout: Si le calcul en cours ne s'est pas terminé
+                                 dans le délai maximal.
+            Exception: L'exception levée par le calcul, le cas échéant.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+            return call.result
+
+        if not call.done.wait(self.max_wait):
+            with self._lock:
+                self.timeouts += 1
+            raise SingleFlightTimeout(key)
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self) -> dict[str, int]:
+        """Retourne les compteurs du groupe.
+
+        Returns:
+            dict: Calculs exécutés, requêtes regroupées, attentes expirées
+                  et calculs en cours.
+        """
+        with self._lock:
+            return {
+                'executions': self.executions,
+                'coalesced': self.coalesced,
+                'timeouts': self.timeouts,
+                'in_flight': len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """Exécute au plus une coroutine à la fois par clé."""
+
+    def __init__(self, max_wait: float | None = None) -> None:
+        """Initialise le groupe de calculs.
+
+        Args:
+            max_wait: Durée maximale d'attente d'un calcul en cours, en
+                      secondes. Si None, l'attente n'est pas bornée.
+        """
+        self.max_wait = max_wait
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.timeouts = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Exécute fn, ou attend l'issue du calcul déjà lancé pour key.
+
+        Le calcul tourne dans sa propre tâche: l'annulation d'une requête
+        qui l'attend ne l'interrompt pas pour les autres.
+
+        Args:
+            key: Clé identifiant le calcul.
+            fn: Fonction qui renvoie la coroutine du calcul.
+
+        Returns:
+            Le résultat du calcul.
+
+        Raises:
+            SingleFlightTimeout: Si le calcul en cours ne s'est pas terminé
+                                 dans le délai maximal.
+            Exception: L'exception levée par le calcul, le cas échéant.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            self.executions += 1
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+            return await asyncio.shield(call)
+
+        self.coalesced += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(call), self.max_wait)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise SingleFlightTimeout(key) from None
+
+    def stats(self) -> dict[str, int]:
+        """Retourne les compteurs du groupe.
+
+        Returns:
+            dict: Calculs exécutés, requêtes regroupées, attentes expirées
+                  et calculs en cours.
+        """
+        return {
+            'executions': self.executions,
+            'coalesced': self.coalesced,
+            'timeouts': self.timeouts,
+            'in_flight': len(self._calls),
+        }
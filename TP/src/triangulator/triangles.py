@@ -0,0 +1,140 @@
+"""Conteneur compact des triangles d'une triangulation.
+
+Une liste de tuples coûte plusieurs objets Python par triangle (le tuple
+et ses trois entiers, soit plus de 100 bytes); TriangleArray range les
+indices dans un unique tableau d'entiers 32 bits, soit 12 bytes par
+triangle. Le conteneur se comporte comme une séquence de tuples
+(i1, i2, i3) en lecture, ce qui le rend interchangeable avec l'ancienne
+liste pour les appelants, et ses indices se sérialisent en une seule
+écriture.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain
+
+_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+
+
+class TriangleArray(Sequence):
+    """Séquence de triangles (i1, i2, i3) stockée dans un array('I').
+
+    Les indices sont rangés à plat, dans l'ordre natif de la machine:
+    ``indices[3 * t:3 * t + 3]`` sont les sommets du triangle ``t``.
+    """
+
+    __slots__ = ('indices',)
+
+    def __init__(self, indices: Iterable[int] = ()) -> None:
+        """Initialise le conteneur.
+
+        Args:
+            indices: Les indices i1, i2, i3, i1, i2, i3... Un array du bon
+                     type est repris tel quel, sans copie.
+
+        Raises:
+            ValueError: Si le nombre d'indices n'est pas un multiple de 3.
+        """
+        if not (isinstance(indices, array) and indices.typecode == _UINT32):
+            indices = array(_UINT32, indices)
+        if len(indices) % 3:
+            raise ValueError(
+                f"{len(indices)} indices ne forment pas des triangles"
+            )
+        self.indices = indices
+
+    @classmethod
+    def from_triangles(
+        cls,
+        triangles: Iterable[tuple[int, int, int]]
+    ) -> 'TriangleArray':
+        """Construit le conteneur à partir de tuples (i1, i2, i3).
+
+        Args:
+            triangles: Les triangles.
+
+        Returns:
+            TriangleArray: Les mêmes triangles, à plat.
+        """
+        return cls(array(_UINT32, chain.from_iterable(triangles)))
+
+    def __len__(self) -> int:
+        """Retourne le nombre de triangles."""
+        return len(self.indices) // 3
+
+    def __getitem__(
+        self,
+        index: int | slice
+    ) -> 'tuple[int, int, int] | TriangleArray':
+        """Retourne un triangle, ou un nouveau conteneur pour une tranche.
+
+        Args:
+            index: Position du triangle (négative acceptée) ou tranche.
+
+        Returns:
+            Le tuple (i1, i2, i3), ou un TriangleArray pour une tranche.
+
+        Raises:
+            IndexError: Si la position est hors limites.
+        """
+        if isinstance(index, slice):
+            positions = range(len(self))[index]
+            if positions.step == 1:
+                return TriangleArray(
+                    self.indices[3 * positions.start:3 * positions.stop]
+                )
+            return TriangleArray.from_triangles(self[t] for t in positions)
+
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('indice de triangle hors limites')
+        base = 3 * index
+        indices = self.indices
+        return indices[base], indices[base + 1], indices[base + 2]
+
+    def __iter__(self) -> Iterator[tuple[int, int, int]]:
+        """Parcourt les triangles sous forme de tuples."""
+        it = iter(self.indices)
+        return zip(it, it, it)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare à un autre conteneur ou à une séquence de triangles."""
+        if isinstance(other, TriangleArray):
+            return self.indices == other.indices
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                mine == tuple(theirs) for mine, theirs in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Retourne une représentation lisible (triangles en tuples)."""
+        return f'TriangleArray({list(self)!r})'
+
+    def tobytes(self) -> bytes:
+        """Retourne les indices en bytes, dans l'ordre natif.
+
+        Returns:
+            bytes: 12 bytes par triangle.
+        """
+        return self.indices.tobytes()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Expose les indices par le protocole buffer (Python 3.12+).
+
+        Sur les versions antérieures, memoryview(triangles.indices) donne
+        la même vue.
+
+        Args:
+            flags: Les drapeaux de la requête de buffer.
+
+        Returns:
+            memoryview: Une vue des indices, sans copie.
+        """
+        return memoryview(self.indices)
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        """Libère une vue obtenue par __buffer__."""
+        view.release()
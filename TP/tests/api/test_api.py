@@ -1,15 +1,38 @@
 """Tests d'API pour le micro-service Triangulator."""
 
+import random
 import struct
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 
+from src.triangulator.core import triangulate
+from src.triangulator.serialization import (
+    deserialize_triangles,
+    serialize_point_set,
+    serialize_triangles,
+)
+
 
 @pytest.fixture
 def mock_requests_get():
-    """Fixture pour mocker requests.get."""
-    with patch('src.triangulator.app.requests.get') as mock_get:
+    """Fixture pour mocker les requêtes du client PointSetManager.
+
+    Le client lit les réponses en flux: le contenu ``content`` des réponses
+    simulées est servi par ``iter_content``.
+    """
+    with patch('src.triangulator.psm_client.requests.Session.get') as mock_get:
+        def streamed(*args, **kwargs):
+            response = mock_get.return_value
+            if isinstance(response.content, bytes):
+                response.iter_content.side_effect = (
+                    lambda *a, **k: iter([response.content])
+                )
+            return response
+
+        mock_get.side_effect = streamed
         yield mock_get
 
 
@@ -31,6 +54,88 @@ def test_triangulate_happy_path(client, mock_requests_get):
     assert len(response.data) > 0
 
 
+def test_triangulate_streams_response(client, mock_requests_get):
+    """Test que la réponse est envoyée par morceaux avec sa taille exacte."""
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = serialize_point_set(points)
+    mock_requests_get.return_value = mock_response
+
+    response = client.get('/triangulation/square')
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert int(response.headers['Content-Length']) == len(response.data)
+    assert response.data == serialize_triangles(points, triangulate(points))
+
+
+def _square_response():
+    """Construit une réponse PSM contenant un carré de 4 points."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = serialize_point_set(
+        [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    )
+    return mock_response
+
+
+def test_triangulate_cached_result(client, mock_requests_get):
+    """Test qu'un PointSet déjà triangulé est servi depuis le cache."""
+    mock_requests_get.return_value = _square_response()
+
+    first = client.get('/triangulation/square')
+    first_data = first.data
+    second = client.get('/triangulation/square')
+
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.data == first_data
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert mock_requests_get.call_count == 1
+
+
+def test_triangulate_same_content_shares_cache_entry(client, mock_requests_get):
+    """Test que deux IDs de même contenu partagent l'entrée du cache."""
+    mock_requests_get.return_value = _square_response()
+
+    assert client.get('/triangulation/square-1').data
+    response = client.get('/triangulation/square-2')
+
+    assert response.headers['X-Cache'] == 'HIT'
+    assert mock_requests_get.call_count == 2
+
+
+def test_triangulate_if_none_match(client, mock_requests_get):
+    """Test qu'un client qui a déjà le résultat reçoit un 304."""
+    mock_requests_get.return_value = _square_response()
+
+    first = client.get('/triangulation/square')
+    etag = first.headers['ETag']
+    assert first.data
+    response = client.get(
+        '/triangulation/square', headers={'If-None-Match': etag}
+    )
+
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert response.data == b''
+
+
+def test_triangulate_without_cache(mock_requests_get):
+    """Test que le cache peut être désactivé."""
+    from src.triangulator.app import create_app
+
+    client = create_app(config={'CACHE_MAX_BYTES': 0}).test_client()
+    mock_requests_get.return_value = _square_response()
+
+    client.get('/triangulation/square')
+    response = client.get('/triangulation/square')
+
+    assert response.headers['X-Cache'] == 'MISS'
+    assert mock_requests_get.call_count == 2
+
+
 def test_triangulate_psm_not_found(client, mock_requests_get):
     """Test du cas où le PointSet n'est pas trouvé."""
     mock_response = Mock()
@@ -55,6 +160,17 @@ def test_triangulate_invalid_method(client):
     """Test d'une méthode HTTP invalide."""
     response = client.post('/triangulation/123')
     assert response.status_code == 405
+    assert response.headers['Allow'] == 'GET, HEAD, OPTIONS'
+    assert response.get_json()['code'] == 'METHOD_NOT_ALLOWED'
+
+
+def test_unknown_route(client):
+    """Test qu'une route inconnue répond avec une erreur JSON."""
+    response = client.get('/inconnue')
+    assert response.status_code == 404
+    assert response.get_json() == {
+        'code': 'NOT_FOUND', 'message': 'Ressource inconnue.'
+    }
 
 
 def test_triangulate_psm_unavailable(client, mock_requests_get):
@@ -77,3 +193,232 @@ def test_triangulate_empty_point_set(client, mock_requests_get):
 
     response = client.get('/triangulation/empty-set')
     assert response.status_code == 200
+
+
+def test_triangulate_in_process_pool(mock_requests_get):
+    """Test que le pool de processus produit la même réponse."""
+    from src.triangulator.app import create_app
+
+    app = create_app(config={'EXECUTOR': 'process', 'EXECUTOR_WORKERS': 1})
+    mock_requests_get.return_value = _square_response()
+    try:
+        response = app.test_client().get('/triangulation/square')
+        points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+
+        assert response.status_code == 200
+        assert response.data == serialize_triangles(points, triangulate(points))
+    finally:
+        app.extensions['triangulator_executor'].close()
+
+
+def test_triangulate_timeout(mock_requests_get):
+    """Test qu'une triangulation trop longue est interrompue."""
+    from src.triangulator.app import create_app
+
+    app = create_app(config={
+        'EXECUTOR': 'process',
+        'EXECUTOR_WORKERS': 1,
+        'TRIANGULATION_TIMEOUT': 0.01,
+    })
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = serialize_point_set(
+        [(float(i % 150), float(i // 150) + 0.001 * i) for i in range(20000)]
+    )
+    mock_requests_get.return_value = mock_response
+    try:
+        response = app.test_client().get('/triangulation/large')
+
+        assert response.status_code == 500
+        assert response.json['code'] == 'TRIANGULATION_FAILED'
+    finally:
+        app.extensions['triangulator_executor'].close()
+
+
+def test_triangulate_updated_point_set_by_delta():
+    """Test qu'un PointSet renvoyé avec sa base est triangulé par différence."""
+    from src.triangulator.app import create_app
+
+    client = create_app(config={'CACHE_ID_MAP': False}).test_client()
+    points = [(float(i % 20), float(i // 20) + 0.01 * (i % 7))
+              for i in range(400)]
+    changed = points[:-4] + [(15.0, 3.5), (2.5, 7.5), (9.5, 9.5), (3.3, 1.1)]
+
+    first = client.post('/triangulation', data=serialize_point_set(points),
+                        headers={'X-Triangulation-Base': '*'})
+    second = client.post('/triangulation', data=serialize_point_set(changed),
+                         headers={'X-Triangulation-Base': first.headers['ETag']})
+    unrelated = client.post('/triangulation',
+                            data=serialize_point_set(changed[1:]))
+
+    assert first.headers['X-Triangulation-Path'] == 'full'
+    assert second.headers['X-Triangulation-Path'] == 'delta'
+    assert unrelated.headers['X-Triangulation-Path'] == 'full'
+    triangles = deserialize_triangles(second.data)[1]
+    assert ({tuple(sorted(t)) for t in triangles}
+            == {tuple(sorted(t)) for t in triangulate(changed)})
+
+
+def test_triangulate_by_id_does_not_keep_meshes(mock_requests_get):
+    """Test qu'un PointSet récupéré par identifiant n'entre pas dans le stock."""
+    from src.triangulator.app import create_app
+
+    app = create_app()
+    mock_requests_get.return_value = _square_response()
+    response = app.test_client().get('/triangulation/square')
+
+    assert response.headers['X-Triangulation-Path'] == 'full'
+    assert app.extensions['triangulator_meshes'].stats()['meshes'] == 0
+
+
+def test_triangulate_without_delta_in_process_pool(mock_requests_get):
+    """Test que le pool de processus ne garde aucun maillage."""
+    from src.triangulator.app import create_app
+
+    app = create_app(config={'EXECUTOR': 'process', 'EXECUTOR_WORKERS': 1})
+    mock_requests_get.return_value = _square_response()
+    try:
+        response = app.test_client().get('/triangulation/square')
+
+        assert app.extensions['triangulator_meshes'] is None
+        assert response.headers['X-Triangulation-Path'] == 'full'
+    finally:
+        app.extensions['triangulator_executor'].close()
+
+
+def _sample(text, name):
+    """Retourne la valeur d'une ligne de /metrics."""
+    for line in text.splitlines():
+        if line.startswith(name + ' '):
+            return float(line.rsplit(' ', 1)[1])
+    return None
+
+
+def test_metrics_stages_sizes_and_errors(client, mock_requests_get):
+    """Test que /metrics publie les durées, les tailles et les erreurs."""
+    mock_requests_get.return_value = _square_response()
+    size = len(client.get('/triangulation/square').data)
+    mock_requests_get.return_value = Mock(status_code=404)
+    client.get('/triangulation/missing')
+
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+    text = response.get_data(as_text=True)
+    for stage in ('fetch', 'deserialize', 'triangulate', 'serialize'):
+        assert _sample(
+            text, f'triangulator_stage_duration_seconds_count{{stage="{stage}"}}'
+        ) == 1
+    assert _sample(
+        text, 'triangulator_payload_size_bytes_sum{kind="triangles"}'
+    ) == size
+    assert _sample(text, 'triangulator_errors_total{code="NOT_FOUND"}') == 1
+    assert _sample(text, 'triangulator_cache_entries') == 1
+    assert _sample(text, 'triangulator_points_inserted_total') == 0
+    assert _sample(
+        text, 'triangulator_queue_wait_seconds_count{lane="light"}'
+    ) == 1
+    assert _sample(text, 'triangulator_scheduler_light_admitted') == 1
+    assert _sample(text, 'triangulator_scheduler_heavy_queued') == 0
+    assert _sample(text, 'triangulator_predicates_exact_orient2d') is not None
+    assert _sample(text, 'triangulator_singleflight_executions') == 3
+    assert _sample(text, 'triangulator_singleflight_in_flight') == 0
+    assert _sample(text, 'triangulator_predicates_exact_incircle') is not None
+
+
+def test_metrics_triangulation_counters(mock_requests_get):
+    """Test des compteurs internes de triangulate, activés par la config."""
+    from src.triangulator.app import create_app
+    from src.triangulator.core import set_stats_hook
+
+    try:
+        client = create_app(
+            config={'METRICS_TRIANGULATION_COUNTERS': True}
+        ).test_client()
+        mock_requests_get.return_value = _square_response()
+        client.get('/triangulation/square')
+        client.post('/triangulation', data=serialize_point_set(
+            [(0.0, 0.0), (2.0, 0.0), (0.0, 2.0)]
+        ))
+        text = client.get('/metrics').get_data(as_text=True)
+    finally:
+        set_stats_hook(None)
+
+    assert _sample(text, 'triangulator_instrumented_triangulations_total') == 2
+    assert _sample(text, 'triangulator_points_inserted_total') == 7
+    assert _sample(text, 'triangulator_incircle_tests_total') > 0
+    assert _sample(text, 'triangulator_cavity_triangles_total') >= 7
+
+
+def test_metrics_without_counters_removes_hook():
+    """Test qu'une application sans compteurs retire le crochet installé."""
+    from src.triangulator.app import create_app
+
+    counted = create_app(config={'METRICS_TRIANGULATION_COUNTERS': True})
+    client = create_app().test_client()
+    client.post('/triangulation', data=serialize_point_set(
+        [(0.0, 0.0), (2.0, 0.0), (0.0, 2.0)]
+    ))
+
+    text = counted.test_client().get('/metrics').get_data(as_text=True)
+    assert _sample(text, 'triangulator_instrumented_triangulations_total') == 0
+
+
+def test_scheduler_lanes_and_rejection(mock_requests_get):
+    """Test des voies de l'ordonnanceur et du refus au-delà du budget."""
+    from src.triangulator.app import create_app
+
+    app = create_app(config={
+        'SCHEDULER_HEAVY_POINTS': 100,
+        'SCHEDULER_LIGHT_WORKERS': 1,
+        'SCHEDULER_MAX_WAIT': 0.0,
+    })
+    client = app.test_client()
+    scheduler = app.extensions['triangulator_scheduler']
+    mock_requests_get.return_value = _square_response()
+
+    heavy = scheduler.acquire(1_000_000)
+    try:
+        assert client.get('/triangulation/square').status_code == 200
+
+        light = scheduler.acquire(50)
+        try:
+            response = client.get('/triangulation/other')
+        finally:
+            scheduler.release(light)
+    finally:
+        scheduler.release(heavy)
+
+    assert response.status_code == 503
+    assert response.get_json()['code'] == 'SERVICE_BUSY'
+    assert int(response.headers['Retry-After']) >= 1
+    assert scheduler.stats()['light_rejected'] == 1
+
+
+def test_coalesced_request_outlives_leader_deadline(psm_server):
+    """Test qu'une requête regroupée relance le calcul d'un meneur expiré."""
+    from src.triangulator.app import create_app
+
+    rng = random.Random(2)
+    psm_server.set_point_set('big', serialize_point_set(
+        [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(20000)]
+    ))
+    app = create_app(psm_server.url, {'CACHE_MAX_BYTES': 0})
+    responses = {}
+
+    def get(name, headers):
+        responses[name] = app.test_client().get('/triangulation/big',
+                                                 headers=headers)
+
+    leader = threading.Thread(
+        target=get, args=('leader', {'X-Request-Timeout': '0.3'})
+    )
+    leader.start()
+    time.sleep(0.1)
+    get('follower', {})
+    leader.join()
+
+    assert responses['leader'].status_code == 504
+    assert responses['leader'].get_json()['code'] == 'DEADLINE_EXCEEDED'
+    assert responses['follower'].status_code == 200
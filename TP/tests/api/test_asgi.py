@@ -0,0 +1,365 @@
+"""Tests de l'application ASGI contre un PointSetManager de substitution."""
+
+import asyncio
+import random
+import struct
+import time
+import tracemalloc
+
+import httpx
+
+from src.triangulator import asgi
+from src.triangulator.app import create_app
+from src.triangulator.asgi import create_asgi_app
+from src.triangulator.cache import content_key
+from src.triangulator.serialization import (
+    BATCH_RECORD_ERROR,
+    BATCH_RECORD_TRIANGLES,
+    decode_batch,
+    serialize_point_set,
+)
+
+SQUARE = serialize_point_set([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)])
+
+
+async def _requests(app, *calls):
+    """Envoie des requêtes à l'application ASGI et retourne les réponses.
+
+    Comme le client de test Flask, les requêtes ne demandent aucune
+    compression (httpx propose gzip par défaut).
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://t',
+                                 headers={'Accept-Encoding': 'identity'}) as c:
+        responses = []
+        for method, url, kwargs in calls:
+            responses.append(await c.request(method, url, **kwargs))
+    await app.aclose()
+    return responses
+
+
+def test_asgi_matches_flask(psm_server):
+    """Test que les deux applications donnent les mêmes réponses."""
+    psm_server.set_point_set('abc', SQUARE)
+    flask_client = create_app(psm_server.url).test_client()
+    expected_ok = flask_client.get('/triangulation/abc')
+    expected_missing = flask_client.get('/triangulation/missing')
+
+    ok, missing = asyncio.run(_requests(
+        create_asgi_app(psm_server.url),
+        ('GET', '/triangulation/abc', {}),
+        ('GET', '/triangulation/missing', {}),
+    ))
+
+    assert ok.status_code == 200
+    assert ok.content == expected_ok.data
+    assert ok.headers['ETag'] == expected_ok.headers['ETag']
+    assert missing.status_code == 404
+    assert missing.content == expected_missing.data
+    assert missing.headers['Content-Type'] == 'application/json'
+
+
+def test_asgi_routing_matches_flask(psm_server):
+    """Test que routes inconnues, méthodes refusées et HEAD suivent Flask."""
+    psm_server.set_point_set('abc', SQUARE)
+    flask_client = create_app(psm_server.url).test_client()
+    calls = [
+        ('GET', '/inconnue'),
+        ('POST', '/triangulation/abc'),
+        ('GET', '/triangulation'),
+        ('OPTIONS', '/triangulation/batch'),
+        ('HEAD', '/triangulation/abc'),
+    ]
+    expected = [flask_client.open(url, method=method) for method, url in calls]
+
+    responses = asyncio.run(_requests(
+        create_asgi_app(psm_server.url),
+        *[(method, url, {}) for method, url in calls]
+    ))
+
+    for (method, _), response, flask_response in zip(calls, responses, expected):
+        assert response.status_code == flask_response.status_code
+        if method != 'OPTIONS':
+            assert response.content == flask_response.data
+        allow = response.headers.get('Allow', '').split(', ')
+        assert set(allow) == set(flask_response.headers.get('Allow', '').split(', '))
+    head = responses[-1]
+    assert head.status_code == 200
+    assert head.content == b''
+    assert head.headers['ETag'] == expected[-1].headers['ETag']
+
+
+def test_asgi_cache_and_if_none_match(psm_server):
+    """Test du cache et des réponses 304."""
+    psm_server.set_point_set('abc', SQUARE)
+
+    first, second, third = asyncio.run(_requests(
+        create_asgi_app(psm_server.url),
+        ('GET', '/triangulation/abc', {}),
+        ('GET', '/triangulation/abc', {}),
+        ('GET', '/triangulation/abc',
+         {'headers': {'If-None-Match': f'"{content_key(SQUARE)}"'}}),
+    ))
+
+    assert first.headers['X-Cache'] == 'MISS'
+    assert second.headers['X-Cache'] == 'HIT'
+    assert third.status_code == 304
+    assert psm_server.requests == 1
+
+
+def test_asgi_upload_and_batch(psm_server):
+    """Test des endpoints d'envoi direct et par lot."""
+    psm_server.set_point_set('abc', SQUARE)
+
+    upload, mismatch, batch = asyncio.run(_requests(
+        create_asgi_app(psm_server.url),
+        ('POST', '/triangulation', {'content': SQUARE}),
+        ('POST', '/triangulation', {'content': SQUARE[:-8]}),
+        ('POST', '/triangulation/batch',
+         {'json': {'pointSetIds': ['abc', 'missing']}}),
+    ))
+
+    assert upload.status_code == 200
+    assert mismatch.status_code == 400
+    assert mismatch.json()['code'] == 'INVALID_DATA'
+    records = decode_batch(batch.content)
+    assert records[0] == (BATCH_RECORD_TRIANGLES, upload.content)
+    assert records[1][0] == BATCH_RECORD_ERROR
+
+
+def test_asgi_index_map(psm_server):
+    """Test que la réponse étendue est identique à celle de Flask."""
+    body = serialize_point_set([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (0.0, 0.0)])
+    psm_server.set_point_set('abc', body)
+    expected = create_app(psm_server.url).test_client().get(
+        '/triangulation/abc?indexMap=true'
+    )
+
+    first, second = asyncio.run(_requests(
+        create_asgi_app(psm_server.url),
+        ('GET', '/triangulation/abc?indexMap=true', {}),
+        ('POST', '/triangulation?indexMap=true', {'content': body}),
+    ))
+
+    assert first.content == second.content == expected.data
+    assert first.headers['ETag'] == expected.headers['ETag']
+    assert second.headers['X-Cache'] == 'HIT'
+
+
+def test_asgi_delta_path():
+    """Test qu'un PointSet renvoyé avec sa base est triangulé par différence."""
+    points = [(float(i % 10), float(i // 10)) for i in range(100)]
+    app = create_asgi_app()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport,
+                                     base_url='http://t') as c:
+            first = await c.post(
+                '/triangulation', content=serialize_point_set(points),
+                headers={'X-Triangulation-Base': '*'}
+            )
+            second = await c.post(
+                '/triangulation',
+                content=serialize_point_set(points[1:] + [(4.5, 4.5)]),
+                headers={'X-Triangulation-Base': first.headers['ETag']}
+            )
+        await app.aclose()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.headers['X-Triangulation-Path'] == 'full'
+    assert second.headers['X-Triangulation-Path'] == 'delta'
+
+
+def test_asgi_fetches_do_not_block(psm_server):
+    """Test que des récupérations lentes se recouvrent sans threads dédiés."""
+    ids = [f'id-{i}' for i in range(20)]
+    for i, point_set_id in enumerate(ids):
+        psm_server.set_point_set(
+            point_set_id, serialize_point_set([(0.0, 0.0), (1.0, i), (i, 1.0)])
+        )
+    psm_server.delay = 0.2
+    app = create_asgi_app(psm_server.url, config={'PSM_POOL_SIZE': 20})
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://t') as c:
+            responses = await asyncio.gather(
+                *(c.get(f'/triangulation/{i}') for i in ids)
+            )
+        await app.aclose()
+        return responses
+
+    start = time.monotonic()
+    responses = asyncio.run(run())
+    elapsed = time.monotonic() - start
+
+    assert [r.status_code for r in responses] == [200] * 20
+    assert elapsed < 20 * 0.2 / 4
+
+
+def test_asgi_serialization_runs_off_loop(psm_server, monkeypatch):
+    """Test que la préparation et l'émission du corps ne bloquent pas la boucle."""
+    psm_server.set_point_set('abc', SQUARE)
+    prepare = asgi.triangulation_chunks
+
+    def slow_chunks(*args):
+        size, chunks = prepare(*args)
+
+        def slow():
+            time.sleep(0.3)
+            yield from chunks
+
+        time.sleep(0.3)
+        return size, slow()
+
+    monkeypatch.setattr(asgi, 'triangulation_chunks', slow_chunks)
+    app = create_asgi_app(psm_server.url, config={'CACHE_MAX_BYTES': 0})
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://t') as c:
+            start = time.monotonic()
+            triangulation = asyncio.ensure_future(c.get('/triangulation/abc'))
+            await asyncio.sleep(0.1)
+            metrics = await c.get('/metrics')
+            elapsed = time.monotonic() - start
+            await triangulation
+        await app.aclose()
+        return triangulation.result(), metrics, elapsed
+
+    triangulation, metrics, elapsed = asyncio.run(run())
+
+    assert triangulation.status_code == metrics.status_code == 200
+    assert triangulation.content == create_app(psm_server.url).test_client().get(
+        '/triangulation/abc'
+    ).data
+    assert elapsed < 0.25
+
+
+def test_asgi_metrics(psm_server):
+    """Test que /metrics publie les mêmes mesures que Flask."""
+    psm_server.set_point_set('abc', SQUARE)
+
+    _, _, metrics = asyncio.run(_requests(
+        create_asgi_app(psm_server.url),
+        ('GET', '/triangulation/abc', {}),
+        ('GET', '/triangulation/missing', {}),
+        ('GET', '/metrics', {}),
+    ))
+
+    assert metrics.status_code == 200
+    assert metrics.headers['Content-Type'].startswith('text/plain')
+    for stage in ('fetch', 'deserialize', 'triangulate', 'serialize'):
+        assert (f'triangulator_stage_duration_seconds_count{{stage="{stage}"}} 1'
+                in metrics.text)
+    assert 'triangulator_errors_total{code="NOT_FOUND"} 1' in metrics.text
+    assert 'triangulator_predicates_exact_incircle ' in metrics.text
+    assert 'triangulator_singleflight_executions 3' in metrics.text
+
+
+def test_asgi_too_many_points(psm_server):
+    """Test que la limite de points s'applique comme avec Flask."""
+    psm_server.set_point_set('abc', SQUARE)
+
+    fetched, uploaded = asyncio.run(_requests(
+        create_asgi_app(psm_server.url, {'MAX_POINTS': 3}),
+        ('GET', '/triangulation/abc', {}),
+        ('POST', '/triangulation', {'content': SQUARE}),
+    ))
+
+    assert fetched.status_code == uploaded.status_code == 413
+    assert fetched.json()['code'] == uploaded.json()['code'] == 'TOO_MANY_POINTS'
+
+
+def test_asgi_upload_header_checked_before_allocating():
+    """Test que l'en-tête est refusé avant tout dimensionnement du tampon."""
+    tracemalloc.start()
+    try:
+        mismatch, huge = asyncio.run(_requests(
+            create_asgi_app(),
+            ('POST', '/triangulation', {'content': struct.pack('<I', 1_000_000)}),
+            ('POST', '/triangulation', {'content': struct.pack('<I', 0xFFFFFFFF)}),
+        ))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert mismatch.status_code == 400
+    assert mismatch.json()['code'] == 'INVALID_DATA'
+    assert huge.status_code == 413
+    assert huge.json()['code'] == 'TOO_MANY_POINTS'
+    assert peak < 4 << 20
+
+
+def test_asgi_scheduler_rejection(psm_server):
+    """Test que l'ordonnanceur refuse comme avec Flask."""
+    psm_server.set_point_set('abc', SQUARE)
+    app = create_asgi_app(psm_server.url, {
+        'SCHEDULER_LIGHT_WORKERS': 1,
+        'SCHEDULER_MAX_WAIT': 0.0,
+    })
+    held = app.scheduler.acquire(50)
+
+    busy, = asyncio.run(_requests(app, ('GET', '/triangulation/abc', {})))
+    app.scheduler.release(held)
+
+    assert busy.status_code == 503
+    assert busy.json()['code'] == 'SERVICE_BUSY'
+    assert 'Retry-After' in busy.headers
+
+
+def test_asgi_deadline_header(psm_server):
+    """Test que l'échéance de la requête s'applique comme avec Flask."""
+    psm_server.set_point_set('abc', SQUARE)
+
+    expired, invalid = asyncio.run(_requests(
+        create_asgi_app(psm_server.url),
+        ('GET', '/triangulation/abc', {'headers': {'X-Request-Timeout': '0'}}),
+        ('POST', '/triangulation', {'content': SQUARE,
+                                    'headers': {'X-Request-Timeout': 'x'}}),
+    ))
+
+    assert expired.status_code == 504
+    assert expired.json()['code'] == 'DEADLINE_EXCEEDED'
+    assert invalid.status_code == 400
+    assert invalid.json()['code'] == 'INVALID_REQUEST'
+
+
+def test_asgi_disconnect_cancels_computation():
+    """Test qu'un client déconnecté libère le thread de son calcul."""
+    rng = random.Random(4)
+    body = serialize_point_set(
+        [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(20000)]
+    )
+    app = create_asgi_app(config={'CACHE_MAX_BYTES': 0})
+    scope = {
+        'type': 'http', 'method': 'POST', 'path': '/triangulation',
+        'query_string': b'',
+        'headers': [(b'content-length', str(len(body)).encode())],
+    }
+    messages = []
+    disconnected_at = []
+
+    async def receive():
+        if not messages:
+            messages.append(body)
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+        await asyncio.sleep(0.1)
+        disconnected_at.append(time.perf_counter())
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        messages.append(message)
+
+    async def scenario():
+        await app(scope, receive, send)
+        await app.aclose()
+
+    asyncio.run(scenario())
+
+    assert time.perf_counter() - disconnected_at[0] < 0.2
+    assert messages[1]['status'] == 504
+    assert app.scheduler.stats()['light_running'] == 0
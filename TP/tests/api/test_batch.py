@@ -0,0 +1,106 @@
+"""Tests de l'endpoint de triangulation par lot."""
+
+import json
+import time
+
+from src.triangulator.app import create_app
+from src.triangulator.core import triangulate
+from src.triangulator.serialization import (
+    BATCH_RECORD_ERROR,
+    BATCH_RECORD_TRIANGLES,
+    decode_batch,
+    serialize_point_set,
+    serialize_triangles,
+)
+
+
+def _square(offset):
+    """Retourne un carré de 4 points décalé de offset."""
+    return [(offset, 0.0), (offset + 1, 0.0), (offset + 1, 1.0), (offset, 1.0)]
+
+
+def test_batch_mixes_results_and_errors(psm_server):
+    """Test qu'un identifiant inconnu n'interrompt pas le lot."""
+    psm_server.set_point_set('a', serialize_point_set(_square(0.0)))
+    psm_server.set_point_set('b', serialize_point_set(_square(5.0)))
+    client = create_app(psm_server.url).test_client()
+
+    response = client.post(
+        '/triangulation/batch', json={'pointSetIds': ['a', 'missing', 'b']}
+    )
+    records = decode_batch(response.data)
+
+    assert response.status_code == 200
+    assert [kind for kind, _ in records] == [
+        BATCH_RECORD_TRIANGLES, BATCH_RECORD_ERROR, BATCH_RECORD_TRIANGLES
+    ]
+    for (_, payload), points in zip(records[::2], (_square(0.0), _square(5.0))):
+        assert payload == serialize_triangles(points, triangulate(points))
+    error = json.loads(records[1][1])
+    assert error['code'] == 'NOT_FOUND'
+    assert error['status'] == 404
+
+
+def test_batch_fetches_concurrently(psm_server):
+    """Test que les PointSets d'un lot sont récupérés en parallèle."""
+    ids = [f'id-{i}' for i in range(4)]
+    for i, point_set_id in enumerate(ids):
+        psm_server.set_point_set(point_set_id, serialize_point_set(_square(i)))
+    psm_server.delay = 0.3
+    client = create_app(
+        psm_server.url, config={'BATCH_CONCURRENCY': 4}
+    ).test_client()
+
+    start = time.monotonic()
+    response = client.post('/triangulation/batch', json={'pointSetIds': ids})
+    records = decode_batch(response.data)
+    elapsed = time.monotonic() - start
+
+    assert [kind for kind, _ in records] == [BATCH_RECORD_TRIANGLES] * 4
+    assert elapsed < 4 * 0.3
+
+
+def test_batch_uses_cache(psm_server):
+    """Test qu'un lot réutilise les résultats déjà en cache."""
+    psm_server.set_point_set('a', serialize_point_set(_square(0.0)))
+    client = create_app(psm_server.url).test_client()
+
+    single = client.get('/triangulation/a').data
+    response = client.post('/triangulation/batch', json={'pointSetIds': ['a']})
+
+    assert decode_batch(response.data) == [(BATCH_RECORD_TRIANGLES, single)]
+    assert psm_server.requests == 1
+
+
+def test_batch_invalid_body(client):
+    """Test qu'un corps invalide est refusé."""
+    response = client.post('/triangulation/batch', json={'ids': 'a'})
+
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'INVALID_REQUEST'
+
+
+def test_batch_too_large():
+    """Test qu'un lot trop grand est refusé."""
+    client = create_app(config={'BATCH_MAX_ITEMS': 2}).test_client()
+
+    response = client.post(
+        '/triangulation/batch', json={'pointSetIds': ['a', 'b', 'c']}
+    )
+
+    assert response.status_code == 413
+    assert response.get_json()['code'] == 'BATCH_TOO_LARGE'
+
+
+def test_batch_deadline_exceeded(psm_server):
+    """Test que les calculs d'un lot s'arrêtent à l'échéance de la requête."""
+    psm_server.set_point_set('a', serialize_point_set(_square(0.0)))
+    client = create_app(psm_server.url).test_client()
+
+    response = client.post('/triangulation/batch', json={'pointSetIds': ['a']},
+                           headers={'X-Request-Timeout': '0'})
+    (kind, payload), = decode_batch(response.data)
+
+    assert kind == BATCH_RECORD_ERROR
+    assert json.loads(payload)['code'] == 'DEADLINE_EXCEEDED'
+    assert json.loads(payload)['status'] == 504
@@ -0,0 +1,295 @@
+"""Tests du client PointSetManager contre un serveur local de substitution."""
+
+import asyncio
+import struct
+import threading
+import tracemalloc
+
+import pytest
+
+from src.triangulator.app import create_app
+from src.triangulator.async_psm_client import AsyncPointSetManagerClient
+from src.triangulator.psm_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    PointSetManagerClient,
+    PointSetManagerError,
+    PointSetManagerUnavailable,
+    PointSetNotFound,
+    PointSetTooLarge,
+)
+from src.triangulator.serialization import (
+    deserialize_point_set,
+    serialize_point_set,
+)
+
+POINT_SET = serialize_point_set([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+
+def _client(psm_server, **kwargs):
+    """Crée un client du PointSetManager sans attente entre les reprises."""
+    kwargs.setdefault('sleep', lambda delay: None)
+    return PointSetManagerClient(psm_server.url, **kwargs)
+
+
+def test_client_reuses_connections(psm_server):
+    """Test que les requêtes successives réutilisent la même connexion."""
+    psm_server.set_point_set('abc', POINT_SET)
+    client = _client(psm_server)
+
+    for _ in range(5):
+        assert client.get_point_set('abc') == POINT_SET
+
+    assert psm_server.requests == 5
+    assert len(psm_server.connections) == 1
+    client.close()
+
+
+def test_client_retries_transient_errors(psm_server):
+    """Test qu'une erreur 503 transitoire est retentée."""
+    psm_server.set_responses('abc', [(503, b''), (503, b''), (200, POINT_SET)])
+    client = _client(psm_server, retries=2)
+
+    assert client.get_point_set('abc') == POINT_SET
+    assert psm_server.requests == 3
+
+
+def test_client_gives_up_after_retries(psm_server):
+    """Test que le nombre de reprises est borné."""
+    psm_server.set_responses('abc', [(503, b'')])
+    client = _client(psm_server, retries=2)
+
+    with pytest.raises(PointSetManagerError):
+        client.get_point_set('abc')
+    assert psm_server.requests == 3
+
+
+def test_client_does_not_retry_not_found(psm_server):
+    """Test qu'un 404 n'est pas retenté."""
+    client = _client(psm_server, retries=2)
+
+    with pytest.raises(PointSetNotFound):
+        client.get_point_set('unknown')
+    assert psm_server.requests == 1
+
+
+def test_client_read_timeout(psm_server):
+    """Test que le délai de lecture est appliqué séparément."""
+    psm_server.set_point_set('abc', POINT_SET)
+    psm_server.delay = 0.5
+    client = _client(psm_server, read_timeout=0.05, retries=0)
+
+    with pytest.raises(PointSetManagerUnavailable):
+        client.get_point_set('abc')
+
+
+def test_client_fetch_decodes_while_streaming(psm_server):
+    """Test que les points décodés au fil des morceaux sont exacts."""
+    data = serialize_point_set([(i * 0.5, -i * 0.25) for i in range(50_000)])
+    psm_server.set_point_set('abc', data)
+    client = _client(psm_server)
+
+    decoder = client.fetch_point_set('abc')
+
+    assert decoder.payload() == data
+    assert decoder.point_set() == deserialize_point_set(data)
+    assert decoder.decode_seconds > 0
+
+
+def test_client_rejects_too_many_points_from_header(psm_server):
+    """Test que la limite de points est appliquée dès l'en-tête.
+
+    Le corps servi ne contient qu'un point sur le million annoncé: seul
+    l'en-tête a pu motiver le refus.
+    """
+    psm_server.set_point_set('abc', struct.pack('<I', 1_000_000) + bytes(8))
+    client = _client(psm_server, retries=2)
+
+    with pytest.raises(PointSetTooLarge) as info:
+        client.get_point_set('abc', max_points=1000)
+    assert info.value.point_count == 1_000_000
+    assert psm_server.requests == 1
+    assert client.breaker.state == 'closed'
+
+    with pytest.raises(ValueError):
+        client.get_point_set('abc')
+
+
+def test_client_huge_header_allocates_nothing(psm_server):
+    """Test qu'un en-tête démesuré est refusé sans dimensionner de tampon."""
+    psm_server.set_point_set('abc', struct.pack('<I', 0xFFFFFFFF))
+    client = _client(psm_server)
+
+    tracemalloc.start()
+    try:
+        with pytest.raises(PointSetTooLarge) as info:
+            client.get_point_set('abc', max_points=1000)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert info.value.point_count == 0xFFFFFFFF
+    assert peak < 1 << 20
+    client.close()
+
+
+def test_client_circuit_breaker_fails_fast(psm_server):
+    """Test que le disjoncteur ouvert évite d'appeler le PointSetManager."""
+    psm_server.set_responses('abc', [(500, b'')])
+    client = _client(psm_server, retries=0, breaker=CircuitBreaker(2, 60.0))
+
+    for _ in range(2):
+        with pytest.raises(PointSetManagerError):
+            client.get_point_set('abc')
+    with pytest.raises(CircuitOpenError):
+        client.get_point_set('abc')
+
+    assert psm_server.requests == 2
+
+
+def test_circuit_breaker_half_open_trial():
+    """Test du passage semi-ouvert puis de la fermeture du disjoncteur."""
+    now = [0.0]
+    breaker = CircuitBreaker(1, 10.0, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    now[0] = 10.0
+    assert breaker.state == 'half-open'
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == 'closed'
+
+
+def test_client_unexpected_error_ends_half_open_trial(psm_server, monkeypatch):
+    """Test qu'une erreur imprévue pendant l'essai rouvre le disjoncteur.
+
+    Sans cela, l'essai resterait en cours et tous les appels suivants
+    seraient refusés.
+    """
+    psm_server.set_point_set('abc', POINT_SET)
+    now = [0.0]
+    breaker = CircuitBreaker(1, 10.0, clock=lambda: now[0])
+    client = _client(psm_server, breaker=breaker)
+    breaker.record_failure()
+    now[0] = 10.0
+
+    def boom(*args):
+        raise RuntimeError('boom')
+
+    with monkeypatch.context() as m:
+        m.setattr(client, '_read', boom)
+        with pytest.raises(RuntimeError):
+            client.get_point_set('abc')
+    assert breaker.state == 'open'
+
+    now[0] = 20.0
+    assert client.get_point_set('abc') == POINT_SET
+    assert breaker.state == 'closed'
+    client.close()
+
+
+def test_async_client_unexpected_error_ends_half_open_trial(psm_server,
+                                                            monkeypatch):
+    """Test de l'essai du client asynchrone interrompu puis en échec.
+
+    Une annulation libère l'essai sans rouvrir le disjoncteur; une erreur
+    imprévue le rouvre.
+    """
+    psm_server.set_point_set('abc', POINT_SET)
+    now = [0.0]
+    breaker = CircuitBreaker(1, 10.0, clock=lambda: now[0])
+
+    async def scenario():
+        client = AsyncPointSetManagerClient(psm_server.url, breaker=breaker)
+        breaker.record_failure()
+        now[0] = 10.0
+        states = []
+        for error in (asyncio.CancelledError, ValueError):
+            async def fail(*args, error=error):
+                raise error()
+
+            with monkeypatch.context() as m:
+                m.setattr(client, '_read', fail)
+                with pytest.raises(error):
+                    await client.get_point_set('abc')
+            states.append(breaker.state)
+        now[0] = 20.0
+        data = await client.get_point_set('abc')
+        await client.close()
+        return states, data
+
+    states, data = asyncio.run(scenario())
+
+    assert states == ['half-open', 'open']
+    assert data == POINT_SET
+    assert breaker.state == 'closed'
+
+
+def test_endpoint_with_stub_server(psm_server):
+    """Test de bout en bout de l'API avec le serveur de substitution."""
+    psm_server.set_point_set('abc', POINT_SET)
+    client = create_app(psm_server.url).test_client()
+
+    response = client.get('/triangulation/abc')
+
+    assert response.status_code == 200
+    assert response.data.startswith(POINT_SET)
+
+
+def test_endpoint_rejects_too_many_points(psm_server):
+    """Test qu'un PointSet trop grand donne un 413 sans être triangulé."""
+    psm_server.set_point_set('abc', POINT_SET)
+    client = create_app(psm_server.url, config={'MAX_POINTS': 2}).test_client()
+
+    response = client.get('/triangulation/abc')
+
+    assert response.status_code == 413
+    assert response.get_json()['code'] == 'TOO_MANY_POINTS'
+
+
+def test_endpoint_circuit_open_returns_retry_after(psm_server):
+    """Test que le disjoncteur ouvert donne un 503 avec Retry-After."""
+    app = create_app(psm_server.url, config={
+        'PSM_RETRIES': 0,
+        'PSM_BREAKER_THRESHOLD': 1,
+        'PSM_BREAKER_RESET': 30.0,
+    })
+    client = app.test_client()
+    psm_server.set_responses('abc', [(500, b'')])
+
+    assert client.get('/triangulation/abc').status_code == 502
+    response = client.get('/triangulation/abc')
+
+    assert response.status_code == 503
+    assert response.get_json()['code'] == 'PSM_UNAVAILABLE'
+    assert int(response.headers['Retry-After']) >= 1
+    assert psm_server.requests == 1
+
+
+def test_endpoint_coalesces_concurrent_requests(psm_server):
+    """Test que des requêtes simultanées ne récupèrent le PointSet qu'une fois."""
+    psm_server.set_point_set('abc', POINT_SET)
+    psm_server.delay = 0.2
+    app = create_app(psm_server.url, config={'CACHE_MAX_BYTES': 0})
+    responses = []
+
+    def request():
+        responses.append(app.test_client().get('/triangulation/abc'))
+
+    threads = [threading.Thread(target=request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert len({r.data for r in responses}) == 1
+    assert psm_server.requests == 1
+    assert app.extensions['triangulator_flights'].stats()['coalesced'] >= 3
@@ -0,0 +1,200 @@
+"""Tests de l'endpoint de triangulation d'un PointSet envoyé directement."""
+
+import random
+import struct
+import time
+import tracemalloc
+
+from src.triangulator.app import create_app
+from src.triangulator.cache import content_key
+from src.triangulator.core import triangulate
+from src.triangulator.encodings import (
+    FORMAT_INDICES_VARINT,
+    FORMAT_TRIANGLES,
+    decode_body,
+    decompress,
+)
+from src.triangulator.serialization import serialize_point_set, serialize_triangles
+
+POINTS = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+
+
+def _post(client, body, query='', headers=None):
+    """Envoie un PointSet binaire à l'endpoint."""
+    return client.post(
+        '/triangulation' + query, data=body,
+        content_type='application/octet-stream', headers=headers
+    )
+
+
+def test_upload_happy_path(client):
+    """Test du scénario nominal: le PointSet est triangulé sans le PSM."""
+    body = serialize_point_set(POINTS)
+
+    response = _post(client, body)
+
+    assert response.status_code == 200
+    assert response.data == serialize_triangles(POINTS, triangulate(POINTS))
+    assert response.headers['ETag'] == f'"{content_key(body)}"'
+
+
+def test_upload_shares_cache_with_get(psm_server):
+    """Test qu'un PointSet déjà triangulé par identifiant est servi du cache."""
+    body = serialize_point_set(POINTS)
+    psm_server.set_point_set('abc', body)
+    client = create_app(psm_server.url).test_client()
+
+    assert client.get('/triangulation/abc').data
+    response = _post(client, body)
+
+    assert response.headers['X-Cache'] == 'HIT'
+
+
+def test_upload_count_mismatch(client):
+    """Test qu'un nombre de points incohérent avec la taille est refusé."""
+    body = struct.pack('<I', 5) + serialize_point_set(POINTS)[4:]
+
+    response = _post(client, body)
+
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'INVALID_DATA'
+
+
+def test_upload_truncated_header(client):
+    """Test qu'un corps trop court pour l'en-tête est refusé."""
+    response = _post(client, b'\x01\x00')
+
+    assert response.status_code == 400
+
+
+def test_upload_too_large():
+    """Test que la taille maximale configurée est appliquée."""
+    client = create_app(config={'UPLOAD_MAX_BYTES': 16}).test_client()
+
+    response = _post(client, serialize_point_set(POINTS))
+
+    assert response.status_code == 413
+    assert response.get_json()['code'] == 'PAYLOAD_TOO_LARGE'
+
+
+def test_upload_too_many_points():
+    """Test que la limite de points est appliquée dès l'en-tête."""
+    client = create_app(config={'MAX_POINTS': 3}).test_client()
+
+    response = _post(client, serialize_point_set(POINTS))
+
+    assert response.status_code == 413
+    assert response.get_json()['code'] == 'TOO_MANY_POINTS'
+
+
+def test_upload_header_checked_before_allocating(client):
+    """Test que l'en-tête est refusé avant tout dimensionnement du tampon.
+
+    Chaque corps ne contient que l'en-tête: un tampon dimensionné d'après
+    le compteur annoncé coûterait 8 Mo pour le premier, 34 Go pour le second.
+    """
+    tracemalloc.start()
+    try:
+        mismatch = _post(client, struct.pack('<I', 1_000_000))
+        huge = _post(client, struct.pack('<I', 0xFFFFFFFF))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert mismatch.status_code == 400
+    assert mismatch.get_json()['code'] == 'INVALID_DATA'
+    assert huge.status_code == 413
+    assert huge.get_json()['code'] == 'TOO_MANY_POINTS'
+    assert peak < 4 << 20
+
+
+def test_upload_duplicates_with_index_map(client):
+    """Test de la réponse étendue pour un PointSet qui contient des doublons."""
+    points = POINTS + [(1.0, 1.0), (0.0, 0.0)]
+    body = serialize_point_set(points)
+    triangles = serialize_triangles(points, triangulate(POINTS))
+
+    plain = _post(client, body)
+    extended = _post(client, body, '?indexMap=true')
+
+    assert plain.data == triangles
+    assert extended.status_code == 200
+    assert extended.data[:len(triangles)] == triangles
+    count, *index_map = struct.unpack('<7I', extended.data[len(triangles):])
+    assert count == 6
+    assert index_map == [0, 1, 2, 3, 2, 0]
+    assert extended.headers['ETag'] != plain.headers['ETag']
+
+    cached = _post(client, body, '?indexMap=true')
+    assert cached.headers['X-Cache'] == 'HIT'
+    assert cached.data == extended.data
+
+
+def test_upload_negotiated_format_and_encoding(client):
+    """Test d'un format compact compressé, négocié par Accept."""
+    points = [(float(i % 8), float(i // 8) + 0.1 * (i % 3)) for i in range(64)]
+    body = serialize_point_set(points)
+    headers = {'Accept': FORMAT_INDICES_VARINT, 'Accept-Encoding': 'gzip'}
+
+    response = _post(client, body, headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers['Content-Type'] == FORMAT_INDICES_VARINT
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept, Accept-Encoding'
+    etag = response.headers['ETag']
+    assert etag == f'W/"{content_key(body)}+indices+varint"'
+    vertices, triangles = decode_body(
+        decompress(response.data, 'gzip'), FORMAT_INDICES_VARINT
+    )
+    assert vertices is None
+    assert ({frozenset(t) for t in triangles}
+            == {frozenset(t) for t in triangulate(points)})
+
+    cached = _post(client, body, headers=headers)
+    assert cached.headers['X-Cache'] == 'HIT'
+    assert cached.data == response.data
+    identity = _post(client, body, headers={
+        'Accept': FORMAT_INDICES_VARINT, 'If-None-Match': etag
+    })
+    assert identity.status_code == 304
+
+
+def test_upload_default_format_unchanged(client):
+    """Test que sans préférence, la réponse reste au format Triangles."""
+    body = serialize_point_set(POINTS)
+
+    response = _post(client, body, headers={'Accept': '*/*'})
+
+    assert response.headers['Content-Type'] == FORMAT_TRIANGLES
+    assert 'Content-Encoding' not in response.headers
+    assert response.data == serialize_triangles(POINTS, triangulate(POINTS))
+
+
+def test_upload_deadline_exceeded(client):
+    """Test qu'un calcul interrompu à son échéance renvoie 504."""
+    rng = random.Random(1)
+    body = serialize_point_set(
+        [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(20000)]
+    )
+
+    start = time.perf_counter()
+    response = _post(client, body, headers={'X-Request-Timeout': '0.05'})
+
+    assert time.perf_counter() - start < 1
+    assert response.status_code == 504
+    assert response.get_json()['code'] == 'DEADLINE_EXCEEDED'
+
+    assert _post(client, body, headers={'X-Request-Timeout': '60'}).status_code == (
+        200
+    )
+
+
+def test_upload_invalid_deadline(client):
+    """Test qu'une échéance qui n'est pas un délai positif est refusée."""
+    for value in ('soon', '-1', 'nan'):
+        response = _post(client, serialize_point_set(POINTS),
+                         headers={'X-Request-Timeout': value})
+
+        assert response.status_code == 400
+        assert response.get_json()['code'] == 'INVALID_REQUEST'
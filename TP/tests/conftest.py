@@ -3,12 +3,13 @@
 import pytest
 
 from src.triangulator.app import create_app
+from tests.psm_stub import StubPointSetManager
 
 
 @pytest.fixture
 def app():
     """Fixture pour créer l'application Flask en mode test."""
-    application = create_app()
+    application = create_app(config={'PSM_RETRY_BACKOFF': 0.0})
     application.config.update({
         "TESTING": True,
     })
@@ -19,3 +20,11 @@ def app():
 def client(app):
     """Fixture pour obtenir le client de test Flask."""
     return app.test_client()
+
+
+@pytest.fixture
+def psm_server():
+    """Fixture qui démarre un PointSetManager de substitution en local."""
+    server = StubPointSetManager()
+    yield server
+    server.close()
@@ -0,0 +1,448 @@
+"""Suite de benchmarks reproductible, avec références JSON et comparaison.
+
+Chaque benchmark est mesuré sur chaque jeu de données (voir datasets) et
+chaque taille. Pour une mesure:
+
+- une première exécution, sous tracemalloc, donne le pic de mémoire
+  alloué par l'opération (et sert d'échauffement);
+- puis ``repeats`` exécutions sont chronométrées avec time.perf_counter.
+
+Le rapport donne la médiane, le débit (points par seconde) et, par
+benchmark et jeu de données, l'ajustement ``t ≈ c · n^k`` des médianes
+(moindres carrés en échelle log-log): k proche de 1 indique un coût
+linéaire. Les résultats s'enregistrent en JSON; la commande compare
+confronte deux fichiers et signale les régressions significatives (test
+de Mann-Whitney unilatéral sur les durées, et écart minimal de médiane).
+
+Usage, depuis TP::
+
+    python -m tests.perf.bench run --output baseline.json
+    python -m tests.perf.bench run --sizes 100,1000,10000 -o current.json
+    python -m tests.perf.bench compare baseline.json current.json
+
+La série complète (jusqu'à 1 000 000 de points) dure plusieurs dizaines
+de minutes: --sizes, --datasets et --benchmarks la restreignent.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from functools import lru_cache
+
+from src.triangulator.core import triangulate
+from src.triangulator.encodings import (
+    FORMAT_TRIANGLES_VARINT,
+    decode_body,
+    encode_body,
+)
+from src.triangulator.serialization import (
+    deserialize_point_set,
+    deserialize_triangles,
+    serialize_point_set,
+    serialize_triangles,
+)
+from tests.perf.datasets import GENERATORS, generate
+
+FORMAT_VERSION = 1
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_REPEATS = 5
+BENCHMARKS = (
+    'triangulate',
+    'serialize_point_set',
+    'deserialize_point_set',
+    'serialize_triangles',
+    'deserialize_triangles',
+    'encode_varint',
+    'decode_varint',
+)
+
+
+def _operations(points, triangles):
+    """Retourne les opérations des codecs, prêtes à être mesurées.
+
+    Args:
+        points: Les points du jeu de données.
+        triangles: Leur triangulation.
+
+    Returns:
+        dict: Une fonction sans argument par benchmark de codec.
+    """
+    payload = serialize_point_set(points)
+    blob = serialize_triangles(points, triangles)
+    varint = encode_body(points, triangles, FORMAT_TRIANGLES_VARINT)
+    return {
+        'serialize_point_set': lambda: serialize_point_set(points),
+        'deserialize_point_set': lambda: deserialize_point_set(payload),
+        'serialize_triangles': lambda: serialize_triangles(points, triangles),
+        'deserialize_triangles': lambda: deserialize_triangles(blob),
+        'encode_varint': lambda: encode_body(
+            points, triangles, FORMAT_TRIANGLES_VARINT
+        ),
+        'decode_varint': lambda: decode_body(varint, FORMAT_TRIANGLES_VARINT),
+    }
+
+
+def measure(fn, repeats, memory=True):
+    """Mesure une opération.
+
+    Args:
+        fn: L'opération, sans argument.
+        repeats: Nombre d'exécutions chronométrées.
+        memory: Si True, une exécution préalable sous tracemalloc mesure
+                le pic de mémoire; sinon elle sert seulement
+                d'échauffement.
+
+    Returns:
+        tuple: Les durées en secondes, le pic de mémoire en bytes (None
+               si non mesuré) et le résultat de la dernière exécution.
+    """
+    gc.collect()
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            result = fn()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    else:
+        result = fn()
+
+    times = []
+    for _ in range(repeats):
+        del result
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return times, peak, result
+
+
+def fit_power_law(sizes, durations):
+    """Ajuste ``t ≈ c · n^k`` par moindres carrés en échelle log-log.
+
+    Args:
+        sizes: Les tailles (au moins deux distinctes).
+        durations: Les durées correspondantes, strictement positives.
+
+    Returns:
+        tuple: L'exposant k et le coefficient c.
+    """
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in durations]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    slope = (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+             / sum((x - mean_x) ** 2 for x in xs))
+    return slope, math.exp(mean_y - slope * mean_x)
+
+
+def _environment():
+    """Décrit la machine et les versions, pour interpréter une référence."""
+    environment = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'cpus': os.cpu_count(),
+    }
+    try:
+        import numpy
+        environment['numpy'] = numpy.__version__
+    except ImportError:
+        pass
+    return environment
+
+
+def run(sizes=DEFAULT_SIZES, datasets=tuple(GENERATORS),
+        benchmarks=BENCHMARKS, repeats=DEFAULT_REPEATS, seed=0,
+        memory=True, report=print):
+    """Exécute la suite de benchmarks.
+
+    Args:
+        sizes: Les nombres de points.
+        datasets: Les jeux de données (clés de datasets.GENERATORS).
+        benchmarks: Les benchmarks (voir BENCHMARKS).
+        repeats: Nombre d'exécutions chronométrées par mesure.
+        seed: Graine des générateurs.
+        memory: Si True, mesure aussi le pic de mémoire.
+        report: Fonction appelée avec chaque ligne du rapport.
+
+    Returns:
+        dict: Les résultats, au format enregistré en JSON.
+    """
+    results = []
+    for dataset in datasets:
+        for size in sizes:
+            points = generate(dataset, size, seed)
+            if 'triangulate' in benchmarks:
+                times, peak, triangles = measure(
+                    lambda: triangulate(points), repeats, memory
+                )
+                results.append(_result('triangulate', dataset, size, times, peak))
+                report(_describe(results[-1]))
+            else:
+                triangles = triangulate(points)
+
+            operations = _operations(points, triangles)
+            for name in benchmarks:
+                if name == 'triangulate':
+                    continue
+                times, peak, _ = measure(operations[name], repeats, memory)
+                results.append(_result(name, dataset, size, times, peak))
+                report(_describe(results[-1]))
+
+    fits = []
+    for name in benchmarks:
+        for dataset in datasets:
+            series = [r for r in results
+                      if r['benchmark'] == name and r['dataset'] == dataset]
+            if len({r['size'] for r in series}) < 2:
+                continue
+            exponent, coefficient = fit_power_law(
+                [r['size'] for r in series], [r['median'] for r in series]
+            )
+            fits.append({'benchmark': name, 'dataset': dataset,
+                         'exponent': exponent, 'coefficient': coefficient})
+            report(f"{name} {dataset}: t ≈ {coefficient:.3g} · n^{exponent:.2f}")
+
+    return {
+        'version': FORMAT_VERSION,
+        'environment': _environment(),
+        'config': {'sizes': list(sizes), 'datasets': list(datasets),
+                   'benchmarks': list(benchmarks), 'repeats': repeats,
+                   'seed': seed},
+        'results': results,
+        'fits': fits,
+    }
+
+
+def _result(name, dataset, size, times, peak):
+    """Construit l'enregistrement JSON d'une mesure."""
+    median = statistics.median(times)
+    return {
+        'benchmark': name,
+        'dataset': dataset,
+        'size': size,
+        'times': times,
+        'median': median,
+        'throughput': size / median if median else None,
+        'peak_bytes': peak,
+    }
+
+
+def _describe(result):
+    """Formate une mesure pour le rapport."""
+    line = (f"{result['benchmark']} {result['dataset']} {result['size']}: "
+            f"médiane {result['median']:.6f} s")
+    if result['throughput']:
+        line += f", {result['throughput']:.0f} points/s"
+    if result['peak_bytes'] is not None:
+        line += f", pic {result['peak_bytes'] / 2**20:.2f} Mio"
+    return line
+
+
+@lru_cache(maxsize=None)
+def _u_counts(m, n):
+    """Distribution exacte de la statistique U de Mann-Whitney.
+
+    Args:
+        m: Taille du premier échantillon.
+        n: Taille du second.
+
+    Returns:
+        tuple: Pour chaque valeur u de 0 à m·n, le nombre d'ordres des
+               m + n observations (sans ex-aequo) qui donnent U = u.
+    """
+    if m == 0 or n == 0:
+        return (1,)
+    # La plus grande observation vient du premier échantillon (elle
+    # dépasse alors les n du second) ou du second.
+    first = _u_counts(m - 1, n)
+    second = _u_counts(m, n - 1)
+    counts = [0] * (m * n + 1)
+    for u, count in enumerate(first):
+        counts[u + n] += count
+    for u, count in enumerate(second):
+        counts[u] += count
+    return tuple(counts)
+
+
+def mann_whitney_greater(sample, reference):
+    """Teste si les valeurs de sample tendent à dépasser celles de reference.
+
+    Test de Mann-Whitney unilatéral: la p-valeur est exacte pour des
+    échantillons d'au plus 20 valeurs, approchée par la loi normale
+    au-delà. Les ex-aequo comptent pour moitié.
+
+    Args:
+        sample: Les durées mesurées.
+        reference: Les durées de référence.
+
+    Returns:
+        float: La probabilité, si les deux échantillons suivent la même
+               loi, d'observer un U au moins aussi grand.
+    """
+    m, n = len(sample), len(reference)
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0
+            for x in sample for y in reference)
+    if m <= 20 and n <= 20:
+        counts = _u_counts(m, n)
+        return sum(counts[math.ceil(u):]) / math.comb(m + n, m)
+
+    mean = m * n / 2
+    deviation = math.sqrt(m * n * (m + n + 1) / 12)
+    z = (u - 0.5 - mean) / deviation
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(baseline, current, threshold=0.1, alpha=0.05):
+    """Compare deux séries de résultats.
+
+    Une mesure régresse si sa médiane dépasse celle de la référence de
+    plus de threshold et si l'écart est significatif au seuil alpha
+    (mann_whitney_greater). Le pic de mémoire, déterministe, régresse
+    dès qu'il dépasse celui de la référence de plus de threshold.
+
+    Args:
+        baseline: Les résultats de référence (voir run).
+        current: Les résultats à juger.
+        threshold: Écart relatif minimal signalé.
+        alpha: Seuil de signification du test.
+
+    Returns:
+        list: Pour chaque mesure commune, un dict avec benchmark,
+              dataset, size, ratio (des médianes), p_value, memory_ratio
+              et status: 'regression', 'improvement' ou 'ok'.
+    """
+    reference = {(r['benchmark'], r['dataset'], r['size']): r
+                 for r in baseline['results']}
+    verdicts = []
+    for result in current['results']:
+        key = (result['benchmark'], result['dataset'], result['size'])
+        base = reference.get(key)
+        if base is None:
+            continue
+        ratio = result['median'] / base['median']
+        slower = mann_whitney_greater(result['times'], base['times'])
+        faster = mann_whitney_greater(base['times'], result['times'])
+        memory_ratio = None
+        if result['peak_bytes'] and base['peak_bytes']:
+            memory_ratio = result['peak_bytes'] / base['peak_bytes']
+
+        status = 'ok'
+        if ((ratio > 1 + threshold and slower < alpha)
+                or (memory_ratio is not None and memory_ratio > 1 + threshold)):
+            status = 'regression'
+        elif ratio < 1 - threshold and faster < alpha:
+            status = 'improvement'
+        verdicts.append({
+            'benchmark': key[0], 'dataset': key[1], 'size': key[2],
+            'ratio': ratio, 'p_value': slower, 'memory_ratio': memory_ratio,
+            'status': status,
+        })
+    return verdicts
+
+
+def _parser():
+    """Construit l'analyseur des arguments de la ligne de commande."""
+    parser = argparse.ArgumentParser(
+        prog='python -m tests.perf.bench',
+        description="Benchmarks du Triangulator: mesure et comparaison.",
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Exécute la suite.")
+    run_parser.add_argument(
+        '--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+        help="Nombres de points, séparés par des virgules.",
+    )
+    run_parser.add_argument(
+        '--datasets', default=','.join(GENERATORS),
+        help="Jeux de données, séparés par des virgules.",
+    )
+    run_parser.add_argument(
+        '--benchmarks', default=','.join(BENCHMARKS),
+        help="Benchmarks, séparés par des virgules.",
+    )
+    run_parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument(
+        '--no-memory', action='store_true',
+        help="Ne mesure pas le pic de mémoire (tracemalloc).",
+    )
+    run_parser.add_argument('-o', '--output', help="Fichier JSON des résultats.")
+
+    compare_parser = commands.add_parser(
+        'compare', help="Compare des résultats à une référence."
+    )
+    compare_parser.add_argument('baseline', help="Résultats de référence.")
+    compare_parser.add_argument('current', help="Résultats à juger.")
+    compare_parser.add_argument('--threshold', type=float, default=0.1)
+    compare_parser.add_argument('--alpha', type=float, default=0.05)
+    return parser
+
+
+def _split(value, allowed=None):
+    """Découpe une liste séparée par des virgules et vérifie ses éléments."""
+    items = [item for item in value.split(',') if item]
+    unknown = [item for item in items if allowed is not None
+               and item not in allowed]
+    if unknown:
+        raise ValueError(f"Valeurs inconnues: {', '.join(unknown)}")
+    return items
+
+
+def main(argv=None):
+    """Point d'entrée de la ligne de commande.
+
+    Args:
+        argv: Les arguments; si None, ceux de sys.argv.
+
+    Returns:
+        int: 0, ou 1 si compare a trouvé une régression.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        try:
+            sizes = [int(size) for size in _split(args.sizes)]
+            datasets = _split(args.datasets, GENERATORS)
+            benchmarks = _split(args.benchmarks, BENCHMARKS)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.repeats < 1:
+            parser.error("--repeats doit être au moins 1")
+        results = run(sizes, datasets, benchmarks, args.repeats, args.seed,
+                      not args.no_memory)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(results, file, indent=1)
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    verdicts = compare(baseline, current, args.threshold, args.alpha)
+    for verdict in verdicts:
+        line = (f"{verdict['status']:<11} {verdict['benchmark']} "
+                f"{verdict['dataset']} {verdict['size']}: "
+                f"x{verdict['ratio']:.3f} (p={verdict['p_value']:.3g})")
+        if verdict['memory_ratio'] is not None:
+            line += f", mémoire x{verdict['memory_ratio']:.3f}"
+        print(line)
+    regressions = sum(v['status'] == 'regression' for v in verdicts)
+    print(f"{len(verdicts)} mesures comparées, {regressions} régressions")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Générateurs reproductibles de PointSets pour les benchmarks.
+
+Chaque générateur tire ses points d'un random.Random initialisé par la
+graine donnée: un même appel produit toujours le même PointSet. Les
+coordonnées sont arrondies en float32, comme après un passage par le
+format binaire, pour que les codecs et la triangulation travaillent sur
+les mêmes valeurs.
+"""
+
+import math
+import random
+from array import array
+
+EXTENT = 1000.0
+
+
+def _as_float32(points):
+    """Arrondit les coordonnées en float32."""
+    floats = array('f', (c for point in points for c in point))
+    return list(zip(floats[0::2], floats[1::2]))
+
+
+def uniform(count, seed=0):
+    """Points uniformes dans un carré."""
+    rng = random.Random(seed)
+    return _as_float32(
+        (rng.uniform(0, EXTENT), rng.uniform(0, EXTENT)) for _ in range(count)
+    )
+
+
+def clustered(count, seed=0):
+    """Points en amas gaussiens serrés (densités très inégales)."""
+    rng = random.Random(seed)
+    centers = [(rng.uniform(0, EXTENT), rng.uniform(0, EXTENT))
+               for _ in range(max(1, int(count ** 0.5) // 4))]
+    return _as_float32(
+        (rng.gauss(cx, EXTENT / 100), rng.gauss(cy, EXTENT / 100))
+        for cx, cy in (rng.choice(centers) for _ in range(count))
+    )
+
+
+def grid(count, seed=0):
+    """Grille régulière (nombreux quadruplets cocycliques), mélangée."""
+    side = math.isqrt(count - 1) + 1 if count else 0
+    points = [(float(i % side), float(i // side)) for i in range(count)]
+    random.Random(seed).shuffle(points)
+    return points
+
+
+def cocircular(count, seed=0):
+    """Points sur un même cercle (cas dégénéré du test in-circle)."""
+    rng = random.Random(seed)
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(count))
+    return _as_float32(
+        (EXTENT * math.cos(a), EXTENT * math.sin(a)) for a in angles
+    )
+
+
+def near_collinear(count, seed=0):
+    """Points le long d'une droite, à peine écartés (triangles aplatis)."""
+    rng = random.Random(seed)
+    points = []
+    for _ in range(count):
+        x = rng.uniform(0, EXTENT)
+        points.append((x, 0.5 * x + rng.uniform(-1e-3, 1e-3)))
+    return _as_float32(points)
+
+
+GENERATORS = {
+    'uniform': uniform,
+    'clustered': clustered,
+    'grid': grid,
+    'cocircular': cocircular,
+    'near_collinear': near_collinear,
+}
+
+
+def generate(name, count, seed=0):
+    """Génère le PointSet d'un jeu de données.
+
+    Args:
+        name: Nom du générateur (clé de GENERATORS).
+        count: Nombre de points.
+        seed: Graine du générateur pseudo-aléatoire.
+
+    Returns:
+        list: Liste de tuples (x, y).
+
+    Raises:
+        KeyError: Si le générateur est inconnu.
+    """
+    return GENERATORS[name](count, seed)
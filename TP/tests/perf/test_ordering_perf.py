@@ -0,0 +1,52 @@
+"""Tests de performance des ordres d'insertion selon la forme des données."""
+
+import random
+import time
+
+import pytest
+
+from src.triangulator.core import triangulate
+
+POINT_COUNT = 5000
+
+
+def _grid_points(count):
+    """Génère une grille régulière parcourue ligne par ligne."""
+    side = int(count ** 0.5)
+    return [(float(i % side), float(i // side)) for i in range(side * side)]
+
+
+def _random_points(count):
+    """Génère des points uniformes dans un carré."""
+    rng = random.Random(0)
+    return [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(count)]
+
+
+def _clustered_points(count):
+    """Génère des points regroupés en amas gaussiens."""
+    rng = random.Random(0)
+    centers = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(10)]
+    points = set()
+    while len(points) < count:
+        cx, cy = rng.choice(centers)
+        points.add((rng.gauss(cx, 20), rng.gauss(cy, 20)))
+    return sorted(points)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize('pattern', [_grid_points, _random_points, _clustered_points],
+                         ids=['grid', 'random', 'clustered'])
+def test_insertion_order_performance(pattern):
+    """Compare les ordres d'insertion sur des données grille/aléatoires/amas."""
+    points = pattern(POINT_COUNT)
+
+    durations = {}
+    for order in ('none', 'hilbert', 'brio'):
+        start_time = time.perf_counter()
+        triangulate(points, order=order)
+        durations[order] = time.perf_counter() - start_time
+
+    summary = ', '.join(f"{order}={d:.4f}s" for order, d in durations.items())
+    print(f"Triangulation {pattern.__name__} ({len(points)} points): {summary}")
+    assert durations['hilbert'] < 30
+    assert durations['brio'] < 30
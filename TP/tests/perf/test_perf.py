@@ -1,11 +1,26 @@
 """Tests de performance pour le Triangulator."""
 
+import random
+import threading
 import time
+import tracemalloc
 
 import pytest
 
-from src.triangulator.core import triangulate
-from src.triangulator.serialization import deserialize_point_set, serialize_point_set
+from src.triangulator import cli, encodings
+from src.triangulator.cancellation import CancellationToken, Cancelled
+from src.triangulator.core import set_stats_hook, triangulate
+from src.triangulator.delta import PATH_DELTA, MeshStore
+from src.triangulator.mesh import DelaunayMesh
+from src.triangulator.psm_client import PointSetManagerClient, PointSetTooLarge
+from src.triangulator.scheduler import Scheduler
+from src.triangulator.serialization import (
+    deserialize_point_set,
+    serialize_point_set,
+    serialize_triangles,
+    triangles_size,
+)
+from src.triangulator.triangles import TriangleArray
 
 
 @pytest.mark.perf
@@ -13,23 +28,37 @@ def test_triangulation_performance_1000():
     """Test de performance de la triangulation avec 1000 points."""
     points = [(float(i % 100), float(i // 100)) for i in range(1000)]
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     triangulate(points)
-    end_time = time.time()
+    end_time = time.perf_counter()
 
     duration = end_time - start_time
     print(f"Triangulation de 1000 points: {duration:.4f} secondes")
     assert duration < 60
 
 
+@pytest.mark.perf
+def test_triangulation_performance_10000():
+    """Test de performance de la triangulation avec 10000 points."""
+    points = [(float(i % 100), float(i // 100)) for i in range(10000)]
+
+    start_time = time.perf_counter()
+    triangulate(points)
+    end_time = time.perf_counter()
+
+    duration = end_time - start_time
+    print(f"Triangulation de 10000 points: {duration:.4f} secondes")
+    assert duration < 30
+
+
 @pytest.mark.perf
 def test_triangulation_performance_100():
     """Test de performance de la triangulation avec 100 points."""
     points = [(float(i % 10), float(i // 10)) for i in range(100)]
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     triangulate(points)
-    end_time = time.time()
+    end_time = time.perf_counter()
 
     duration = end_time - start_time
     print(f"Triangulation de 100 points: {duration:.4f} secondes")
@@ -41,11 +70,344 @@ def test_serialization_performance():
     """Test de performance de la sérialisation/désérialisation."""
     points = [(float(i), float(i)) for i in range(10000)]
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     data = serialize_point_set(points)
     deserialize_point_set(data)
-    end_time = time.time()
+    end_time = time.perf_counter()
 
     duration = end_time - start_time
     print(f"Sérialisation/Désérialisation de 10000 points: {duration:.4f} secondes")
     assert duration < 1
+
+
+@pytest.mark.perf
+def test_serialization_performance_1m():
+    """Test de performance des codecs en bloc avec 1 000 000 points."""
+    points = [(float(i), float(i)) for i in range(1_000_000)]
+    triangles = [(i, i + 1, i + 2) for i in range(2_000_000)]
+
+    start_time = time.perf_counter()
+    data = serialize_point_set(points)
+    deserialize_point_set(data)
+    serialize_triangles(points, triangles)
+    duration = time.perf_counter() - start_time
+
+    print(f"Codecs sur 1 000 000 points / 2 000 000 triangles: {duration:.4f} secondes")
+    assert duration < 10
+
+
+@pytest.mark.perf
+def test_parallel_triangulation_scaling():
+    """Mesure l'accélération du découpage en bandes à 1, 2, 4 et 8 processus."""
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(100000)]
+
+    durations = {}
+    counts = {}
+    for workers in (1, 2, 4, 8):
+        start_time = time.perf_counter()
+        counts[workers] = len(triangulate(points, workers=workers))
+        durations[workers] = time.perf_counter() - start_time
+
+    for workers, duration in durations.items():
+        print(f"{workers} processus: {duration:.2f} s, "
+              f"accélération x{durations[1] / duration:.2f}")
+    assert all(abs(count - counts[1]) <= 2 for count in counts.values())
+    assert durations[1] < 120
+
+
+def _traced_size(build):
+    """Mesure la mémoire retenue par l'objet que construit build."""
+    tracemalloc.start()
+    try:
+        result = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+@pytest.mark.perf
+def test_triangle_array_memory_2m():
+    """Compare la mémoire d'une liste de tuples et d'un TriangleArray."""
+    count = 2_000_000
+    points = [(float(i), float(i)) for i in range(count + 2)]
+
+    as_list, list_size = _traced_size(
+        lambda: [(i, i + 1, i + 2) for i in range(count)]
+    )
+    as_array, array_size = _traced_size(
+        lambda: TriangleArray.from_triangles((i, i + 1, i + 2) for i in range(count))
+    )
+
+    timings = {}
+    for name, triangles in (('liste', as_list), ('TriangleArray', as_array)):
+        start_time = time.perf_counter()
+        data = serialize_triangles(points, triangles)
+        timings[name] = time.perf_counter() - start_time
+
+    print(f"{count} triangles: liste {list_size / count:.0f} bytes/triangle "
+          f"({list_size / 2**20:.0f} Mio, sérialisation {timings['liste']:.3f} s), "
+          f"TriangleArray {array_size / count:.0f} bytes/triangle "
+          f"({array_size / 2**20:.0f} Mio, sérialisation "
+          f"{timings['TriangleArray']:.3f} s)")
+    assert data == serialize_triangles(points, as_list)
+    assert array_size < list_size / 5
+
+
+@pytest.mark.perf
+def test_incremental_edit_performance():
+    """Compare 100 modifications d'un maillage de 20000 points à un recalcul."""
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(20000)]
+    mesh = DelaunayMesh(points)
+
+    start_time = time.perf_counter()
+    for index in rng.sample(range(len(points)), 50):
+        mesh.remove(index)
+    mesh.insert([(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(50)])
+    incremental = time.perf_counter() - start_time
+
+    live = [p for p in mesh.vertices if p is not None]
+    start_time = time.perf_counter()
+    triangulate(live)
+    full = time.perf_counter() - start_time
+
+    print(f"100 modifications sur 20000 points: {incremental:.4f} s, "
+          f"recalcul complet: {full:.4f} s")
+    assert incremental < full
+
+
+@pytest.mark.perf
+def test_delta_churn_performance():
+    """Compare la triangulation par différence à un recalcul selon la churn."""
+    rng = random.Random(0)
+    count = 20000
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(count)]
+
+    start_time = time.perf_counter()
+    triangulate(points)
+    full = time.perf_counter() - start_time
+    print(f"Recalcul complet de {count} points: {full:.4f} s")
+
+    for churn in (0.01, 0.05, 0.20):
+        store = MeshStore(max_points=count, max_churn=1.0)
+        store.triangulate('v1', points)
+        changed = list(points)
+        for index in rng.sample(range(count), int(churn * count)):
+            changed[index] = (rng.uniform(0, 1000), rng.uniform(0, 1000))
+
+        start_time = time.perf_counter()
+        _, path = store.triangulate('v2', changed, base='v1')
+        delta = time.perf_counter() - start_time
+
+        print(f"{churn:.0%} de points modifiés: {delta:.4f} s "
+              f"({full / delta:.1f}x)")
+        assert path == PATH_DELTA
+        assert delta < full
+
+
+def _shuffled_grid_mesh(count, seed=0):
+    """Construit le maillage d'une grille, sommets numérotés au hasard.
+
+    Les indices d'un PointSet réel n'ont pas d'ordre spatial: la
+    numérotation aléatoire en donne le pire cas pour les écarts codés en
+    varints, sans le coût d'une triangulation de 1 000 000 de points.
+    """
+    side = int(count ** 0.5)
+    label = list(range(side * side))
+    random.Random(seed).shuffle(label)
+    points = [None] * (side * side)
+    for i, j in enumerate(label):
+        points[j] = (float(i % side), float(i // side))
+    indices = []
+    for y in range(side - 1):
+        for x in range(side - 1):
+            a, b = label[y * side + x], label[y * side + x + 1]
+            c, d = label[(y + 1) * side + x + 1], label[(y + 1) * side + x]
+            indices.extend((a, b, c, a, c, d))
+    return points, TriangleArray(indices)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize('count', [10_000, 100_000, 1_000_000])
+def test_encodings_size_and_throughput(count):
+    """Mesure la taille et le débit d'encodage de chaque représentation."""
+    points, triangles = _shuffled_grid_mesh(count)
+    legacy = triangles_size(len(points), len(triangles))
+
+    for media_type in encodings.FORMATS:
+        start_time = time.perf_counter()
+        body = encodings.encode_body(points, triangles, media_type)
+        encoded = time.perf_counter() - start_time
+
+        for encoding in (None,) + encodings.ENCODINGS:
+            start_time = time.perf_counter()
+            data = encodings.compress(body, encoding)
+            duration = encoded + time.perf_counter() - start_time
+
+            print(f"{count} points, {media_type} ({encoding or 'identity'}): "
+                  f"{len(data)} bytes ({len(data) / legacy:.0%}), "
+                  f"{legacy / duration / 1e6:.1f} Mo/s")
+            if media_type != encodings.FORMAT_TRIANGLES or encoding:
+                assert len(data) < legacy
+
+
+@pytest.mark.perf
+def test_cli_bulk_throughput(tmp_path):
+    """Mesure le débit de la triangulation hors ligne de 4 fichiers."""
+    rng = random.Random(0)
+    sources = []
+    for i in range(4):
+        points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(20000)]
+        path = tmp_path / f'{i}.bin'
+        path.write_bytes(serialize_point_set(points))
+        sources.append(str(path))
+
+    for jobs in (1, 2):
+        start_time = time.perf_counter()
+        reports = list(cli.run(sources, jobs=jobs))
+        duration = time.perf_counter() - start_time
+        print(f"4 fichiers de 20000 points, {jobs} processus: {duration:.3f} s, "
+              f"{80000 / duration:.0f} points/s")
+        assert all(report.error is None for report in reports)
+        assert duration < 120
+
+
+@pytest.mark.perf
+def test_triangulation_counters_overhead():
+    """Mesure le coût des compteurs internes de triangulate sur 20000 points."""
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(20000)]
+    received = []
+
+    durations = {}
+    for name, hook in (('sans crochet', None), ('avec crochet', received.append)):
+        set_stats_hook(hook)
+        try:
+            start_time = time.perf_counter()
+            triangulate(points)
+            durations[name] = time.perf_counter() - start_time
+        finally:
+            set_stats_hook(None)
+
+    stats = received[0]
+    print(f"Compteurs: {durations['sans crochet']:.3f} s sans crochet, "
+          f"{durations['avec crochet']:.3f} s avec; "
+          f"{stats.incircle_tests / stats.points:.2f} tests in-circle et "
+          f"{stats.cavity_triangles / stats.points:.2f} triangles de cavité "
+          f"par point")
+    assert stats.points == len(points)
+
+
+@pytest.mark.perf
+def test_streamed_fetch_performance(psm_server):
+    """Mesure la récupération en flux d'un PointSet de 1M points."""
+    data = serialize_point_set(
+        [(float(i % 1000), float(i // 1000)) for i in range(1_000_000)]
+    )
+    psm_server.set_point_set('abc', data)
+    client = PointSetManagerClient(psm_server.url)
+
+    start_time = time.perf_counter()
+    decoder = client.fetch_point_set('abc')
+    fetched = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    with pytest.raises(PointSetTooLarge):
+        client.get_point_set('abc', max_points=1000)
+    rejected = time.perf_counter() - start_time
+    client.close()
+
+    print(f"Récupération de 1M points: {fetched:.3f} s dont "
+          f"{decoder.decode_seconds:.3f} s de décodage; refus dès l'en-tête: "
+          f"{rejected * 1000:.1f} ms")
+    assert len(decoder.point_set()) == 1_000_000
+    assert rejected < fetched
+
+
+def _small_job_latencies(scheduler, heavy, small, interval):
+    """Triangule un grand PointSet puis des petits, arrivés à intervalles.
+
+    Returns:
+        list: Les latences des petits PointSets, triées.
+    """
+    latencies = []
+
+    def job(points, record):
+        start_time = time.perf_counter()
+        admission = scheduler.acquire(len(points))
+        try:
+            triangulate(points)
+        finally:
+            scheduler.release(admission)
+        if record:
+            latencies.append(time.perf_counter() - start_time)
+
+    threads = [threading.Thread(target=job, args=(heavy, False))]
+    threads[0].start()
+    for points in small:
+        time.sleep(interval)
+        threads.append(threading.Thread(target=job, args=(points, True)))
+        threads[-1].start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencies)
+
+
+@pytest.mark.perf
+def test_scheduler_small_job_latency():
+    """Mesure le p99 de 100 petits PointSets arrivés après un de 30000."""
+    rng = random.Random(0)
+    heavy = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(30000)]
+    small = [[(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(300)]
+             for _ in range(100)]
+
+    p99 = {}
+    for name, heavy_points in (('file unique', 10 ** 9), ('deux voies', 5000)):
+        scheduler = Scheduler(heavy_points, light_workers=1, heavy_workers=1)
+        latencies = _small_job_latencies(scheduler, heavy, small, 0.03)
+        p99[name] = latencies[98]
+
+    print(f"p99 des petits PointSets: {p99['file unique']:.3f} s en file "
+          f"unique, {p99['deux voies']:.3f} s avec deux voies")
+    assert p99['deux voies'] < p99['file unique']
+
+
+@pytest.mark.perf
+def test_cancellation_check_overhead():
+    """Mesure le coût des consultations du jeton et la latence d'annulation."""
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(5000)]
+
+    # Mesures alternées, dans un ordre inversé à chaque tour, et meilleure
+    # de chaque série: la machine varie plus que le coût mesuré.
+    times = {None: [], 'jeton': []}
+    for round_ in range(8):
+        for kind in sorted(times, key=str, reverse=round_ % 2 == 1):
+            cancel = None if kind is None else CancellationToken.after(3600)
+            start = time.perf_counter()
+            triangulate(points, cancel=cancel)
+            times[kind].append(time.perf_counter() - start)
+    plain = min(times[None])
+    checked = min(times['jeton'])
+
+    large = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(20000)]
+    token = CancellationToken()
+    cancelled_at = []
+
+    def cancel():
+        time.sleep(0.3)
+        cancelled_at.append(time.perf_counter())
+        token.cancel()
+
+    threading.Thread(target=cancel).start()
+    with pytest.raises(Cancelled):
+        triangulate(large, cancel=token)
+    latency = time.perf_counter() - cancelled_at[0]
+
+    print(f"5000 points: {plain:.3f} s sans jeton, {checked:.3f} s avec "
+          f"({checked / plain - 1:+.1%}); 20000 points: arrêt "
+          f"{latency * 1000:.1f} ms après l'annulation")
+    assert checked < plain * 1.15
+    assert latency < 0.05
@@ -0,0 +1,67 @@
+"""Test de charge: application Flask contre application ASGI."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from src.triangulator.app import create_app
+from src.triangulator.asgi import create_asgi_app
+from src.triangulator.serialization import serialize_point_set
+
+REQUEST_COUNT = 200
+FLASK_WORKERS = 8
+PSM_DELAY = 0.2
+
+
+def _prepare(psm_server):
+    """Enregistre REQUEST_COUNT PointSets distincts auprès du stub."""
+    ids = [f'id-{i}' for i in range(REQUEST_COUNT)]
+    for i, point_set_id in enumerate(ids):
+        psm_server.set_point_set(point_set_id, serialize_point_set(
+            [(0.0, 0.0), (1.0, float(i)), (float(i), 1.0), (2.0, 3.0)]
+        ))
+    psm_server.delay = PSM_DELAY
+    return ids
+
+
+@pytest.mark.perf
+def test_serving_modes_under_load(psm_server):
+    """Compare le débit des deux modes quand le PointSetManager est lent."""
+    ids = _prepare(psm_server)
+    config = {'PSM_POOL_SIZE': REQUEST_COUNT, 'CACHE_MAX_BYTES': 0}
+
+    # Mode synchrone: un nombre fixe de workers, comme un serveur WSGI.
+    flask_app = create_app(psm_server.url, config=config)
+
+    def flask_get(point_set_id):
+        return flask_app.test_client().get(f'/triangulation/{point_set_id}')
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(FLASK_WORKERS) as pool:
+        flask_statuses = [r.status_code for r in pool.map(flask_get, ids)]
+    flask_duration = time.monotonic() - start
+
+    # Mode asyncio: une seule boucle d'événements.
+    asgi_app = create_asgi_app(psm_server.url, config=config)
+
+    async def run():
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://t') as c:
+            responses = await asyncio.gather(
+                *(c.get(f'/triangulation/{i}') for i in ids)
+            )
+        await asgi_app.aclose()
+        return [r.status_code for r in responses]
+
+    start = time.monotonic()
+    asgi_statuses = asyncio.run(run())
+    asgi_duration = time.monotonic() - start
+
+    print(f"Flask ({FLASK_WORKERS} workers): "
+          f"{REQUEST_COUNT / flask_duration:.0f} req/s")
+    print(f"ASGI: {REQUEST_COUNT / asgi_duration:.0f} req/s")
+    assert flask_statuses == asgi_statuses == [200] * REQUEST_COUNT
+    assert asgi_duration < flask_duration
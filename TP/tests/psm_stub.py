@@ -0,0 +1,91 @@
+"""PointSetManager de substitution servi en local pour les tests."""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Server(ThreadingHTTPServer):
+    """Serveur multi-thread avec une file d'attente de connexions large."""
+
+    request_queue_size = 256
+
+    def handle_error(self, request, client_address):
+        """Ignore les connexions abandonnées par le client en cours de réponse."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubPointSetManager:
+    """Serveur HTTP local qui imite le PointSetManager.
+
+    Les réponses sont configurées par identifiant: soit un PointSet binaire
+    (200), soit un statut d'erreur. Une liste de réponses est consommée
+    dans l'ordre, la dernière étant répétée. Le serveur compte les
+    requêtes reçues et les connexions TCP ouvertes.
+    """
+
+    def __init__(self, delay=0.0):
+        """Démarre le serveur sur un port libre.
+
+        Args:
+            delay: Délai ajouté avant chaque réponse, en secondes.
+        """
+        self.delay = delay
+        self.routes = {}
+        self.requests = 0
+        self.connections = set()
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                """Désactive les journaux du serveur."""
+
+            def do_GET(self):
+                """Répond à GET /pointset/<id>."""
+                with stub._lock:
+                    stub.requests += 1
+                    stub.connections.add(self.client_address)
+                if stub.delay:
+                    time.sleep(stub.delay)
+
+                point_set_id = self.path.rsplit('/', 1)[-1]
+                status, body = stub._next_response(point_set_id)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/octet-stream')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = _Server(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+
+    def _next_response(self, point_set_id):
+        """Retourne la prochaine réponse configurée pour un identifiant."""
+        with self._lock:
+            responses = self.routes.get(point_set_id, [(404, b'')])
+            if len(responses) > 1:
+                return responses.pop(0)
+            return responses[0]
+
+    def set_point_set(self, point_set_id, data):
+        """Sert un PointSet binaire pour l'identifiant donné."""
+        self.routes[point_set_id] = [(200, data)]
+
+    def set_responses(self, point_set_id, responses):
+        """Sert une suite de réponses (statut, corps) pour l'identifiant."""
+        self.routes[point_set_id] = list(responses)
+
+    def close(self):
+        """Arrête le serveur."""
+        self.server.shutdown()
+        self.server.server_close()
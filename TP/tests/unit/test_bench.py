@@ -0,0 +1,91 @@
+"""Tests unitaires de la suite de benchmarks (tests/perf/bench.py)."""
+
+import json
+import math
+import random
+from array import array
+
+import pytest
+
+from tests.perf import bench
+from tests.perf.datasets import GENERATORS, generate
+
+
+@pytest.mark.parametrize('name', list(GENERATORS))
+def test_datasets_are_reproducible(name):
+    """Test que chaque générateur est déterministe et exact en float32."""
+    points = generate(name, 500, seed=3)
+
+    assert len(points) == 500
+    assert points == generate(name, 500, seed=3)
+    floats = [c for point in points for c in point]
+    assert list(array('f', floats)) == floats
+
+
+def test_fit_power_law():
+    """Test de l'ajustement t = c · n^k."""
+    sizes = [100, 1000, 10000, 100000]
+    exponent, coefficient = bench.fit_power_law(
+        sizes, [2e-6 * n ** 1.5 for n in sizes]
+    )
+
+    assert exponent == pytest.approx(1.5)
+    assert coefficient == pytest.approx(2e-6)
+
+
+def test_mann_whitney_greater():
+    """Test des p-valeurs exactes et approchées."""
+    assert bench.mann_whitney_greater([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) == (
+        pytest.approx(1 / math.comb(10, 5))
+    )
+    assert bench.mann_whitney_greater([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) == 1.0
+    assert bench.mann_whitney_greater([1, 3, 5], [2, 4, 6]) > 0.5
+
+    rng = random.Random(0)
+    slow = [rng.gauss(1.3, 0.05) for _ in range(30)]
+    fast = [rng.gauss(1.0, 0.05) for _ in range(30)]
+    assert bench.mann_whitney_greater(slow, fast) < 1e-6
+    assert bench.mann_whitney_greater(fast, slow) > 0.99
+
+
+def _results(scale, peak=1000, seed=0):
+    """Construit des résultats bruités autour d'une durée d'une seconde."""
+    rng = random.Random(seed)
+    times = [scale * rng.uniform(0.97, 1.03) for _ in range(5)]
+    return {'results': [bench._result('triangulate', 'uniform', 1000, times,
+                                      peak)]}
+
+
+def test_compare_flags_significant_regressions():
+    """Test qu'une régression de 30% est signalée, pas un bruit de 3%."""
+    baseline = _results(1.0)
+
+    assert bench.compare(baseline, _results(1.3, seed=1))[0]['status'] == (
+        'regression'
+    )
+    assert bench.compare(baseline, _results(1.0, seed=1))[0]['status'] == 'ok'
+    assert bench.compare(baseline, _results(0.7, seed=1))[0]['status'] == (
+        'improvement'
+    )
+    assert bench.compare(baseline, _results(1.0, peak=2000, seed=1))[0][
+        'status'] == 'regression'
+
+
+def test_run_and_compare_commands(tmp_path, capsys):
+    """Test des commandes run et compare sur une petite série."""
+    output = tmp_path / 'baseline.json'
+
+    assert bench.main(['run', '--sizes', '100,300', '--datasets', 'uniform,grid',
+                       '--repeats', '2', '-o', str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    assert len(results['results']) == 2 * 2 * len(bench.BENCHMARKS)
+    assert len(results['fits']) == 2 * len(bench.BENCHMARKS)
+    assert all(r['peak_bytes'] > 0 for r in results['results'])
+    assert 'points/s' in capsys.readouterr().out
+
+    assert bench.main(['compare', str(output), str(output)]) == 0
+    assert '0 régressions' in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        bench.main(['run', '--datasets', 'unknown'])
@@ -0,0 +1,111 @@
+"""Tests unitaires pour le cache de résultats."""
+
+import pytest
+
+from src.triangulator.cache import ResultCache, content_key
+
+
+class FakeClock:
+    """Horloge contrôlée par le test."""
+
+    def __init__(self):
+        """Démarre l'horloge à zéro."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Retourne l'instant courant."""
+        return self.now
+
+
+def test_content_key_depends_on_content():
+    """Test que l'empreinte ne dépend que du contenu."""
+    assert content_key(b'abc') == content_key(b'abc')
+    assert content_key(b'abc') != content_key(b'abd')
+
+
+def test_cache_hit_and_miss_counters():
+    """Test des compteurs de hits et de misses."""
+    cache = ResultCache(max_bytes=100, ttl=60)
+    assert cache.get('a') is None
+    cache.put('a', b'blob')
+    assert cache.get('a') == b'blob'
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_cache_evicts_least_recently_used_by_bytes():
+    """Test de l'éviction LRU bornée en bytes."""
+    cache = ResultCache(max_bytes=10, ttl=60)
+    cache.put('a', b'aaaa')
+    cache.put('b', b'bbbb')
+    cache.get('a')
+    cache.put('c', b'cccc')
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.size == 8
+    assert cache.stats()['evictions'] == 1
+
+
+def test_cache_rejects_oversized_blob():
+    """Test qu'un blob plus gros que le cache n'est pas conservé."""
+    cache = ResultCache(max_bytes=4, ttl=60)
+    assert not cache.put('a', b'too large')
+    assert cache.size == 0
+
+
+def test_cache_entries_expire():
+    """Test de l'expiration des entrées et des identifiants (TTL)."""
+    clock = FakeClock()
+    cache = ResultCache(max_bytes=100, ttl=10, clock=clock)
+    cache.put('a', b'blob')
+    cache.bind('id-1', 'a')
+
+    clock.now = 9.0
+    assert cache.get('a') == b'blob'
+    assert cache.key_for('id-1') == 'a'
+
+    clock.now = 10.0
+    assert cache.get('a') is None
+    assert cache.key_for('id-1') is None
+    assert cache.size == 0
+
+
+def test_cache_id_map_is_bounded():
+    """Test que la table des identifiants reste bornée."""
+    cache = ResultCache(max_bytes=100, ttl=60, max_ids=2)
+    cache.bind('id-1', 'a')
+    cache.bind('id-2', 'b')
+    cache.bind('id-3', 'c')
+    assert cache.key_for('id-1') is None
+    assert cache.key_for('id-3') == 'c'
+
+
+def test_cache_disk_backend_uses_mmap(tmp_path):
+    """Test du stockage sur disque relu par projection mémoire."""
+    cache = ResultCache(max_bytes=100, ttl=60, directory=str(tmp_path))
+    cache.put('a', b'on disk')
+
+    blob = cache.get('a')
+    try:
+        assert blob[:] == b'on disk'
+        assert len(blob) == 7
+    finally:
+        blob.close()
+
+    cache.put('b', b'x' * 95)
+    assert not (tmp_path / 'a.bin').exists()
+
+
+@pytest.mark.parametrize('directory', [False, True])
+def test_cache_replaces_existing_entry(tmp_path, directory):
+    """Test qu'une nouvelle écriture remplace l'entrée existante."""
+    cache = ResultCache(
+        max_bytes=100, ttl=60, directory=str(tmp_path) if directory else None
+    )
+    cache.put('a', b'old')
+    cache.put('a', b'newer')
+    blob = cache.get('a')
+    assert bytes(blob[:]) == b'newer'
+    assert cache.size == 5
@@ -0,0 +1,171 @@
+"""Tests unitaires de l'annulation coopérative des triangulations."""
+
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from src.triangulator.cancellation import CancellationToken, Cancelled
+from src.triangulator.core import triangulate
+from src.triangulator.delta import MeshStore
+from src.triangulator.executor import InlineExecutor
+from src.triangulator.scheduler import Scheduler
+from src.triangulator.serialization import serialize_point_set
+
+
+def _random_points(count):
+    """Génère des points aléatoires reproductibles."""
+    rng = random.Random(5)
+    return [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(count)]
+
+
+def _cancel_later(token, delay):
+    """Annule le jeton depuis un autre thread après un délai.
+
+    Returns:
+        list: Reçoit l'instant de l'annulation.
+    """
+    cancelled_at = []
+
+    def run():
+        time.sleep(delay)
+        cancelled_at.append(time.perf_counter())
+        token.cancel()
+
+    threading.Thread(target=run).start()
+    return cancelled_at
+
+
+def test_token_deadline_and_cancel():
+    """Test de l'échéance, du temps restant et de l'annulation explicite."""
+    unbounded = CancellationToken.after(None)
+    assert unbounded.remaining() is None
+    assert not unbounded.cancelled
+    unbounded.check()
+
+    unbounded.cancel()
+    assert unbounded.cancelled
+    with pytest.raises(Cancelled, match='annulé'):
+        unbounded.check()
+
+    expired = CancellationToken.after(0)
+    assert expired.remaining() == 0.0
+    with pytest.raises(Cancelled, match='Échéance'):
+        expired.check()
+
+    assert 9 < CancellationToken.after(10).remaining() <= 10
+
+
+def test_token_on_cancel():
+    """Test de l'abonnement à l'annulation explicite."""
+    token = CancellationToken.after(60)
+    calls = []
+    unsubscribe = token.on_cancel(lambda: calls.append('a'))
+    token.on_cancel(lambda: calls.append('b'))()
+    token.cancel()
+    assert calls == ['a']
+
+    unsubscribe()
+    token.on_cancel(lambda: calls.append('c'))
+    assert calls == ['a', 'c']
+
+
+def test_triangulate_with_live_token_is_unchanged():
+    """Test qu'un jeton non annulé ne modifie pas la triangulation."""
+    points = _random_points(1000)
+
+    assert triangulate(points, cancel=CancellationToken.after(60)) == (
+        triangulate(points)
+    )
+
+
+def test_triangulate_stops_on_expired_token():
+    """Test qu'une échéance passée interrompt la triangulation d'emblée."""
+    points = _random_points(20000)
+    start = time.perf_counter()
+    with pytest.raises(Cancelled):
+        triangulate(points, cancel=CancellationToken.after(0))
+    # Seuls le tri et l'ordre d'insertion précèdent la première consultation.
+    assert time.perf_counter() - start < 0.5
+
+
+def test_cancelled_inline_job_frees_its_thread():
+    """Test qu'un grand calcul annulé rend son thread en millisecondes."""
+    executor = InlineExecutor(max_pending=1)
+    payload = serialize_point_set(_random_points(20000))
+    token = CancellationToken()
+
+    cancelled_at = _cancel_later(token, 0.05)
+    with pytest.raises(Cancelled):
+        executor.run(payload, cancel=token)
+    assert time.perf_counter() - cancelled_at[0] < 0.1
+
+    # La place du travail annulé est rendue.
+    assert len(executor.run(serialize_point_set(_random_points(10)))) > 0
+
+
+def test_mesh_store_drops_cancelled_mesh():
+    """Test qu'un maillage dont la mise à jour est annulée est abandonné."""
+    store = MeshStore(max_points=100_000, max_churn=0.5)
+    points = _random_points(2000)
+    store.triangulate('v1', points)
+
+    moved = points[:1800] + [(x + 0.5, y) for x, y in points[1800:]]
+    with pytest.raises(Cancelled):
+        store.triangulate('v2', moved, 'v1', CancellationToken.after(0))
+
+    assert store.triangulate('v2', moved, 'v1') == (triangulate(moved), 'full')
+
+
+def test_scheduler_wait_stops_at_deadline():
+    """Test qu'un travail en file d'attente l'abandonne à son échéance."""
+    scheduler = Scheduler(heavy_points=100, light_workers=1)
+    held = scheduler.acquire(10)
+
+    start = time.perf_counter()
+    with pytest.raises(Cancelled):
+        scheduler.acquire(10, CancellationToken.after(0.02))
+    assert time.perf_counter() - start < 1
+    assert scheduler.stats()['light_queued'] == 0
+
+    scheduler.release(held)
+    scheduler.release(scheduler.acquire(10, CancellationToken.after(0)))
+    assert scheduler.stats()['light_running'] == 0
+
+
+def test_scheduler_wait_stops_on_cancel():
+    """Test qu'un travail en file d'attente la quitte dès son annulation."""
+    scheduler = Scheduler(heavy_points=100, light_workers=1)
+    held = scheduler.acquire(10)
+    token = CancellationToken()
+
+    cancelled_at = _cancel_later(token, 0.05)
+    with pytest.raises(Cancelled):
+        scheduler.acquire(10, token)
+    assert time.perf_counter() - cancelled_at[0] < 0.1
+    assert scheduler.stats()['light_queued'] == 0
+
+    scheduler.release(held)
+    assert scheduler.stats()['light_running'] == 0
+
+
+def test_scheduler_async_wait_stops_on_cancel():
+    """Test que l'attente asynchrone est réveillée par l'annulation."""
+    scheduler = Scheduler(heavy_points=100, light_workers=1)
+    held = scheduler.acquire(10)
+    token = CancellationToken()
+
+    async def run():
+        asyncio.get_running_loop().call_later(0.05, token.cancel)
+        start = time.perf_counter()
+        with pytest.raises(Cancelled):
+            await scheduler.acquire_async(10, token)
+        return time.perf_counter() - start
+
+    assert asyncio.run(run()) < 0.5
+    assert scheduler.stats()['light_queued'] == 0
+
+    scheduler.release(held)
+    assert scheduler.stats()['light_running'] == 0
@@ -0,0 +1,171 @@
+"""Tests unitaires de la ligne de commande de triangulation hors ligne."""
+
+import random
+import subprocess
+import sys
+
+import pytest
+
+from src.triangulator.cli import (
+    TRIANGLES_SUFFIX,
+    expand_inputs,
+    main,
+    plan_jobs,
+    run,
+    target_path,
+    triangulate_file,
+)
+from src.triangulator.core import triangulate
+from src.triangulator.serialization import (
+    deserialize_point_set,
+    serialize_point_set,
+    serialize_triangles,
+)
+
+
+def _write_point_set(path, count, seed=0):
+    """Écrit un PointSet aléatoire et retourne ses points."""
+    rng = random.Random(seed)
+    points = [(float(rng.randrange(1000)), float(rng.randrange(1000)))
+              for _ in range(count)]
+    path.write_bytes(serialize_point_set(points))
+    return deserialize_point_set(path.read_bytes())
+
+
+def test_triangulate_file_matches_serialize_triangles(tmp_path):
+    """Test que le fichier écrit est celui de serialize_triangles."""
+    points = _write_point_set(tmp_path / 'a.bin', 200)
+
+    report = triangulate_file(str(tmp_path / 'a.bin'), str(tmp_path / 'a.out'))
+
+    assert report.error is None
+    assert report.points == 200
+    expected = serialize_triangles(points, triangulate(points))
+    assert (tmp_path / 'a.out').read_bytes() == expected
+    assert report.triangles == len(triangulate(points))
+
+
+def test_triangulate_file_without_triangles(tmp_path):
+    """Test qu'un PointSet de moins de 3 points donne 0 triangle."""
+    points = _write_point_set(tmp_path / 'a.bin', 2)
+
+    report = triangulate_file(str(tmp_path / 'a.bin'), str(tmp_path / 'a.out'))
+
+    assert report.triangles == 0
+    assert (tmp_path / 'a.out').read_bytes() == serialize_triangles(points, [])
+
+
+@pytest.mark.parametrize('content', [b'', b'\x01\x00', b'\x02\x00\x00\x00\x00'])
+def test_triangulate_file_malformed(tmp_path, content):
+    """Test qu'un fichier malformé est signalé dans le rapport."""
+    (tmp_path / 'a.bin').write_bytes(content)
+
+    report = triangulate_file(str(tmp_path / 'a.bin'), str(tmp_path / 'a.out'))
+
+    assert report.error is not None
+    assert 'erreur' in str(report)
+
+
+def test_expand_inputs(tmp_path):
+    """Test l'expansion des répertoires et des motifs."""
+    for name in ('b.bin', 'a.bin', 'a' + TRIANGLES_SUFFIX, 'c.dat'):
+        (tmp_path / name).write_bytes(b'')
+    (tmp_path / 'sub').mkdir()
+
+    assert expand_inputs([str(tmp_path)]) == [
+        str(tmp_path / 'a.bin'), str(tmp_path / 'b.bin'), str(tmp_path / 'c.dat')
+    ]
+    assert expand_inputs([str(tmp_path / '*.bin'), str(tmp_path / 'a.bin')]) == [
+        str(tmp_path / 'a.bin'), str(tmp_path / 'b.bin')
+    ]
+    assert expand_inputs([str(tmp_path / 'a*')]) == [str(tmp_path / 'a.bin')]
+    with pytest.raises(ValueError):
+        expand_inputs([str(tmp_path / '*.xyz')])
+    with pytest.raises(ValueError):
+        expand_inputs([str(tmp_path / ('*' + TRIANGLES_SUFFIX))])
+
+
+def test_target_path():
+    """Test le nommage des fichiers Triangles."""
+    assert target_path('data/a.bin') == 'data/a' + TRIANGLES_SUFFIX
+    assert target_path('data/a.bin', 'out') == 'out/a' + TRIANGLES_SUFFIX
+
+
+def test_plan_jobs():
+    """Test le refus des fichiers Triangles qui écraseraient un fichier."""
+    assert plan_jobs(['data/a.bin', 'data/b.bin'], 'out') == [
+        ('data/a.bin', 'out/a' + TRIANGLES_SUFFIX),
+        ('data/b.bin', 'out/b' + TRIANGLES_SUFFIX),
+    ]
+    with pytest.raises(ValueError, match='écrasé'):
+        plan_jobs(['data/a' + TRIANGLES_SUFFIX])
+    with pytest.raises(ValueError, match='même résultat'):
+        plan_jobs(['data/a.bin', 'other/a.dat'], 'out')
+    with pytest.raises(ValueError, match='même résultat'):
+        plan_jobs(['data/a.bin', 'data/a.dat'])
+
+
+def test_run_with_jobs(tmp_path):
+    """Test que le pool de processus donne les mêmes fichiers, dans l'ordre."""
+    sources = []
+    for i in range(3):
+        _write_point_set(tmp_path / f'{i}.bin', 100, seed=i)
+        sources.append(str(tmp_path / f'{i}.bin'))
+
+    (tmp_path / 'seq').mkdir()
+    (tmp_path / 'par').mkdir()
+    list(run(sources, str(tmp_path / 'seq'), jobs=1))
+    reports = list(run(sources, str(tmp_path / 'par'), jobs=2))
+
+    assert [r.source for r in reports] == sources
+    assert [r.points for r in reports] == [100] * 3
+    for i in range(3):
+        name = f'{i}{TRIANGLES_SUFFIX}'
+        assert ((tmp_path / 'par' / name).read_bytes()
+                == (tmp_path / 'seq' / name).read_bytes())
+
+
+def test_main_reports_each_file(tmp_path, capsys):
+    """Test le rapport par fichier et le code de sortie."""
+    _write_point_set(tmp_path / 'a.bin', 50)
+    (tmp_path / 'b.bin').write_bytes(b'\x05\x00\x00\x00')
+
+    status = main([str(tmp_path), '-o', str(tmp_path / 'out')])
+
+    captured = capsys.readouterr()
+    assert status == 1
+    assert 'a.bin' in captured.out and 'points/s' in captured.out
+    assert 'b.bin: erreur' in captured.err
+    assert (tmp_path / 'out' / ('a' + TRIANGLES_SUFFIX)).exists()
+
+
+def test_main_invalid_arguments(tmp_path):
+    """Test qu'une entrée introuvable est une erreur d'arguments."""
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(tmp_path / 'absent.bin')])
+    assert excinfo.value.code == 2
+
+
+def test_main_rejects_colliding_targets(tmp_path):
+    """Test qu'aucun fichier n'est traité si deux résultats se confondent."""
+    _write_point_set(tmp_path / 'a.bin', 10)
+    _write_point_set(tmp_path / 'a.dat', 10)
+
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(tmp_path), '-o', str(tmp_path / 'out')])
+
+    assert excinfo.value.code == 2
+    assert not (tmp_path / 'out').exists()
+
+
+def test_module_entry_point(tmp_path):
+    """Test l'exécution par python -m."""
+    _write_point_set(tmp_path / 'a.bin', 10)
+
+    result = subprocess.run(
+        [sys.executable, '-m', 'src.triangulator', str(tmp_path / 'a.bin')],
+        capture_output=True, text=True, check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / ('a' + TRIANGLES_SUFFIX)).exists()
@@ -1,6 +1,9 @@
 """Tests unitaires pour le module core de triangulation."""
 
-from src.triangulator.core import triangulate
+import random
+
+from src.triangulator.core import deduplicate, triangulate
+from src.triangulator.triangles import TriangleArray
 
 
 def test_triangulate_simple_triangle():
@@ -40,6 +43,34 @@ def test_triangulate_coincident_points():
     assert len(triangles) == 0
 
 
+def test_triangulate_duplicated_points():
+    """Test que les doublons sont écartés au profit de leur premier exemplaire."""
+    square = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    points = square + [(1.0, 1.0), (0.0, 0.0), (1.0, 0.0)]
+    triangles = triangulate(points)
+    assert triangles == triangulate(square)
+    assert all(i < 4 for t in triangles for i in t)
+
+
+def test_deduplicate():
+    """Test de la table de correspondance des doublons."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 0.0), (2.0, 2.0), (1.0, 0.0)]
+    unique, index_map = deduplicate(points)
+    assert unique == [0, 1, 3]
+    assert index_map == [0, 1, 0, 3, 1]
+
+    unique, index_map = deduplicate(points[:2])
+    assert unique == index_map == [0, 1]
+
+
+def test_deduplicate_tolerance():
+    """Test du regroupement des points proches, y compris entre cellules."""
+    points = [(0.0, 0.0), (0.05, 0.0), (0.95, 1.0), (1.02, 1.0), (0.5, 0.5)]
+    unique, index_map = deduplicate(points, tolerance=0.1)
+    assert unique == [0, 2, 4]
+    assert index_map == [0, 0, 2, 2, 4]
+
+
 def test_triangulate_empty():
     """Test avec un ensemble vide de points."""
     points = []
@@ -51,4 +82,75 @@ def test_triangulate_large_set():
     """Test avec un ensemble plus grand de points."""
     points = [(float(i), float(i * 2)) for i in range(10)]
     triangles = triangulate(points)
-    assert isinstance(triangles, list)
+    assert isinstance(triangles, TriangleArray)
+
+
+def _is_delaunay(points, triangles):
+    """Vérifie qu'aucun point n'est strictement dans un cercle circonscrit."""
+    for a, b, c in triangles:
+        (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+        orientation = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        for i, (px, py) in enumerate(points):
+            if i in (a, b, c):
+                continue
+            adx, ady = ax - px, ay - py
+            bdx, bdy = bx - px, by - py
+            cdx, cdy = cx - px, cy - py
+            det = (
+                (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+                - (bdx * bdx + bdy * bdy) * (adx * cdy - cdx * ady)
+                + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+            )
+            if det * orientation > 1e-9:
+                return False
+    return True
+
+
+def test_triangulate_random_points_is_delaunay():
+    """Test de la propriété du cercle vide sur des points aléatoires."""
+    rng = random.Random(42)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(200)]
+    triangles = triangulate(points)
+    assert _is_delaunay(points, triangles)
+    assert all(len(set(t)) == 3 for t in triangles)
+
+
+def test_triangulate_grid_triangle_count():
+    """Test du nombre de triangles sur une grille régulière."""
+    points = [(float(i % 10), float(i // 10)) for i in range(100)]
+    triangles = triangulate(points)
+    # Une grille 10x10 compte 81 cellules, chacune coupée en 2 triangles.
+    assert len(triangles) == 162
+    assert _is_delaunay(points, triangles)
+
+
+def _area(points, triangles):
+    """Somme des aires des triangles."""
+    total = 0.0
+    for a, b, c in triangles:
+        (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+        total += abs((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) / 2
+    return total
+
+
+def test_triangulate_offset_grid():
+    """Test d'une grille fine loin de l'origine (arrondis défavorables)."""
+    points = [(1e7 + (i % 30) * 0.001, 1e7 + (i // 30) * 0.001)
+              for i in range(900)]
+    triangles = triangulate(points)
+    assert len(triangles) == 2 * 29 * 29
+    assert abs(_area(points, triangles) - (29 * 0.001) ** 2) < 1e-9
+
+
+def test_triangulate_cocircular_points():
+    """Test de points entiers tous situés sur un même cercle."""
+    points = [(5.0, 0.0), (4.0, 3.0), (3.0, 4.0), (0.0, 5.0),
+              (-3.0, 4.0), (-4.0, 3.0), (-5.0, 0.0), (-4.0, -3.0),
+              (-3.0, -4.0), (0.0, -5.0), (3.0, -4.0), (4.0, -3.0)]
+    triangles = triangulate(points)
+    assert len(triangles) == 10
+    assert _area(points, triangles) == 74.0
+
+    triangles = triangulate(points + [(0.0, 0.0)])
+    assert len(triangles) == 12
+    assert _area(points + [(0.0, 0.0)], triangles) == 74.0
@@ -0,0 +1,118 @@
+"""Tests unitaires de la triangulation différentielle."""
+
+import random
+
+from src.triangulator.core import triangulate
+from src.triangulator.delta import PATH_DELTA, PATH_FULL, MeshStore
+
+
+def _random_points(rng, count):
+    """Tire des points entiers distincts (exactement représentables)."""
+    return [(float(rng.randrange(10000)), float(rng.randrange(10000)))
+            for _ in range(count)]
+
+
+def _as_set(triangles):
+    """Triangles sans tenir compte de l'ordre des sommets."""
+    return {tuple(sorted(t)) for t in triangles}
+
+
+def test_delta_matches_full_triangulation():
+    """Test qu'un PointSet modifié est triangulé par différence."""
+    rng = random.Random(1)
+    points = _random_points(rng, 500)
+    store = MeshStore(max_points=10_000, max_churn=0.5)
+
+    triangles, path = store.triangulate('v1', points)
+    assert path == PATH_FULL
+    assert triangles == triangulate(points)
+
+    changed = points[20:] + _random_points(rng, 20)
+    rng.shuffle(changed)
+    triangles, path = store.triangulate('v2', changed, base='v1')
+
+    assert path == PATH_DELTA
+    assert _as_set(triangles) == _as_set(triangulate(changed))
+
+
+def test_delta_falls_back_above_churn():
+    """Test qu'une modification trop étendue reconstruit le maillage."""
+    rng = random.Random(2)
+    points = _random_points(rng, 200)
+    store = MeshStore(max_points=10_000, max_churn=0.1)
+    store.triangulate('v1', points)
+
+    changed = points[:150] + _random_points(rng, 50)
+    triangles, path = store.triangulate('v2', changed, base='v1')
+
+    assert path == PATH_FULL
+    assert triangles == triangulate(changed)
+    # Le maillage de base, intact, reste disponible.
+    assert store.stats() == {'meshes': 2, 'points': 400}
+
+
+def test_delta_falls_back_outside_mesh_box():
+    """Test qu'un point hors de la boîte du maillage force un recalcul."""
+    rng = random.Random(5)
+    points = _random_points(rng, 200)
+    store = MeshStore(max_points=10_000, max_churn=0.5)
+    store.triangulate('v1', points)
+
+    changed = points[1:] + [(50_000.0, 50_000.0)]
+    triangles, path = store.triangulate('v2', changed, base='v1')
+
+    assert path == PATH_FULL
+    assert triangles == triangulate(changed)
+
+
+def test_delta_needs_a_base():
+    """Test qu'un PointSet sans version de base connue est recalculé."""
+    rng = random.Random(6)
+    points = _random_points(rng, 200)
+    store = MeshStore(max_points=10_000, max_churn=0.5)
+    store.triangulate('v1', points)
+
+    changed = points[1:] + _random_points(rng, 1)
+    assert store.triangulate('v2', changed)[1] == PATH_FULL
+    assert store.triangulate('v3', changed, base='inconnu')[1] == PATH_FULL
+
+
+def test_delta_duplicates_reference_first_occurrence():
+    """Test que les doublons suivent la convention de triangulate."""
+    square = [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0)]
+    store = MeshStore(max_points=100, max_churn=1.0)
+    store.triangulate('v1', square + [(1.0, 1.0)])
+
+    changed = [(1.0, 1.0)] + square + [(1.0, 1.0), (3.0, 2.0)]
+    triangles, path = store.triangulate('v2', changed, base='v1')
+
+    assert path == PATH_DELTA
+    assert all(5 not in t for t in triangles)
+    assert _as_set(triangles) == _as_set(triangulate(changed))
+
+
+def test_delta_evicts_least_recent_meshes():
+    """Test que le stock reste borné en nombre de points."""
+    rng = random.Random(3)
+    store = MeshStore(max_points=250, max_churn=0.5)
+
+    store.triangulate('a', _random_points(rng, 100))
+    store.triangulate('b', _random_points(rng, 100))
+    store.triangulate('c', _random_points(rng, 100))
+
+    assert store.stats() == {'meshes': 2, 'points': 200}
+    _, path = store.triangulate('d', _random_points(rng, 100), base='a')
+    assert path == PATH_FULL
+
+
+def test_delta_point_set_too_large_is_not_kept():
+    """Test qu'un PointSet trop grand est triangulé sans être conservé."""
+    rng = random.Random(4)
+    points = _random_points(rng, 100)
+    store = MeshStore(max_points=50, max_churn=0.5)
+
+    triangles, path = store.triangulate('abc', points)
+
+    assert path == PATH_FULL
+    assert triangles == triangulate(points)
+    assert store.stats() == {'meshes': 0, 'points': 0}
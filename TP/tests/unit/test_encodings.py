@@ -0,0 +1,134 @@
+"""Tests unitaires des formats de réponse compacts."""
+
+import random
+
+import pytest
+
+from src.triangulator import encodings
+from src.triangulator.core import triangulate
+from src.triangulator.encodings import (
+    FORMAT_INDICES,
+    FORMAT_INDICES_VARINT,
+    FORMAT_TRIANGLES,
+    FORMAT_TRIANGLES_VARINT,
+    FORMATS,
+    compress,
+    decode_body,
+    decode_varint_triangles,
+    decompress,
+    encode_body,
+    encode_varint_triangles,
+    negotiate,
+)
+from src.triangulator.serialization import serialize_triangles
+from src.triangulator.triangles import TriangleArray
+
+
+def _random_mesh(count, seed=0):
+    """Triangule des points aléatoires reproductibles."""
+    rng = random.Random(seed)
+    points = [(float(rng.randrange(1000)), float(rng.randrange(1000)))
+              for _ in range(count)]
+    return points, triangulate(points)
+
+
+def _rotations(triangles):
+    """Triangles sans tenir compte du sommet de départ (orientation gardée)."""
+    return {min((a, b, c), (b, c, a), (c, a, b)) for a, b, c in triangles}
+
+
+def test_negotiate_defaults_to_legacy_format():
+    """Test que le format de la spécification reste celui par défaut."""
+    assert negotiate(None, None) == (FORMAT_TRIANGLES, None)
+    assert negotiate('*/*', 'identity') == (FORMAT_TRIANGLES, None)
+    assert negotiate('text/html', None) == (FORMAT_TRIANGLES, None)
+
+
+def test_negotiate_formats_and_encodings():
+    """Test du choix selon les qualités des en-têtes."""
+    accept = f'{FORMAT_TRIANGLES};q=0.5, {FORMAT_INDICES_VARINT}'
+    assert negotiate(accept, 'gzip') == (FORMAT_INDICES_VARINT, 'gzip')
+    assert negotiate(None, 'gzip;q=0, br')[1] is None
+
+
+def test_varint_triangles_round_trip():
+    """Test que le codage en varints garde triangles et orientations."""
+    _, triangles = _random_mesh(300)
+
+    block = encode_varint_triangles(triangles)
+    decoded, end = decode_varint_triangles(block)
+
+    assert end == len(block)
+    assert len(decoded) == len(triangles)
+    assert _rotations(decoded) == _rotations(triangles)
+    assert len(block) < 12 * len(triangles)
+
+
+def test_varint_triangles_large_indices():
+    """Test du codage d'indices sur plusieurs bytes."""
+    triangles = [(5, 2**31 + 7, 3), (2**30, 1, 9), (0, 4_000_000_000, 2)]
+
+    decoded, _ = decode_varint_triangles(encode_varint_triangles(triangles))
+
+    assert _rotations(decoded) == _rotations(triangles)
+
+
+def test_varint_triangles_numpy_matches_python():
+    """Test que le codage vectorisé produit les mêmes bytes."""
+    pytest.importorskip('numpy')
+    _, triangles = _random_mesh(300, seed=1)
+
+    expected = encodings._encode_varints(triangles.indices)
+    assert encodings._encode_varints_numpy(triangles.indices) == expected
+
+
+def test_decode_varint_triangles_truncated():
+    """Test du rejet d'un bloc de varints tronqué."""
+    block = encode_varint_triangles([(0, 300, 1)])
+    with pytest.raises(ValueError):
+        decode_varint_triangles(block[:-1])
+    with pytest.raises(ValueError):
+        decode_varint_triangles(block[:4] + b'\x02\x00\x00\x00\x00\xac')
+
+
+@pytest.mark.parametrize('media_type', FORMATS)
+def test_encode_body_round_trip(media_type):
+    """Test de chaque format, avec et sans table des doublons."""
+    points, triangles = _random_mesh(100, seed=2)
+
+    for index_map in (None, list(range(len(points)))):
+        body = encode_body(points, triangles, media_type, index_map)
+        vertices, decoded = decode_body(body, media_type)
+
+        assert _rotations(decoded) == _rotations(triangles)
+        if media_type in (FORMAT_INDICES, FORMAT_INDICES_VARINT):
+            assert vertices is None
+        else:
+            assert vertices == points
+
+
+def test_encode_body_legacy_is_serialize_triangles():
+    """Test que le format par défaut est exactement serialize_triangles."""
+    points, triangles = _random_mesh(50, seed=3)
+
+    assert (encode_body(points, triangles, FORMAT_TRIANGLES)
+            == serialize_triangles(points, triangles))
+    assert (encode_body(points, triangles, FORMAT_TRIANGLES_VARINT)[:4 + 8 * 50]
+            == serialize_triangles(points, triangles)[:4 + 8 * 50])
+
+
+def test_compress_round_trip():
+    """Test de la compression gzip et du refus d'une compression absente."""
+    data = encode_body(*_random_mesh(100, seed=4), FORMAT_INDICES)
+
+    assert decompress(compress(data, 'gzip'), 'gzip') == data
+    assert compress(data, None) == data
+    with pytest.raises(ValueError):
+        compress(data, 'br')
+
+
+def test_encode_empty_triangles():
+    """Test d'une triangulation sans triangle."""
+    block = encode_varint_triangles(TriangleArray())
+
+    assert decode_varint_triangles(block) == (TriangleArray(), 8)
@@ -0,0 +1,124 @@
+"""Tests unitaires pour les exécuteurs de triangulation."""
+
+import random
+import threading
+import time
+
+import pytest
+
+from src.triangulator.cancellation import CancellationToken, Cancelled
+from src.triangulator.core import triangulate
+from src.triangulator.executor import (
+    ExecutorSaturated,
+    InlineExecutor,
+    JobTimeout,
+    ProcessExecutor,
+)
+from src.triangulator.serialization import serialize_point_set
+
+SQUARE = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+
+
+def _random_points(count):
+    """Génère des points aléatoires reproductibles."""
+    rng = random.Random(3)
+    return [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(count)]
+
+
+@pytest.fixture(scope='module')
+def pool():
+    """Fixture qui démarre un pool d'un seul processus."""
+    executor = ProcessExecutor(workers=1, queue_size=0)
+    yield executor
+    executor.close()
+
+
+def test_inline_matches_triangulate():
+    """Test que l'exécuteur en ligne produit la triangulation directe."""
+    executor = InlineExecutor(max_pending=1)
+
+    assert executor.run(serialize_point_set(SQUARE)) == triangulate(SQUARE)
+
+
+def test_inline_saturated():
+    """Test que l'exécuteur en ligne refuse les travaux en surnombre."""
+    executor = InlineExecutor(max_pending=0)
+
+    with pytest.raises(ExecutorSaturated):
+        executor.run(serialize_point_set(SQUARE))
+
+
+def test_process_matches_triangulate(pool):
+    """Test que le pool produit exactement la triangulation directe."""
+    points = _random_points(500)
+
+    assert pool.run(serialize_point_set(points)) == triangulate(points)
+
+
+def test_process_reports_invalid_data(pool):
+    """Test qu'une erreur du processus de calcul est remontée."""
+    with pytest.raises(RuntimeError):
+        pool.run(b'\x01')
+
+
+def test_process_timeout_replaces_worker(pool):
+    """Test qu'un calcul trop long est interrompu sans bloquer le pool."""
+    with pytest.raises(JobTimeout):
+        pool.run(serialize_point_set(_random_points(20000)), timeout=0.01)
+
+    assert pool.run(serialize_point_set(SQUARE), timeout=30) == triangulate(SQUARE)
+
+
+def test_process_saturated(pool):
+    """Test que le pool refuse un travail quand tous les emplacements sont pris."""
+    payload = serialize_point_set(_random_points(20000))
+    running = threading.Thread(
+        target=lambda: pytest.raises(JobTimeout, pool.run, payload, 0.5)
+    )
+    running.start()
+    try:
+        while pool._idle.qsize():
+            time.sleep(0.001)
+        with pytest.raises(ExecutorSaturated):
+            pool.run(serialize_point_set(SQUARE))
+    finally:
+        running.join()
+
+
+def test_process_cancellation_replaces_worker(pool):
+    """Test qu'un calcul annulé libère le pool en quelques millisecondes."""
+    token = CancellationToken()
+    cancelled_at = []
+
+    def cancel():
+        time.sleep(0.05)
+        cancelled_at.append(time.perf_counter())
+        token.cancel()
+
+    threading.Thread(target=cancel).start()
+    with pytest.raises(Cancelled):
+        pool.run(serialize_point_set(_random_points(20000)), cancel=token)
+    assert time.perf_counter() - cancelled_at[0] < 0.1
+
+    assert pool.run(serialize_point_set(SQUARE), timeout=30) == triangulate(SQUARE)
+
+
+def test_process_timeout_includes_wait_for_worker():
+    """Test que le délai couvre l'attente d'un processus libre et le calcul."""
+    executor = ProcessExecutor(workers=1, queue_size=1)
+    payload = serialize_point_set(_random_points(20000))
+    running = threading.Thread(
+        target=lambda: pytest.raises(JobTimeout, executor.run, payload, 0.5)
+    )
+    try:
+        running.start()
+        while executor._idle.qsize():
+            time.sleep(0.001)
+
+        start = time.perf_counter()
+        with pytest.raises(JobTimeout):
+            executor.run(payload, timeout=1.0)
+        assert time.perf_counter() - start < 1.3
+    finally:
+        running.join()
+        executor.close()
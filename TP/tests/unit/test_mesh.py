@@ -0,0 +1,159 @@
+"""Tests unitaires pour la triangulation incrémentale DelaunayMesh."""
+
+import random
+
+import pytest
+
+from src.triangulator.core import triangulate
+from src.triangulator.mesh import DelaunayMesh
+from src.triangulator.predicates import incircle, orient2d
+from src.triangulator.serialization import deserialize_point_set, serialize_point_set
+
+CORNERS = [(0.0, 0.0), (100.0, 0.0), (100.0, 100.0), (0.0, 100.0)]
+
+
+def _random_points(rng, count):
+    """Points aléatoires à l'intérieur du carré CORNERS."""
+    return [(rng.uniform(1, 99), rng.uniform(1, 99)) for _ in range(count)]
+
+
+def _as_set(triangles):
+    """Triangles sans tenir compte de l'ordre des sommets."""
+    return {tuple(sorted(t)) for t in triangles}
+
+
+def _reference(mesh):
+    """Triangulation complète des points présents, en indices du maillage."""
+    live = [i for i, p in enumerate(mesh.vertices) if p is not None]
+    triangles = triangulate([mesh.vertices[i] for i in live])
+    return {tuple(sorted(live[k] for k in t)) for t in triangles}
+
+
+def _check_delaunay(mesh):
+    """Vérifie l'orientation et la propriété du cercle vide."""
+    points = [p for p in mesh.vertices if p is not None]
+    for a, b, c in mesh.triangles():
+        pa, pb, pc = mesh.vertices[a], mesh.vertices[b], mesh.vertices[c]
+        assert orient2d(pa, pb, pc) > 0
+        assert all(incircle(pa, pb, pc, p) <= 0 for p in points)
+
+
+def test_mesh_matches_triangulate():
+    """Test qu'un maillage construit d'un bloc égale triangulate."""
+    rng = random.Random(1)
+    points = _random_points(rng, 300)
+
+    assert DelaunayMesh(points).triangles() == triangulate(points)
+
+
+def test_mesh_insert_and_remove():
+    """Test d'insertions et de suppressions contre une triangulation complète."""
+    rng = random.Random(2)
+    mesh = DelaunayMesh(CORNERS + _random_points(rng, 300))
+
+    for index in rng.sample(range(4, 304), 60):
+        mesh.remove(index)
+    indices = mesh.insert(_random_points(rng, 60))
+
+    assert indices == list(range(304, 364))
+    assert _as_set(mesh.triangles()) == _reference(mesh)
+    _check_delaunay(mesh)
+
+
+def test_mesh_remove_from_grid():
+    """Test de suppressions parmi des points cocirculaires."""
+    mesh = DelaunayMesh([(float(i % 10), float(i // 10)) for i in range(100)])
+
+    for index in (11, 12, 22, 45, 46, 55, 56, 88):
+        mesh.remove(index)
+
+    triangles = mesh.triangles()
+    area = 0.0
+    for a, b, c in triangles:
+        (ax, ay), (bx, by), (cx, cy) = (mesh.vertices[i] for i in (a, b, c))
+        area += ((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) / 2
+    assert area == 81.0
+    assert len(triangles) == 162 - 2 * 8
+    _check_delaunay(mesh)
+
+
+def test_mesh_insert_outside_rebuilds():
+    """Test d'une insertion loin de la boîte englobante initiale."""
+    rng = random.Random(3)
+    mesh = DelaunayMesh(_random_points(rng, 50))
+    before = mesh.super_triangle
+
+    mesh.insert([(1000.0, 1000.0), (-500.0, 20.0)])
+
+    assert mesh.super_triangle != before
+    assert _as_set(mesh.triangles()) == _reference(mesh)
+
+
+def test_mesh_far_from_origin():
+    """Test d'une petite grille loin de l'origine (arrondi 32 bits)."""
+    offset = 1e7
+    mesh = DelaunayMesh([
+        (offset + 0.001 * (i % 12), offset + 0.001 * (i // 12))
+        for i in range(144)
+    ])
+
+    for index in (13, 40, 77):
+        mesh.remove(index)
+
+    assert len(mesh.triangles()) == 2 * 11 * 11 - 2 * 3
+    _check_delaunay(mesh)
+
+
+def test_mesh_duplicates():
+    """Test qu'un doublon remplace son premier exemplaire retiré."""
+    mesh = DelaunayMesh(CORNERS + [(50.0, 50.0)])
+    mesh.insert([(50.0, 50.0)])
+
+    assert all(5 not in t for t in mesh.triangles())
+    mesh.remove(4)
+    assert sum(5 in t for t in mesh.triangles()) == 4
+    mesh.remove(5)
+    assert len(mesh.triangles()) == 2
+
+
+def test_mesh_remove_invalid_index():
+    """Test qu'un indice absent ou déjà retiré est refusé."""
+    mesh = DelaunayMesh(CORNERS)
+    mesh.remove(0)
+
+    with pytest.raises(IndexError):
+        mesh.remove(0)
+    with pytest.raises(IndexError):
+        mesh.remove(4)
+
+
+def test_mesh_snapshot_round_trip():
+    """Test de la restauration depuis le format Triangles."""
+    rng = random.Random(4)
+    # Points représentables en float32, comme ceux d'un PointSet.
+    points = deserialize_point_set(serialize_point_set(_random_points(rng, 220)))
+    mesh = DelaunayMesh(CORNERS + points[:200])
+    mesh.remove(10)
+    mesh.insert([(50.0, 50.0), (50.0, 50.0)])
+
+    restored = DelaunayMesh.from_bytes(mesh.to_bytes())
+
+    assert restored.vertices == mesh.vertices
+    assert _as_set(restored.triangles()) == _as_set(mesh.triangles())
+
+    edits = points[200:]
+    for target in (mesh, restored):
+        target.remove(30)
+        target.remove(204)
+        target.insert(edits)
+    assert _as_set(restored.triangles()) == _as_set(mesh.triangles())
+    assert _as_set(restored.triangles()) == _reference(restored)
+
+
+def test_mesh_empty_snapshot():
+    """Test d'un maillage vide et de sa restauration."""
+    mesh = DelaunayMesh.from_bytes(DelaunayMesh().to_bytes())
+
+    assert mesh.triangles() == []
+    mesh.insert(CORNERS)
+    assert len(mesh.triangles()) == 2
@@ -0,0 +1,118 @@
+"""Tests unitaires des mesures et des compteurs internes de triangulate."""
+
+import random
+
+import pytest
+
+from src.triangulator.core import set_stats_hook, triangulate
+from src.triangulator.metrics import (
+    PAYLOAD_TRIANGLES,
+    STAGE_FETCH,
+    STAGE_SERIALIZE,
+    Metrics,
+)
+
+
+def _samples(text):
+    """Extrait les valeurs des lignes de mesure, par nom et étiquettes."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test des intervalles cumulés, de la somme et du nombre."""
+    metrics = Metrics()
+    for seconds in (0.0005, 0.003, 0.003, 100.0):
+        metrics.observe_stage(STAGE_FETCH, seconds)
+
+    samples = _samples(metrics.render())
+    name = 'triangulator_stage_duration_seconds'
+    assert samples[f'{name}_bucket{{stage="fetch",le="0.001"}}'] == 1
+    assert samples[f'{name}_bucket{{stage="fetch",le="0.005"}}'] == 3
+    assert samples[f'{name}_bucket{{stage="fetch",le="60.0"}}'] == 3
+    assert samples[f'{name}_bucket{{stage="fetch",le="+Inf"}}'] == 4
+    assert samples[f'{name}_count{{stage="fetch"}}'] == 4
+    assert samples[f'{name}_sum{{stage="fetch"}}'] == pytest.approx(100.0065)
+
+
+def test_render_errors_payloads_and_gauges():
+    """Test du format des compteurs, des tailles et des valeurs instantanées."""
+    metrics = Metrics()
+    metrics.count_error('NOT_FOUND')
+    metrics.count_error('NOT_FOUND')
+    metrics.count_error('SERVICE_BUSY')
+    metrics.observe_payload(PAYLOAD_TRIANGLES, 2000)
+
+    text = metrics.render({'cache': {'hits': 3}})
+
+    assert '# TYPE triangulator_errors_total counter' in text
+    assert '# TYPE triangulator_payload_size_bytes histogram' in text
+    samples = _samples(text)
+    assert samples['triangulator_errors_total{code="NOT_FOUND"}'] == 2
+    assert samples['triangulator_errors_total{code="SERVICE_BUSY"}'] == 1
+    assert samples[
+        'triangulator_payload_size_bytes_bucket{kind="triangles",le="4096"}'
+    ] == 1
+    assert samples['triangulator_cache_hits'] == 3
+    assert samples['triangulator_points_inserted_total'] == 0
+
+
+def test_timed_counts_only_production():
+    """Test que la sérialisation n'est mesurée qu'une fois terminée."""
+    metrics = Metrics()
+    chunks = metrics.timed(STAGE_SERIALIZE, iter([b'a', b'b']), 1.0)
+
+    assert next(chunks) == b'a'
+    assert 'stage="serialize"' not in metrics.render()
+    assert list(chunks) == [b'b']
+    samples = _samples(metrics.render())
+    assert samples[
+        'triangulator_stage_duration_seconds_count{stage="serialize"}'
+    ] == 1
+    assert samples[
+        'triangulator_stage_duration_seconds_sum{stage="serialize"}'
+    ] >= 1.0
+
+
+def test_triangulation_counters_hook():
+    """Test des compteurs internes transmis au crochet de triangulate."""
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+    received = []
+
+    set_stats_hook(received.append)
+    try:
+        counted = triangulate(points)
+        triangulate(points[:2])
+    finally:
+        set_stats_hook(None)
+    triangulate(points)
+
+    assert counted == triangulate(points)
+    assert len(received) == 1
+    stats = received[0]
+    assert stats.points == 300
+    assert stats.cavity_triangles >= stats.points
+    assert stats.incircle_tests > stats.points
+
+
+def test_triangulation_counters_in_metrics():
+    """Test que les compteurs cumulés donnent la taille moyenne des cavités."""
+    metrics = Metrics()
+    points = [(float(i % 10), float(i // 10)) for i in range(100)]
+
+    set_stats_hook(metrics.observe_triangulation)
+    try:
+        triangulate(points)
+        triangulate(points)
+    finally:
+        set_stats_hook(None)
+
+    samples = _samples(metrics.render())
+    assert samples['triangulator_instrumented_triangulations_total'] == 2
+    assert samples['triangulator_points_inserted_total'] == 200
+    assert samples['triangulator_cavity_triangles_total'] >= 200
@@ -0,0 +1,59 @@
+"""Tests unitaires pour le module des ordres d'insertion."""
+
+import random
+
+import pytest
+
+from src.triangulator.core import triangulate
+from src.triangulator.ordering import brio_order, hilbert_order, insertion_order
+
+
+def _random_points(count, seed=0):
+    """Génère des points aléatoires reproductibles."""
+    rng = random.Random(seed)
+    return [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(count)]
+
+
+def test_hilbert_order_is_permutation():
+    """Test que l'ordre de Hilbert est une permutation des indices."""
+    points = _random_points(500)
+    assert sorted(hilbert_order(points)) == list(range(500))
+
+
+def test_hilbert_order_is_local():
+    """Test que des points consécutifs dans l'ordre de Hilbert sont proches."""
+    points = [(float(i % 32), float(i // 32)) for i in range(1024)]
+    order = hilbert_order(points)
+    steps = [
+        abs(points[a][0] - points[b][0]) + abs(points[a][1] - points[b][1])
+        for a, b in zip(order, order[1:])
+    ]
+    assert max(steps) == 1.0
+
+
+def test_brio_order_is_reproducible_permutation():
+    """Test que BRIO donne une permutation reproductible avec une graine."""
+    points = _random_points(1000)
+    order = brio_order(points, seed=3)
+    assert sorted(order) == list(range(1000))
+    assert order == brio_order(points, seed=3)
+
+
+def test_insertion_order_none_keeps_arrival_order():
+    """Test que l'ordre 'none' conserve l'ordre d'arrivée."""
+    points = _random_points(10)
+    assert insertion_order(points, 'none') == list(range(10))
+
+
+@pytest.mark.parametrize('order', ['none', 'hilbert', 'brio'])
+def test_triangulate_orders_give_same_mesh(order):
+    """Test que l'ordre d'insertion ne change pas la triangulation."""
+    points = _random_points(300, seed=7)
+    expected = {frozenset(t) for t in triangulate(points, order='none')}
+    assert {frozenset(t) for t in triangulate(points, order=order)} == expected
+
+
+def test_triangulate_unknown_order():
+    """Test qu'un ordre d'insertion inconnu est refusé."""
+    with pytest.raises(ValueError):
+        triangulate([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], order='zorder')
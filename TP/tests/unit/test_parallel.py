@@ -0,0 +1,76 @@
+"""Tests unitaires pour la triangulation parallèle."""
+
+import random
+
+from src.triangulator.core import _point_in_circumcircle, triangulate
+from src.triangulator.parallel import MIN_STRIP_POINTS
+
+
+def _normalize(triangles):
+    """Ramène chaque triangle à une rotation canonique."""
+    result = set()
+    for tri in triangles:
+        k = tri.index(min(tri))
+        result.add(tri[k:] + tri[:k])
+    return result
+
+
+def _area(points, triangles):
+    """Calcule l'aire totale des triangles."""
+    total = 0.0
+    for a, b, c in triangles:
+        (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+        total += abs((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) / 2
+    return total
+
+
+def test_parallel_matches_sequential():
+    """Test que le découpage en bandes retrouve la triangulation séquentielle."""
+    rng = random.Random(1)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(2000)]
+
+    expected = _normalize(triangulate(points))
+    result = triangulate(points, workers=4)
+
+    assert len(result) == len(_normalize(result))
+    assert _normalize(result) >= expected
+    assert len(result) - len(expected) <= 2
+
+
+def test_parallel_grid_is_delaunay():
+    """Test une grille: points cocirculaires et bandes colinéaires."""
+    points = [(float(i % 30), float(i // 30)) for i in range(900)]
+
+    result = triangulate(points, workers=3)
+
+    assert len(result) == 2 * 29 * 29
+    assert _area(points, result) == 29 * 29
+    for a, b, c in result[::37]:
+        assert not any(
+            _point_in_circumcircle(p, points[a], points[b], points[c])
+            for p in points
+        )
+
+
+def test_parallel_small_input_runs_sequentially():
+    """Test qu'un petit ensemble n'est pas découpé."""
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+
+    assert 2 * MIN_STRIP_POINTS > len(points)
+    assert triangulate(points, workers=4) == triangulate(points)
+
+
+def test_parallel_degenerate_input():
+    """Test que des points colinéaires donnent une liste vide."""
+    collinear = [(float(i), 2.0 * i) for i in range(500)]
+
+    assert triangulate(collinear, workers=2) == []
+
+
+def test_parallel_duplicated_input():
+    """Test que les doublons sont écartés avant le découpage en bandes."""
+    grid = [(float(i % 20), float(i // 20)) for i in range(400)]
+
+    triangles = triangulate(grid * 2, workers=2)
+    assert triangles == triangulate(grid, workers=2)
+    assert len(triangles) == 2 * 19 * 19
@@ -0,0 +1,69 @@
+"""Tests unitaires pour les prédicats géométriques robustes."""
+
+from fractions import Fraction
+
+from src.triangulator.predicates import (
+    exact_counts,
+    incircle,
+    orient2d,
+    reset_exact_counts,
+)
+
+
+def _sign(value):
+    """Signe d'un nombre."""
+    return (value > 0) - (value < 0)
+
+
+def test_orient2d_simple():
+    """Test de l'orientation de triplets bien séparés."""
+    assert orient2d((0.0, 0.0), (1.0, 0.0), (0.0, 1.0)) > 0
+    assert orient2d((0.0, 0.0), (0.0, 1.0), (1.0, 0.0)) < 0
+    assert orient2d((0.0, 0.0), (1.0, 1.0), (2.0, 2.0)) == 0
+
+
+def test_orient2d_near_collinear_matches_exact():
+    """Test de triplets presque alignés contre un calcul en rationnels."""
+    a = (0.5, 0.5)
+    b = (12.0, 12.0)
+    for i in range(64):
+        for j in range(64):
+            c = (0.5 + i * 2.0 ** -53, 0.5 + j * 2.0 ** -53)
+            ax, ay, bx, by, cx, cy = map(Fraction, (*a, *b, *c))
+            exact = (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+            assert _sign(orient2d(a, b, c)) == _sign(exact)
+
+
+def test_incircle_simple():
+    """Test de la position de points par rapport au cercle unité."""
+    a, b, c = (1.0, 0.0), (0.0, 1.0), (-1.0, 0.0)
+    assert incircle(a, b, c, (0.0, 0.0)) > 0
+    assert incircle(a, b, c, (2.0, 0.0)) < 0
+    assert incircle(a, b, c, (0.0, -1.0)) == 0
+    assert incircle(c, b, a, (0.0, 0.0)) < 0
+
+
+def test_incircle_cocircular_is_zero():
+    """Test de points cocirculaires loin de l'origine."""
+    base = 1e7
+    a = (base + 5.0, base)
+    b = (base + 3.0, base + 4.0)
+    c = (base - 4.0, base + 3.0)
+    assert incircle(a, b, c, (base, base - 5.0)) == 0
+    assert incircle(a, b, c, (base - 4.0, base - 3.0)) == 0
+
+
+def test_exact_counts():
+    """Test des compteurs de passages par le calcul exact."""
+    reset_exact_counts()
+    orient2d((0.0, 0.0), (1.0, 0.0), (0.0, 1.0))
+    assert exact_counts() == {'orient2d': 0, 'incircle': 0}
+
+    orient2d((0.5, 0.5), (12.0, 12.0), (24.0, 24.0))
+    incircle((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))
+    counts = exact_counts()
+    assert counts['orient2d'] >= 1
+    assert counts['incircle'] == 1
+
+    reset_exact_counts()
+    assert exact_counts() == {'orient2d': 0, 'incircle': 0}
@@ -0,0 +1,131 @@
+"""Tests unitaires de l'ordonnanceur des triangulations."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.triangulator.scheduler import (
+    LANE_HEAVY,
+    LANE_LIGHT,
+    Scheduler,
+    SchedulerSaturated,
+    estimate_cost,
+)
+
+
+def _acquire_in_thread(scheduler, point_count, order):
+    """Attend une place dans un thread, qui note son nombre de points."""
+    def run():
+        admission = scheduler.acquire(point_count)
+        order.append(point_count)
+        scheduler.release(admission)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _wait_queued(scheduler, lane, count):
+    """Attend que count travaux soient en attente dans la voie."""
+    for _ in range(1000):
+        if scheduler.stats()[f'{lane}_queued'] == count:
+            return
+        time.sleep(0.001)
+    raise AssertionError('travaux jamais mis en attente')
+
+
+def test_estimate_cost():
+    """Test de l'estimation n · log2(n)."""
+    assert estimate_cost(0) == estimate_cost(1) == 0.0
+    assert estimate_cost(1024, factor=1.0) == 10240.0
+    assert estimate_cost(2_000_000) > 1000 * estimate_cost(2000)
+
+
+def test_heavy_job_does_not_block_light_lane():
+    """Test qu'un grand PointSet en cours laisse passer les petits."""
+    scheduler = Scheduler(heavy_points=100, light_workers=1, heavy_workers=1)
+
+    heavy = scheduler.acquire(1000)
+    light = scheduler.acquire(10)
+
+    assert heavy.lane.name == LANE_HEAVY
+    assert light.lane.name == LANE_LIGHT
+    assert light.granted
+
+    order = []
+    waiting = _acquire_in_thread(scheduler, 2000, order)
+    _wait_queued(scheduler, LANE_HEAVY, 1)
+    assert order == []
+
+    scheduler.release(heavy)
+    waiting.join(timeout=5)
+    scheduler.release(light)
+    assert order == [2000]
+    assert scheduler.stats()['heavy_running'] == 0
+
+
+def test_lane_is_first_come_first_served():
+    """Test que les travaux d'une voie passent dans l'ordre d'arrivée."""
+    scheduler = Scheduler(heavy_points=100, light_workers=1)
+    first = scheduler.acquire(10)
+
+    order = []
+    threads = []
+    for count in (11, 12, 13):
+        threads.append(_acquire_in_thread(scheduler, count, order))
+        _wait_queued(scheduler, LANE_LIGHT, len(threads))
+
+    scheduler.release(first)
+    for thread in threads:
+        thread.join(timeout=5)
+    assert order == [11, 12, 13]
+
+
+def test_rejects_beyond_estimated_wait():
+    """Test du refus d'un travail quand l'attente estimée dépasse le budget."""
+    scheduler = Scheduler(
+        heavy_points=100, light_workers=1, max_wait=10.0, cost_factor=1.0
+    )
+
+    # Une voie vide accepte même un travail plus long que le budget.
+    running = scheduler.acquire(16)
+    assert scheduler.stats()['light_backlog_seconds'] == 64.0
+
+    with pytest.raises(SchedulerSaturated) as info:
+        scheduler.acquire(4)
+    assert info.value.lane == LANE_LIGHT
+    assert info.value.retry_after == 64.0
+
+    scheduler.release(running)
+    scheduler.release(scheduler.acquire(4))
+    stats = scheduler.stats()
+    assert stats['light_admitted'] == 2
+    assert stats['light_rejected'] == 1
+    assert stats['light_backlog_seconds'] == 0.0
+
+
+def test_acquire_async_and_cancellation():
+    """Test de l'attente asynchrone et du retrait d'un travail abandonné."""
+    scheduler = Scheduler(heavy_points=100, light_workers=1)
+
+    async def scenario():
+        held = await scheduler.acquire_async(10)
+        abandoned = asyncio.ensure_future(scheduler.acquire_async(10))
+        waiting = asyncio.ensure_future(scheduler.acquire_async(20))
+        await asyncio.sleep(0)
+        assert scheduler.stats()['light_queued'] == 2
+
+        abandoned.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await abandoned
+        assert scheduler.stats()['light_queued'] == 1
+
+        threading.Thread(target=scheduler.release, args=(held,)).start()
+        admission = await asyncio.wait_for(waiting, timeout=5)
+        assert admission.wait > 0
+        scheduler.release(admission)
+
+    asyncio.run(scenario())
+    assert scheduler.stats()['light_running'] == 0
@@ -1,13 +1,23 @@
 """Tests unitaires pour le module de sérialisation."""
 
 import struct
+import tracemalloc
 
 import pytest
 
 from src.triangulator.serialization import (
+    BATCH_RECORD_ERROR,
+    BATCH_RECORD_TRIANGLES,
+    PointSetDecoder,
+    decode_batch,
     deserialize_point_set,
+    deserialize_point_set_columns,
+    encode_batch_header,
+    encode_batch_record,
+    iter_serialize_triangles,
     serialize_point_set,
     serialize_triangles,
+    triangles_size,
 )
 
 
@@ -91,3 +101,154 @@ def test_deserialize_insufficient_header():
     data = b'\x00\x01'
     with pytest.raises(ValueError):
         deserialize_point_set(data)
+
+
+def test_deserialize_point_set_from_buffers():
+    """Test de désérialisation depuis bytearray et memoryview."""
+    data = serialize_point_set([(1.5, 2.5), (-1.0, 0.0)])
+    expected = [(1.5, 2.5), (-1.0, 0.0)]
+    assert deserialize_point_set(bytearray(data)) == expected
+    assert deserialize_point_set(memoryview(data)) == expected
+
+
+def test_deserialize_point_set_ignores_trailing_bytes():
+    """Test que des bytes après les points annoncés sont ignorés."""
+    data = serialize_point_set([(1.0, 2.0)]) + b'\x00' * 5
+    assert deserialize_point_set(data) == [(1.0, 2.0)]
+
+
+def test_deserialize_point_set_columns():
+    """Test de désérialisation en colonnes xs/ys."""
+    data = serialize_point_set([(0.5, 1.0), (2.0, -3.0), (4.0, 5.5)])
+    xs, ys = deserialize_point_set_columns(data)
+    assert list(xs) == [0.5, 2.0, 4.0]
+    assert list(ys) == [1.0, -3.0, 5.5]
+
+
+def test_deserialize_point_set_columns_malformed():
+    """Test de désérialisation en colonnes avec données incomplètes."""
+    with pytest.raises(ValueError):
+        deserialize_point_set_columns(struct.pack('<I', 2) + b'\x00' * 8)
+
+
+def test_serialize_triangles_matches_struct_layout():
+    """Test que l'encodage en bloc respecte le format octet par octet."""
+    points = [(float(i), float(-i)) for i in range(50)]
+    triangles = [(i, i + 1, i + 2) for i in range(48)]
+
+    expected = struct.pack('<I', 50)
+    for x, y in points:
+        expected += struct.pack('<ff', x, y)
+    expected += struct.pack('<I', 48)
+    for tri in triangles:
+        expected += struct.pack('<III', *tri)
+
+    assert serialize_triangles(points, triangles) == expected
+
+
+def test_iter_serialize_triangles_matches_serialize_triangles():
+    """Test que la sérialisation par morceaux produit les mêmes bytes."""
+    points = [(float(i), float(i) / 2) for i in range(100)]
+    triangles = [(i, i + 1, i + 2) for i in range(98)]
+
+    chunks = list(iter_serialize_triangles(points, triangles, chunk_size=64))
+    assert b''.join(chunks) == serialize_triangles(points, triangles)
+    assert max(len(chunk) for chunk in chunks) <= 64
+
+
+def test_triangles_size():
+    """Test du calcul de taille d'une structure Triangles."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    triangles = [(0, 1, 2)]
+    expected = len(serialize_triangles(points, triangles))
+    assert triangles_size(len(points), len(triangles)) == expected
+
+
+def test_batch_records_roundtrip():
+    """Test de l'encodage et du décodage d'une réponse par lot."""
+    triangles = serialize_triangles([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], [(0, 1, 2)])
+    data = (
+        encode_batch_header(2)
+        + encode_batch_record(BATCH_RECORD_TRIANGLES, triangles)
+        + encode_batch_record(BATCH_RECORD_ERROR, b'{}')
+    )
+
+    assert decode_batch(data) == [
+        (BATCH_RECORD_TRIANGLES, triangles),
+        (BATCH_RECORD_ERROR, b'{}'),
+    ]
+    with pytest.raises(ValueError):
+        decode_batch(data[:-1])
+
+
+def test_point_set_decoder_incremental():
+    """Test du décodage d'un PointSet reçu octet par octet."""
+    data = serialize_point_set([(1.0, 2.0), (3.0, 4.0)])
+    decoder = PointSetDecoder()
+
+    for i in range(len(data)):
+        assert not decoder.done
+        decoder.feed(data[i:i + 1])
+
+    assert decoder.point_count == 2
+    assert decoder.payload() == data
+
+
+def test_point_set_decoder_rejects_extra_data():
+    """Test que des données au-delà de la taille annoncée sont refusées."""
+    decoder = PointSetDecoder()
+
+    with pytest.raises(ValueError):
+        decoder.feed(serialize_point_set([(1.0, 2.0)]) + b'\x00')
+
+
+def test_point_set_decoder_decodes_points_incrementally():
+    """Test du décodage des points au fil de morceaux de tailles variées."""
+    points = [(float(i), -float(i)) for i in range(10)]
+    data = serialize_point_set(points)
+    decoder = PointSetDecoder(decode_points=True)
+
+    with pytest.raises(ValueError):
+        decoder.point_set()
+    for start in range(0, len(data), 7):
+        decoder.feed(data[start:start + 7])
+
+    assert decoder.point_set() == points
+
+    decoder = PointSetDecoder()
+    decoder.feed(data)
+    assert decoder.point_set() == points
+
+
+def test_point_set_decoder_ignores_trailing_data():
+    """Test que les données en trop peuvent être ignorées sur demande."""
+    data = serialize_point_set([(1.0, 2.0)])
+    decoder = PointSetDecoder(decode_points=True, ignore_trailing=True)
+
+    decoder.feed(data + b'\x00' * 5)
+
+    assert decoder.payload() == data
+    assert decoder.point_set() == [(1.0, 2.0)]
+
+
+def test_point_set_decoder_checks_header_before_allocating():
+    """Test qu'un en-tête refusé n'entraîne aucune allocation du tampon.
+
+    L'en-tête annonce 0xFFFFFFFF points, soit environ 34 Go de tampon.
+    """
+    def reject(decoder):
+        raise ValueError(decoder.point_count)
+
+    decoder = PointSetDecoder(check_header=reject)
+    tracemalloc.start()
+    try:
+        with pytest.raises(ValueError):
+            decoder.feed(struct.pack('<I', 0xFFFFFFFF))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert decoder.point_count == 0xFFFFFFFF
+    assert decoder.expected_size == 4 + 8 * 0xFFFFFFFF
+    assert not decoder.done
+    assert peak < 1 << 20
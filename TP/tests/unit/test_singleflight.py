@@ -0,0 +1,90 @@
+"""Tests unitaires pour le regroupement des calculs concurrents."""
+
+import threading
+import time
+
+import pytest
+
+from src.triangulator.singleflight import SingleFlight, SingleFlightTimeout
+
+
+def _run_concurrently(count, target):
+    """Lance count threads sur target et retourne leurs résultats."""
+    results = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_are_coalesced():
+    """Test que des appels concurrents n'exécutent le calcul qu'une fois."""
+    flights = SingleFlight()
+    executions = []
+
+    def compute():
+        executions.append(1)
+        time.sleep(0.1)
+        return 42
+
+    results = _run_concurrently(5, lambda: flights.do('key', compute))
+
+    assert results == [42] * 5
+    assert len(executions) == 1
+    assert flights.stats()['coalesced'] == 4
+
+
+def test_errors_are_shared():
+    """Test que l'erreur du calcul est transmise à toutes les attentes."""
+    flights = SingleFlight()
+
+    def compute():
+        time.sleep(0.1)
+        raise ValueError('boom')
+
+    results = _run_concurrently(3, lambda: flights.do('key', compute))
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flights.stats()['executions'] == 1
+
+
+def test_sequential_calls_are_not_coalesced():
+    """Test qu'un calcul terminé n'est pas réutilisé par l'appel suivant."""
+    flights = SingleFlight()
+    assert flights.do('key', lambda: 1) == 1
+    assert flights.do('key', lambda: 2) == 2
+    assert flights.stats() == {
+        'executions': 2, 'coalesced': 0, 'timeouts': 0, 'in_flight': 0
+    }
+
+
+def test_wait_is_bounded():
+    """Test que l'attente d'un calcul en cours est bornée."""
+    flights = SingleFlight(max_wait=0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait()
+        return 'done'
+
+    leader = threading.Thread(target=flights.do, args=('key', slow))
+    leader.start()
+    started.wait()
+
+    with pytest.raises(SingleFlightTimeout):
+        flights.do('key', lambda: 'other')
+
+    release.set()
+    leader.join()
+    assert flights.stats()['timeouts'] == 1
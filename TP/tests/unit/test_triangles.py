@@ -0,0 +1,72 @@
+"""Tests unitaires pour le conteneur TriangleArray."""
+
+import sys
+from array import array
+
+import pytest
+
+from src.triangulator.serialization import serialize_triangles
+from src.triangulator.triangles import TriangleArray
+
+TRIANGLES = [(0, 1, 2), (2, 3, 0), (1, 3, 2)]
+
+
+def test_sequence_access():
+    """Test de l'accès aux triangles comme dans une liste de tuples."""
+    triangles = TriangleArray.from_triangles(TRIANGLES)
+
+    assert len(triangles) == 3
+    assert triangles[0] == (0, 1, 2)
+    assert triangles[-1] == (1, 3, 2)
+    assert list(triangles) == TRIANGLES
+    assert (2, 3, 0) in triangles
+    assert triangles.index((1, 3, 2)) == 2
+    assert list(reversed(triangles)) == TRIANGLES[::-1]
+    with pytest.raises(IndexError):
+        triangles[3]
+
+
+def test_slices():
+    """Test que les tranches renvoient un TriangleArray."""
+    triangles = TriangleArray.from_triangles(TRIANGLES)
+
+    assert isinstance(triangles[1:], TriangleArray)
+    assert triangles[1:] == TRIANGLES[1:]
+    assert triangles[::2] == TRIANGLES[::2]
+    assert triangles[5:] == []
+
+
+def test_equality():
+    """Test de la comparaison avec des listes et d'autres conteneurs."""
+    triangles = TriangleArray.from_triangles(TRIANGLES)
+
+    assert triangles == TRIANGLES
+    assert triangles == TriangleArray(array('I', [0, 1, 2, 2, 3, 0, 1, 3, 2]))
+    assert triangles != TRIANGLES[:2]
+    assert TriangleArray() == []
+
+
+def test_invalid_length():
+    """Test qu'un nombre d'indices non multiple de 3 est refusé."""
+    with pytest.raises(ValueError):
+        TriangleArray([0, 1])
+
+
+def test_serialization_matches_list():
+    """Test que la sérialisation est identique à celle d'une liste."""
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    triangles = TriangleArray.from_triangles(TRIANGLES)
+
+    assert serialize_triangles(points, triangles) == serialize_triangles(
+        points, TRIANGLES
+    )
+    assert len(triangles.tobytes()) == 12 * len(TRIANGLES)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12),
+                    reason='protocole buffer Python à partir de 3.12')
+def test_buffer_protocol():
+    """Test de la vue sans copie sur les indices."""
+    triangles = TriangleArray.from_triangles(TRIANGLES)
+
+    assert memoryview(triangles).tobytes() == triangles.tobytes()